@@ -0,0 +1,5 @@
+"""Run the benchmark suite: `python -m benchmarks`."""
+
+from benchmarks.runner import main
+
+main()
@@ -0,0 +1,133 @@
+"""Benchmark cases for the board, renderer and full-game hot paths."""
+
+import io
+
+from contextlib import redirect_stdout
+from typing import Callable, Iterator, List, Mapping, Tuple
+from unittest import mock
+
+from constants.constants import Cell, CellValue, PlayerMarker
+
+from src.game_loop import loop_game
+
+from src.models.board import Board, clear_render_cache
+
+from src.utils.colorize import cyan, green, grey, magenta, red, yellow
+
+# A case takes an operation count and returns a callable performing that many
+# operations, so setup cost is paid outside the timed region.
+type Case = Callable[[int], Callable[[], None]]
+
+MID_GAME_STATE: List[List[CellValue]] = [
+    ["X", "O", None],
+    [None, "X", None],
+    [None, None, "O"],
+]
+
+FULL_GAME_INPUTS: Tuple[str, ...] = ("7", "4", "0", "8", "5", "9")
+
+MOVE_MARKERS: Tuple[PlayerMarker, ...] = ("X", "O", "X", "O", "X", "O", "X", "O", "X")
+MOVE_ORDER: Tuple[Tuple[Cell, PlayerMarker], ...] = tuple(
+    (divmod(index, 3), marker)
+    for index, marker in zip((4, 0, 8, 2, 6, 3, 5, 7, 1), MOVE_MARKERS, strict=True)
+)
+
+
+def _mid_game_board() -> Board:
+    return Board(starting_state=[row[:] for row in MID_GAME_STATE])
+
+
+def make_move_case(operations: int) -> Callable[[], None]:
+    boards: List[Board] = [Board() for _ in range(operations // len(MOVE_ORDER) + 1)]
+    moves: List[Tuple[Board, Cell, PlayerMarker]] = [
+        (board, cell, marker) for board in boards for cell, marker in MOVE_ORDER
+    ][:operations]
+
+    def run() -> None:
+        for board, cell, marker in moves:
+            board.make_move(cell, marker)
+
+    return run
+
+
+def _board_method_case(method: Callable[[Board], object]) -> Case:
+    def case(operations: int) -> Callable[[], None]:
+        board: Board = _mid_game_board()
+
+        def run() -> None:
+            for _ in range(operations):
+                method(board)
+
+        return run
+
+    return case
+
+
+def stringify_board_cold_case(operations: int) -> Callable[[], None]:
+    board: Board = _mid_game_board()
+
+    def run() -> None:
+        for _ in range(operations):
+            clear_render_cache()
+            board.stringify_board()
+
+    return run
+
+
+def _colorize_case(colorize: Callable[[str], str]) -> Case:
+    def case(operations: int) -> Callable[[], None]:
+        def run() -> None:
+            for _ in range(operations):
+                colorize(" X ")
+
+        return run
+
+    return case
+
+
+class _NullOutput(io.TextIOBase):
+    """A text stream that discards everything written to it."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+# One stream for every run, so the renderer bound to it is kept between runs
+# and no run frees the frames of the one before.
+_NULL_OUTPUT: _NullOutput = _NullOutput()
+
+
+def full_game_case(operations: int) -> Callable[[], None]:
+    def inputs() -> Iterator[str]:
+        while True:
+            yield from FULL_GAME_INPUTS
+
+    moves: Iterator[str] = inputs()
+
+    # Frames and prompts are kept off the terminal, so its I/O is not timed.
+    def run() -> None:
+        with (
+            mock.patch("builtins.input", lambda *_: next(moves)),
+            redirect_stdout(_NULL_OUTPUT),
+        ):
+            for _ in range(operations):
+                loop_game(Board())
+
+    return run
+
+
+CASES: Mapping[str, Case] = {
+    "board.make_move": make_move_case,
+    "board.check_win": _board_method_case(Board.check_win),
+    "board.check_draw": _board_method_case(Board.check_draw),
+    "board.get_board": _board_method_case(Board.get_board),
+    "board.stringify_board": _board_method_case(Board.stringify_board),
+    "board.stringify_board.cold": stringify_board_cold_case,
+    "colorize.grey": _colorize_case(grey),
+    "colorize.red": _colorize_case(red),
+    "colorize.green": _colorize_case(green),
+    "colorize.cyan": _colorize_case(cyan),
+    "colorize.yellow": _colorize_case(yellow),
+    "colorize.magenta": _colorize_case(magenta),
+    "game_loop.full_game": full_game_case,
+}
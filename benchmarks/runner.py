@@ -0,0 +1,220 @@
+"""Benchmark runner: timing, allocation tracking and baseline comparison."""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple, TypedDict
+
+from benchmarks.cases import CASES, Case
+
+DEFAULT_OUTPUT: Path = Path(__file__).parent / "results.json"
+DEFAULT_BASELINE: Path = Path(__file__).parent / "baseline.json"
+DEFAULT_THRESHOLD: float = 0.10
+DEFAULT_MIN_TIME: float = 0.2
+DEFAULT_REPEATS: int = 5
+ALLOCATION_OPERATIONS: int = 1_000
+
+
+class BenchmarkResult(TypedDict):
+    """Measurements for one benchmark case."""
+
+    operations: int
+    ops_per_sec: float
+    peak_bytes_per_op: float
+    blocks_per_op: float
+
+
+def _calibrate(case: Case, min_time: float) -> int:
+    operations: int = 1
+
+    while True:
+        run: Callable[[], None] = case(operations)
+        start: float = time.perf_counter()
+        run()
+        if time.perf_counter() - start >= min_time:
+            return operations
+        operations *= 2
+
+
+def _measure_allocations(case: Case, operations: int) -> Tuple[float, float]:
+    run: Callable[[], None] = case(operations)
+
+    tracemalloc.start()
+    try:
+        start_blocks: int = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        end_blocks: int = sys.getallocatedblocks()
+    finally:
+        tracemalloc.stop()
+
+    return (
+        (peak_bytes - start_bytes) / operations,
+        (end_blocks - start_blocks) / operations,
+    )
+
+
+def run_case(case: Case, min_time: float, repeats: int) -> BenchmarkResult:
+    """Time `case` and measure its allocations.
+
+    Args:
+        case (Case): The benchmark case.
+        min_time (float): The least time in seconds a single timed run may take.
+        repeats (int): The number of timed runs; the fastest is reported.
+
+    Returns:
+        BenchmarkResult: Operations per second and allocations per operation.
+    """
+
+    operations: int = _calibrate(case, min_time)
+    best: float = float("inf")
+
+    for _ in range(repeats):
+        run: Callable[[], None] = case(operations)
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    peak_bytes_per_op, blocks_per_op = _measure_allocations(
+        case, min(operations, ALLOCATION_OPERATIONS)
+    )
+
+    return {
+        "operations": operations,
+        "ops_per_sec": operations / best,
+        "peak_bytes_per_op": peak_bytes_per_op,
+        "blocks_per_op": blocks_per_op,
+    }
+
+
+def compare(
+    results: Mapping[str, BenchmarkResult],
+    baseline: Mapping[str, BenchmarkResult],
+    threshold: float,
+    thresholds: Mapping[str, float],
+) -> List[str]:
+    """Find benchmarks that got slower than the baseline allows.
+
+    Args:
+        results (Mapping[str, BenchmarkResult]): The current results.
+        baseline (Mapping[str, BenchmarkResult]): The stored baseline results.
+        threshold (float): The allowed fractional drop in ops/sec.
+        thresholds (Mapping[str, float]): Per-benchmark overrides of `threshold`.
+
+    Returns:
+        List[str]: The names of benchmarks that regressed.
+    """
+
+    regressions: List[str] = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        change: float = result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+        if change < -thresholds.get(name, threshold):
+            regressions.append(name)
+
+    return regressions
+
+
+def _parse_threshold(value: str) -> Tuple[str, float]:
+    name, _, fraction = value.partition("=")
+    if not fraction:
+        raise argparse.ArgumentTypeError(f"Expected NAME=FRACTION: {value!r}.")
+
+    return (name, float(fraction))
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the game hot paths."
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="only run benchmarks containing this text"
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store these results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed fractional ops/sec drop vs. baseline (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--threshold-for",
+        type=_parse_threshold,
+        action="append",
+        default=[],
+        metavar="NAME=FRACTION",
+        help="per-benchmark threshold override; may be repeated",
+    )
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmarks, save the results and compare against the baseline."""
+
+    args: argparse.Namespace = _parse_args(argv)
+
+    baseline: Dict[str, BenchmarkResult] = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["results"]
+
+    results: Dict[str, BenchmarkResult] = {}
+    print(
+        f"{'benchmark':<28} {'ops/sec':>14} {'B/op':>9} {'blocks/op':>9} {'vs base':>8}"
+    )
+
+    for name, case in CASES.items():
+        if args.filter not in name:
+            continue
+
+        result: BenchmarkResult = run_case(case, args.min_time, args.repeats)
+        results[name] = result
+
+        change: str = ""
+        if name in baseline:
+            ratio: float = result["ops_per_sec"] / baseline[name]["ops_per_sec"]
+            change = f"{ratio - 1:+.1%}"
+
+        print(
+            f"{name:<28} {result['ops_per_sec']:>14,.0f} "
+            f"{result['peak_bytes_per_op']:>9.1f} {result['blocks_per_op']:>9.2f} "
+            f"{change:>8}"
+        )
+
+    report: str = json.dumps(
+        {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "results": results,
+        },
+        indent=2,
+    )
+    args.output.write_text(report)
+    if args.save_baseline:
+        args.baseline.write_text(report)
+
+    regressions: List[str] = compare(
+        results, baseline, args.threshold, dict(args.threshold_for)
+    )
+    if regressions:
+        print(f"\nRegressed beyond threshold: {', '.join(regressions)}")
+        sys.exit(1)
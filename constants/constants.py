@@ -6,11 +6,13 @@ from typing import Literal, Mapping, Set, Tuple, Union
 type PlayerMarker = Literal["X", "O"]
 type CellValue = Union[PlayerMarker, None]
 type CellKey = Literal["1", "2", "3", "4", "5", "6", "7", "8", "9"]
-type RowsCols = Literal[0, 1, 2]
+type RowsCols = int  # 0 to 2 on a standard board; up to `width`/`height` - 1
 type Cell = Tuple[RowsCols, RowsCols]
+type PositionKey = Tuple[int, int]
 
 # Game Setup
-BOARD_SIZE: int = 3  # NB: Do not change! Board size should *only* ever be 3.
+BOARD_SIZE: int = 3  # NB: Do not change! Other sizes are set per `Board`.
+WIN_LENGTH: int = 3  # NB: Do not change! Other lengths are set per `Board`.
 
 # ANSI Escape Sequences
 ANSI_GREY: str = "\033[90m"
@@ -22,10 +24,15 @@ ANSI_CYAN: str = "\033[36m"
 ANSI_RESET: str = "\033[0m"
 
 # Board Grid Components
-GRID_TOP: str = "   ╻   ╻   \n"
+GRID_TOP_JOINER: str = "╻"
 GRID_COL_JOINER: str = "┃"
-GRID_ROW_JOINER: str = "\n━━━╋━━━╋━━━\n"
-GRID_BOTTOM: str = "\n   ╹   ╹   "
+GRID_CROSS_JOINER: str = "╋"
+GRID_BOTTOM_JOINER: str = "╹"
+GRID_ROW_LINE: str = "━"
+MIN_CELL_WIDTH: int = 3
+
+# Moves
+VALID_MOVES: Set[PlayerMarker] = {"X", "O"}
 
 # Cell Keys
 VALID_CELL_KEYS: Set[CellKey] = {"1", "2", "3", "4", "5", "6", "7", "8", "9"}
@@ -40,3 +47,40 @@ CELL_KEY_TO_CELL_MAP: Mapping[CellKey, Cell] = {
     "2": (2, 1),
     "3": (2, 2),
 }
+CELL_TO_CELL_KEY_MAP: Mapping[Cell, CellKey] = {
+    cell: cell_key for cell_key, cell in CELL_KEY_TO_CELL_MAP.items()
+}
+
+# Bitboard Masks
+# Bit `row * BOARD_SIZE + col` of a player's bitboard is set when that player
+# has played at (`row`, `col`).
+FULL_BOARD_MASK: int = 0b111_111_111
+WIN_MASKS: Tuple[int, ...] = (
+    0b000_000_111,  # Top row
+    0b000_111_000,  # Middle row
+    0b111_000_000,  # Bottom row
+    0b001_001_001,  # Left column
+    0b010_010_010,  # Middle column
+    0b100_100_100,  # Right column
+    0b100_010_001,  # Diagonal, top left to bottom right
+    0b001_010_100,  # Diagonal, top right to bottom left
+)
+# `CELL_WIN_MASKS[index]` holds the winning lines that pass through cell `index`.
+CELL_WIN_MASKS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(mask for mask in WIN_MASKS if mask >> index & 1)
+    for index in range(BOARD_SIZE * BOARD_SIZE)
+)
+
+# Board Symmetries
+# `SYMMETRY_PERMUTATIONS[transform][index]` is the cell index that cell `index`
+# moves to under `transform`, where cell index is `row * BOARD_SIZE + col`.
+SYMMETRY_PERMUTATIONS: Tuple[Tuple[int, ...], ...] = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 90° clockwise
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180°
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 270° clockwise
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Mirror left to right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Mirror top to bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Transpose across main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Transpose across anti-diagonal
+)
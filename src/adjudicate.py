@@ -0,0 +1,113 @@
+"""Non-interactive adjudication of scripted games.
+
+Each game is a line of whitespace-separated cell keys, "X" moving first, e.g.
+`7 5 3 1 9`. Each game gets one result line: "X wins", "O wins", "draw",
+"unfinished", or "illegal move at ply N" for the first move that `prompt` would
+have rejected, including any move after the game was decided.
+
+Games are played on bitboards with the board's own win test; nothing is rendered
+or colorized, and input and output are handled as buffered bytes.
+"""
+
+from typing import BinaryIO, Dict, Iterable, List
+
+from constants.constants import BOARD_SIZE, WIN_LENGTH
+
+from src.models.board import Board
+
+from src.models.cell_keys import cell_to_cell_key
+
+X_WINS: bytes = b"X wins"
+O_WINS: bytes = b"O wins"
+DRAW: bytes = b"draw"
+UNFINISHED: bytes = b"unfinished"
+
+OUTPUT_BUFFER_LINES: int = 1 << 14
+
+
+class Adjudicator:
+    """Plays scripted games under the rules of one board size and win length."""
+
+    _rules: Board
+    _cell_indices: Dict[bytes, int]
+    _full_mask: int
+
+    def __init__(
+        self,
+        width: int = BOARD_SIZE,
+        height: int = BOARD_SIZE,
+        win_length: int = WIN_LENGTH,
+    ) -> None:
+        """Create an adjudicator.
+
+        Raises:
+            ValueError: If the board size or win length is invalid.
+        """
+
+        self._rules: Board = Board(width=width, height=height, win_length=win_length)
+        self._cell_indices: Dict[bytes, int] = {
+            cell_to_cell_key((row, col), width, height).encode(): row * width + col
+            for row in range(height)
+            for col in range(width)
+        }
+        self._full_mask: int = (1 << width * height) - 1
+
+    def adjudicate(self, moves: Iterable[bytes]) -> bytes:
+        """Play `moves`, cell keys as bytes, from a blank board.
+
+        Returns:
+            bytes: The result line, without a line ending.
+        """
+
+        cell_indices: Dict[bytes, int] = self._cell_indices
+        is_win_through = self._rules.is_win_through
+        player_bits: int = 0
+        opponent_bits: int = 0
+        winner: bytes = b""
+
+        for ply, cell_key in enumerate(moves, 1):
+            index: int = cell_indices.get(cell_key, -1)
+
+            if winner or index < 0 or (player_bits | opponent_bits) >> index & 1:
+                return b"illegal move at ply %d" % ply
+
+            player_bits |= 1 << index
+            if is_win_through(player_bits, index):
+                winner = X_WINS if ply % 2 else O_WINS
+
+            player_bits, opponent_bits = opponent_bits, player_bits
+
+        if winner:
+            return winner
+        if player_bits | opponent_bits == self._full_mask:
+            return DRAW
+        return UNFINISHED
+
+    def run(self, games: Iterable[bytes], output: BinaryIO) -> int:
+        """Adjudicate each line of `games` and write its result line to `output`.
+
+        Args:
+            games (Iterable[bytes]): One game per line.
+            output (BinaryIO): Receives one result line per game, in order.
+
+        Returns:
+            int: The number of games adjudicated.
+        """
+
+        results: List[bytes] = []
+        count: int = 0
+
+        for line in games:
+            results.append(self.adjudicate(line.split()))
+
+            if len(results) == OUTPUT_BUFFER_LINES:
+                output.write(b"\n".join(results) + b"\n")
+                count += len(results)
+                results.clear()
+
+        if results:
+            output.write(b"\n".join(results) + b"\n")
+            count += len(results)
+
+        output.flush()
+        return count
@@ -0,0 +1,190 @@
+"""Computer agents behind a shared protocol.
+
+An agent only picks a move; it never plays it, prints or reads input. The same
+agents are played interactively through `loop_game`, wrapped as players by
+`src.players.agent_player`, and headlessly by `play_game` in tournaments.
+"""
+
+import random
+
+from typing import Callable, List, Mapping, Protocol, Sequence, Union
+
+from constants.constants import PlayerMarker, Cell
+
+from src.ai import mcts, search, solver, strong_solver
+
+from src.models.board import Board, GameStatus, MoveResult
+
+DEFAULT_MOVE_TIME: float = 0.1
+
+
+class Agent(Protocol):
+    """Chooses moves for the player to move."""
+
+    def choose_move(self, board: Board) -> Cell:
+        """Choose a legal cell for the player to move on `board`.
+
+        `board` must be left as it was found.
+        """
+
+
+class RandomAgent:
+    """Plays a uniformly random legal move."""
+
+    _random: random.Random
+
+    def __init__(self, seed: Union[int, None] = None) -> None:
+        self._random: random.Random = random.Random(seed)
+
+    def choose_move(self, board: Board) -> Cell:
+        width, _ = board.get_size()
+        legal_moves: int = board.legal_moves()
+        indices: List[int] = [
+            index
+            for index in range(legal_moves.bit_length())
+            if legal_moves >> index & 1
+        ]
+
+        row, col = divmod(self._random.choice(indices), width)
+        return (row, col)
+
+
+class ScriptedAgent:
+    """Plays the first legal cell of a fixed preference order.
+
+    The default order works outward from the center of the board one ring at a
+    time, corners of each ring first, so on the standard board it plays the
+    center, then corners, then edges.
+    """
+
+    _order: Union[Sequence[Cell], None]
+
+    def __init__(self, order: Union[Sequence[Cell], None] = None) -> None:
+        """Create a scripted agent.
+
+        Args:
+            order (Union[Sequence[Cell], None]): Cells in order of preference.
+                Must hold every cell of the boards it plays on. Defaults to
+                center outward.
+        """
+
+        self._order: Union[Sequence[Cell], None] = order
+
+    def choose_move(self, board: Board) -> Cell:
+        width, height = board.get_size()
+        legal_moves: int = board.legal_moves()
+        order: Sequence[Cell] = (
+            self._order if self._order is not None else _center_first(width, height)
+        )
+
+        for row, col in order:
+            if legal_moves >> (row * width + col) & 1:
+                return (row, col)
+
+        raise ValueError("No moves left to play.")
+
+
+def _center_first(width: int, height: int) -> List[Cell]:
+    return sorted(
+        ((row, col) for row in range(height) for col in range(width)),
+        key=lambda cell: (
+            max(abs(2 * cell[0] - height + 1), abs(2 * cell[1] - width + 1)),
+            -abs(2 * cell[0] - height + 1) - abs(2 * cell[1] - width + 1),
+        ),
+    )
+
+
+class SolverAgent:
+    """Plays a perfect move from the solved position table (standard board only)."""
+
+    def choose_move(self, board: Board) -> Cell:
+        return solver.choose_move(board)
+
+
+class StrongSolverAgent:
+    """Plays a perfect move from a packed table, on boards of up to 16 cells.
+
+    Without a table of its own, it uses the one set with
+    `strong_solver.set_default_table` at each move.
+    """
+
+    _table: Union[strong_solver.SolvedTable, None]
+
+    def __init__(self, table: Union[strong_solver.SolvedTable, None] = None) -> None:
+        self._table: Union[strong_solver.SolvedTable, None] = table
+
+    def choose_move(self, board: Board) -> Cell:
+        if self._table is None:
+            return strong_solver.choose_move(board)
+        return self._table.choose_move(board)
+
+
+class SearchAgent:
+    """Plays the best move found by a time-limited alpha-beta search."""
+
+    _search: search.AlphaBetaSearch
+
+    def __init__(self, time_limit: float = search.DEFAULT_TIME_LIMIT) -> None:
+        self._search: search.AlphaBetaSearch = search.AlphaBetaSearch(
+            time_limit=time_limit
+        )
+
+    def choose_move(self, board: Board) -> Cell:
+        return self._search.choose_move(board)
+
+
+class MCTSAgent:
+    """Plays the most visited move of a Monte Carlo tree search.
+
+    Without a search of its own, it uses `mcts.get_default_search()` at each
+    move.
+    """
+
+    _search: Union[mcts.MonteCarloTreeSearch, None]
+
+    def __init__(self, search: Union[mcts.MonteCarloTreeSearch, None] = None) -> None:
+        self._search: Union[mcts.MonteCarloTreeSearch, None] = search
+
+    def choose_move(self, board: Board) -> Cell:
+        if self._search is None:
+            return mcts.choose_move(board)
+        return self._search.choose_move(board)
+
+
+# Agents for tournaments, created from a per-move time limit and a random seed.
+AGENT_TYPES: Mapping[str, Callable[[float, int], Agent]] = {
+    "random": lambda _, seed: RandomAgent(seed),
+    "scripted": lambda *_: ScriptedAgent(),
+    "solver": lambda *_: SolverAgent(),
+    "search": lambda move_time, _: SearchAgent(move_time),
+    "mcts": lambda move_time, seed: MCTSAgent(
+        mcts.MonteCarloTreeSearch(time_limit=move_time, seed=seed)
+    ),
+}
+
+
+def play_game(board: Board, x_agent: Agent, o_agent: Agent) -> GameStatus:
+    """Play `x_agent` against `o_agent` on `board` without any output.
+
+    Args:
+        board (Board): The game board, played on from its current position.
+        x_agent (Agent): Plays "X".
+        o_agent (Agent): Plays "O".
+
+    Raises:
+        ValueError: When an agent chooses an illegal move.
+
+    Returns:
+        GameStatus: The result.
+    """
+
+    agents: Mapping[PlayerMarker, Agent] = {"X": x_agent, "O": o_agent}
+
+    while board.get_status() is GameStatus.ONGOING:
+        player_marker: PlayerMarker = board.get_player_to_move()
+        cell: Cell = agents[player_marker].choose_move(board)
+
+        if board.try_move(cell, player_marker) is not MoveResult.OK:
+            raise ValueError(f"{player_marker} chose an illegal move: {cell!r}.")
+
+    return board.get_status()
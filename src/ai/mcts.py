@@ -0,0 +1,494 @@
+"""Monte Carlo tree search for boards too big to solve or search exhaustively.
+
+Each iteration walks down the tree by UCT (upper confidence bounds applied to
+trees), expands one untried move, plays the rest of the game out at random and
+backs the result up the path. Moves are made and taken back on one working
+board with `Board.push` and `Board.pop`.
+
+The tree is kept between moves: when the next search starts from a position
+further down the same game, the matching subtree becomes the new root with its
+statistics intact.
+
+With more than one worker, the search is root-parallel: the extra workers each
+grow an independent tree from the same root in their own process, and their root
+move statistics are summed with the local tree's when the move is chosen.
+"""
+
+import math
+import random
+import time
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+from constants.constants import PlayerMarker, Cell
+
+from src.models.board import Board, GameStatus
+
+DEFAULT_TIME_LIMIT: float = 1.0
+DEFAULT_EXPLORATION: float = math.sqrt(2)
+
+# Rewards to the player who made a move, by the game's result.
+WIN_REWARD: float = 1.0
+DRAW_REWARD: float = 0.5
+
+type MoveStats = Dict[int, Tuple[int, float]]
+
+
+class MCTSResult(NamedTuple):
+    """The outcome of one search.
+
+    `visits` and `value` are for the chosen move, merged across workers; `value`
+    is its average reward for the player to move, 1 for a win and 0.5 for a
+    draw. `tree_size` counts the nodes of every worker's tree.
+    """
+
+    cell: Cell
+    visits: int
+    value: float
+    iterations: int
+    tree_size: int
+    seconds: float
+    workers: int
+
+    @property
+    def iterations_per_second(self) -> float:
+        """Search speed across all workers."""
+
+        return self.iterations / self.seconds if self.seconds > 0 else 0.0
+
+    def describe(self) -> str:
+        """Summarize the search on one line."""
+
+        return (
+            f"{self.iterations} iterations in {self.seconds:.2f}s "
+            f"({self.iterations_per_second:,.0f}/s on {self.workers} workers), "
+            f"{self.tree_size} nodes, move visited {self.visits} times, "
+            f"value {self.value:.3f}"
+        )
+
+
+class _Node:
+    """A position in the tree, reached by playing `move` from its parent.
+
+    `wins` is the total reward to the player who played `move`.
+    """
+
+    __slots__ = ("move", "parent", "children", "untried", "visits", "wins")
+
+    move: int
+    parent: Union["_Node", None]
+    children: List["_Node"]
+    untried: List[int]
+    visits: int
+    wins: float
+
+    def __init__(self, move: int, parent: Union["_Node", None], board: Board) -> None:
+        legal_moves: int = board.legal_moves()
+
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = [
+            index
+            for index in range(legal_moves.bit_length())
+            if legal_moves >> index & 1
+        ]
+        self.visits = 0
+        self.wins = 0.0
+
+
+def _copy_board(
+    width: int, height: int, win_length: int, x_bits: int, o_bits: int
+) -> Board:
+    board: Board = Board(width=width, height=height, win_length=win_length)
+
+    markers: Tuple[Tuple[int, PlayerMarker], ...] = ((x_bits, "X"), (o_bits, "O"))
+
+    for player_bits, marker in markers:
+        for index in range(player_bits.bit_length()):
+            if player_bits >> index & 1:
+                board.try_move(divmod(index, width), marker)
+
+    return board
+
+
+def _search_worker(
+    rules: Tuple[int, int, int],
+    bitboards: Tuple[int, int],
+    time_limit: Union[float, None],
+    iterations: Union[int, None],
+    exploration: float,
+    seed: int,
+) -> Tuple[MoveStats, int, int]:
+    board: Board = _copy_board(*rules, *bitboards)
+    search: MonteCarloTreeSearch = MonteCarloTreeSearch(
+        time_limit, iterations, exploration=exploration, seed=seed
+    )
+    search._advance_root(board)
+    completed: int = search._grow(board, time.perf_counter())
+
+    return (search._root_stats(), completed, search._tree_size())
+
+
+class MonteCarloTreeSearch:
+    """UCT search with a time or iteration budget, tree reuse and root parallelism.
+
+    Extra workers run in a process pool that is started on the first search and
+    kept until `close`.
+    """
+
+    _time_limit: Union[float, None]
+    _iterations: Union[int, None]
+    _workers: int
+    _exploration: float
+    _reuse_tree: bool
+    _random: random.Random
+    _executor: Union[ProcessPoolExecutor, None]
+    _root: Union[_Node, None]
+    _root_bits: Tuple[int, int]
+    _rules: Tuple[int, int, int]
+    _last_result: Union[MCTSResult, None]
+
+    def __init__(
+        self,
+        time_limit: Union[float, None] = DEFAULT_TIME_LIMIT,
+        iterations: Union[int, None] = None,
+        workers: int = 1,
+        exploration: float = DEFAULT_EXPLORATION,
+        reuse_tree: bool = True,
+        seed: Union[int, None] = None,
+    ) -> None:
+        """Create a search.
+
+        Args:
+            time_limit (Union[float, None]): Seconds allowed per move, or `None`
+                for no time limit.
+            iterations (Union[int, None]): Iterations allowed per move, split
+                across the workers, or `None` for no iteration limit.
+            workers (int): Trees grown in parallel, each but the first in its own
+                process.
+            exploration (float): The UCT exploration constant.
+            reuse_tree (bool): Whether to keep the tree between moves.
+            seed (Union[int, None]): Random seed, for repeatable searches.
+
+        Raises:
+            ValueError: If a limit or the worker count is not positive, or there
+                is neither a time nor an iteration limit.
+        """
+
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError(f"Invalid time limit: {time_limit!r}.")
+        if iterations is not None and iterations <= 0:
+            raise ValueError(f"Invalid iteration limit: {iterations!r}.")
+        if time_limit is None and iterations is None:
+            raise ValueError("A time limit or an iteration limit is required.")
+        if workers <= 0:
+            raise ValueError(f"Invalid worker count: {workers!r}.")
+
+        self._time_limit: Union[float, None] = time_limit
+        self._iterations: Union[int, None] = iterations
+        self._workers: int = workers
+        self._exploration: float = exploration
+        self._reuse_tree: bool = reuse_tree
+        self._random: random.Random = random.Random(seed)
+        self._executor: Union[ProcessPoolExecutor, None] = None
+        self._root: Union[_Node, None] = None
+        self._root_bits: Tuple[int, int] = (0, 0)
+        self._rules: Tuple[int, int, int] = (0, 0, 0)
+        self._last_result: Union[MCTSResult, None] = None
+
+    def __enter__(self) -> "MonteCarloTreeSearch":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_last_result(self) -> Union[MCTSResult, None]:
+        """Get the result of the most recent search, or `None` before any search."""
+
+        return self._last_result
+
+    def search(self, board: Board) -> MCTSResult:
+        """Find the most promising move for the player to move on `board`.
+
+        "X" is taken to move when both players have made the same number of
+        moves. `board` is not modified.
+
+        Args:
+            board (Board): The game board.
+
+        Raises:
+            ValueError: When the game is already over.
+
+        Returns:
+            MCTSResult: The most visited move and the search statistics.
+        """
+
+        if board.get_status() is not GameStatus.ONGOING:
+            raise ValueError("No moves left to play.")
+
+        start: float = time.perf_counter()
+        width, height = board.get_size()
+        rules: Tuple[int, int, int] = (width, height, board.get_win_length())
+        bitboards: Tuple[int, int] = board.get_bitboards()
+        working_board: Board = _copy_board(*rules, *bitboards)
+        iterations: Union[int, None] = (
+            max(1, self._iterations // self._workers)
+            if self._iterations is not None
+            else None
+        )
+
+        futures: List[Future[Tuple[MoveStats, int, int]]] = []
+        if self._workers > 1:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self._workers - 1)
+
+            futures = [
+                self._executor.submit(
+                    _search_worker,
+                    rules,
+                    bitboards,
+                    self._time_limit,
+                    iterations,
+                    self._exploration,
+                    self._random.getrandbits(64),
+                )
+                for _ in range(self._workers - 1)
+            ]
+
+        self._advance_root(working_board)
+        completed: int = self._grow(working_board, start, iterations)
+        stats: MoveStats = self._root_stats()
+        tree_size: int = self._tree_size()
+
+        for future in futures:
+            worker_stats, worker_completed, worker_tree_size = future.result()
+            completed += worker_completed
+            tree_size += worker_tree_size
+
+            for move, (visits, wins) in worker_stats.items():
+                total_visits, total_wins = stats.get(move, (0, 0.0))
+                stats[move] = (total_visits + visits, total_wins + wins)
+
+        best_move: int = max(stats, key=lambda move: stats[move][0])
+        visits, wins = stats[best_move]
+        row, col = divmod(best_move, width)
+
+        result: MCTSResult = MCTSResult(
+            (row, col),
+            visits,
+            wins / visits if visits else 0.0,
+            completed,
+            tree_size,
+            time.perf_counter() - start,
+            self._workers,
+        )
+        self._last_result = result
+
+        if not self._reuse_tree:
+            self._root = None
+
+        return result
+
+    def choose_move(self, board: Board) -> Cell:
+        """Search `board` and return only the chosen cell."""
+
+        return self.search(board).cell
+
+    def _advance_root(self, board: Board) -> None:
+        width, height = board.get_size()
+        rules: Tuple[int, int, int] = (width, height, board.get_win_length())
+        x_bits, o_bits = board.get_bitboards()
+        node: Union[_Node, None] = self._root if rules == self._rules else None
+        root_x_bits, root_o_bits = self._root_bits
+
+        # Follow the moves played since the last search down the tree.
+        while node is not None and (root_x_bits, root_o_bits) != (x_bits, o_bits):
+            if root_x_bits & ~x_bits or root_o_bits & ~o_bits:
+                node = None
+                break
+
+            x_to_move: bool = root_x_bits.bit_count() <= root_o_bits.bit_count()
+            played: int = x_bits & ~root_x_bits if x_to_move else o_bits & ~root_o_bits
+            node = next(
+                (child for child in node.children if played >> child.move & 1), None
+            )
+
+            if node is not None and x_to_move:
+                root_x_bits |= 1 << node.move
+            elif node is not None:
+                root_o_bits |= 1 << node.move
+
+        if node is None:
+            node = _Node(-1, None, board)
+
+        node.parent = None
+        self._root = node
+        self._root_bits = (x_bits, o_bits)
+        self._rules = rules
+
+    def _grow(
+        self, board: Board, start: float, iterations: Union[int, None] = None
+    ) -> int:
+        if iterations is None:
+            iterations = self._iterations
+        deadline: float = (
+            start + self._time_limit if self._time_limit is not None else math.inf
+        )
+        completed: int = 0
+
+        # The first iteration always runs, so the root has a move to choose.
+        while completed == 0 or (
+            (iterations is None or completed < iterations)
+            and time.perf_counter() < deadline
+        ):
+            self._iterate(board)
+            completed += 1
+
+        return completed
+
+    def _iterate(self, board: Board) -> None:
+        assert self._root is not None
+        node: _Node = self._root
+        width: int = board.get_size()[0]
+        exploration: float = self._exploration
+        depth: int = 0
+
+        while not node.untried and node.children:
+            log_visits: float = math.log(node.visits)
+            node = max(
+                node.children,
+                key=lambda child: (
+                    child.wins / child.visits
+                    + exploration * math.sqrt(log_visits / child.visits)
+                ),
+            )
+            board.push(divmod(node.move, width))
+            depth += 1
+
+        if node.untried:
+            untried: List[int] = node.untried
+            choice: int = self._random.randrange(len(untried))
+            untried[choice], untried[-1] = untried[-1], untried[choice]
+            move: int = untried.pop()
+
+            board.push(divmod(move, width))
+            depth += 1
+            child: _Node = _Node(move, node, board)
+            node.children.append(child)
+            node = child
+
+        status: GameStatus = self._rollout(board)
+
+        # Rewards alternate up the path, starting with the player who moved
+        # into the leaf.
+        mover_won: GameStatus = (
+            GameStatus.O_WON if board.get_player_to_move() == "X" else GameStatus.X_WON
+        )
+        current: Union[_Node, None] = node
+
+        while current is not None:
+            current.visits += 1
+            if status is mover_won:
+                current.wins += WIN_REWARD
+            elif status is GameStatus.DRAW:
+                current.wins += DRAW_REWARD
+            mover_won = (
+                GameStatus.X_WON if mover_won is GameStatus.O_WON else GameStatus.O_WON
+            )
+            current = current.parent
+
+        for _ in range(depth):
+            board.pop()
+
+    def _rollout(self, board: Board) -> GameStatus:
+        status: GameStatus = board.get_status()
+        if status is not GameStatus.ONGOING:
+            return status
+
+        width: int = board.get_size()[0]
+        legal_moves: int = board.legal_moves()
+        moves: List[int] = [
+            index
+            for index in range(legal_moves.bit_length())
+            if legal_moves >> index & 1
+        ]
+        self._random.shuffle(moves)
+        played: int = 0
+
+        for move in moves:
+            board.push(divmod(move, width))
+            played += 1
+            status = board.get_status()
+            if status is not GameStatus.ONGOING:
+                break
+
+        for _ in range(played):
+            board.pop()
+
+        return status
+
+    def _root_stats(self) -> MoveStats:
+        assert self._root is not None
+
+        return {child.move: (child.visits, child.wins) for child in self._root.children}
+
+    def _tree_size(self) -> int:
+        size: int = 0
+        stack: List[_Node] = [self._root] if self._root is not None else []
+
+        while stack:
+            node: _Node = stack.pop()
+            size += 1
+            stack.extend(node.children)
+
+        return size
+
+
+_default_search: Union[MonteCarloTreeSearch, None] = None
+
+
+def get_default_search() -> MonteCarloTreeSearch:
+    """Get the search used by `choose_move`, creating a single-worker one if unset."""
+
+    global _default_search
+
+    if _default_search is None:
+        _default_search = MonteCarloTreeSearch()
+
+    return _default_search
+
+
+def set_default_search(search: Union[MonteCarloTreeSearch, None]) -> None:
+    """Replace the search used by `choose_move`, closing the previous one."""
+
+    global _default_search
+
+    if _default_search is not None and _default_search is not search:
+        _default_search.close()
+
+    _default_search = search
+
+
+def choose_move(board: Board) -> Cell:
+    """Choose a move for the player to move on `board` with the default search.
+
+    The default search is kept between calls, so its tree carries over from one
+    move of a game to the next.
+
+    Raises:
+        ValueError: When the game is already over.
+
+    Returns:
+        Cell: The most visited cell.
+    """
+
+    return get_default_search().choose_move(board)
@@ -0,0 +1,450 @@
+"""Budgeted alpha-beta search for boards too big to solve ahead of time.
+
+The search is negamax with alpha-beta pruning over raw bitboards, deepened one ply
+at a time. Each iteration tries the previous iteration's best move first and
+orders the rest by a history heuristic. Results are kept in a transposition
+table keyed on incrementally updated Zobrist hashes, so positions reached by
+different move orders, and the previous iteration's best replies, are reused.
+Positions left undecided at the search horizon are scored by counting each
+player's runs of two or more marks. When the time or node budget runs out
+mid-iteration, the best move of the last completed iteration is played.
+"""
+
+import time
+
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+from constants.constants import Cell, BOARD_SIZE
+
+from src.ai.transposition import Bound, TableEntry, TranspositionTable
+
+from src.models.board import Board, GameStatus
+
+from src.models.zobrist import get_zobrist_keys
+
+WIN_SCORE: int = 1_000_000
+EVALUATION_LIMIT: int = WIN_SCORE // 4
+DEFAULT_TIME_LIMIT: float = 1.0
+BUDGET_CHECK_INTERVAL: int = 1024
+
+# Above this many cells, only blank cells next to a mark are searched. Play far
+# from every mark almost never matters, and it keeps the branching factor of a
+# 15x15 board near that of the standard board.
+NEIGHBORHOOD_MIN_CELLS: int = BOARD_SIZE * BOARD_SIZE + 1
+
+
+class SearchResult(NamedTuple):
+    """The outcome of one search.
+
+    `score` is from the point of view of the player to move. Forced wins and
+    losses score beyond `WIN_SCORE // 2` either way; anything smaller is a draw
+    or a heuristic estimate.
+    """
+
+    cell: Cell
+    score: int
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Search speed over the whole search."""
+
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+    def is_decided(self) -> bool:
+        """Whether the search proved a forced win or loss."""
+
+        return abs(self.score) > WIN_SCORE // 2
+
+
+class _BudgetExhaustedError(Exception):
+    pass
+
+
+# Win and loss scores count plies from the root. The table holds them counted
+# from the stored position instead, so they stay correct when reached at
+# another ply or from another root.
+def _to_table_score(score: int, ply: int) -> int:
+    if score > WIN_SCORE // 2:
+        return score + ply
+    if score < -WIN_SCORE // 2:
+        return score - ply
+    return score
+
+
+def _from_table_score(score: int, ply: int) -> int:
+    if score > WIN_SCORE // 2:
+        return score - ply
+    if score < -WIN_SCORE // 2:
+        return score + ply
+    return score
+
+
+class AlphaBetaSearch:
+    """Negamax search with alpha-beta pruning, iterative deepening and a budget.
+
+    The clock is read every `BUDGET_CHECK_INTERVAL` nodes, so a search overshoots
+    its time limit by at most that many nodes. The first iteration
+    always runs to completion, so a legal move is returned however small the
+    budget is.
+    """
+
+    _time_limit: Union[float, None]
+    _node_limit: Union[int, None]
+    _max_depth: Union[int, None]
+    _last_result: Union[SearchResult, None]
+    _table: TranspositionTable
+    _rules: Tuple[int, int, int]
+
+    _board: Board
+    _history: Dict[int, int]
+    _nodes: int
+    _deadline: float
+    _enforce_budget: bool
+    _neighborhood: bool
+    _width: int
+    _height: int
+    _full_mask: int
+    _not_first_col: int
+    _not_last_col: int
+    _run_shifts: List[Tuple[int, int]]
+    _run_weights: List[int]
+    _player_keys: Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+    def __init__(
+        self,
+        time_limit: Union[float, None] = DEFAULT_TIME_LIMIT,
+        node_limit: Union[int, None] = None,
+        max_depth: Union[int, None] = None,
+        table: Union[TranspositionTable, None] = None,
+    ) -> None:
+        """Create a search.
+
+        Args:
+            time_limit (Union[float, None]): Seconds allowed per move, or `None`
+                for no time limit.
+            node_limit (Union[int, None]): Nodes allowed per move, or `None` for
+                no node limit.
+            max_depth (Union[int, None]): The deepest iteration, in plies, or
+                `None` to search until the game is decided or the budget runs out.
+            table (Union[TranspositionTable, None]): The transposition table,
+                kept between searches. Defaults to a new table.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError(f"Invalid time limit: {time_limit!r}.")
+        if node_limit is not None and node_limit <= 0:
+            raise ValueError(f"Invalid node limit: {node_limit!r}.")
+        if max_depth is not None and max_depth <= 0:
+            raise ValueError(f"Invalid max depth: {max_depth!r}.")
+
+        self._time_limit: Union[float, None] = time_limit
+        self._node_limit: Union[int, None] = node_limit
+        self._max_depth: Union[int, None] = max_depth
+        self._last_result: Union[SearchResult, None] = None
+        self._table: TranspositionTable = (
+            table if table is not None else TranspositionTable()
+        )
+        self._rules: Tuple[int, int, int] = (0, 0, 0)
+
+    def get_last_result(self) -> Union[SearchResult, None]:
+        """Get the result of the most recent search, or `None` before any search."""
+
+        return self._last_result
+
+    def get_table(self) -> TranspositionTable:
+        """Get the transposition table."""
+
+        return self._table
+
+    def search(self, board: Board) -> SearchResult:
+        """Find the best move for the player to move on `board`.
+
+        "X" is taken to move when both players have made the same number of
+        moves. `board` is not modified.
+
+        Args:
+            board (Board): The game board.
+
+        Raises:
+            ValueError: When the game is already over.
+
+        Returns:
+            SearchResult: The move, its score, and the search statistics.
+        """
+
+        if board.get_status() is not GameStatus.ONGOING:
+            raise ValueError("No moves left to play.")
+
+        start: float = time.perf_counter()
+        self._prepare(board, start)
+
+        x_bits, o_bits = board.get_bitboards()
+        x_to_move: bool = x_bits.bit_count() == o_bits.bit_count()
+        me, opponent = (x_bits, o_bits) if x_to_move else (o_bits, x_bits)
+
+        width, height = board.get_size()
+        x_keys, o_keys = get_zobrist_keys(width * height)
+        self._player_keys = (x_keys, o_keys) if x_to_move else (o_keys, x_keys)
+
+        blanks: int = width * height - board.get_move_count()
+        max_depth: int = min(blanks, self._max_depth or blanks)
+
+        best_index: int = -1
+        best_score: int = 0
+        depth_reached: int = 0
+
+        for depth in range(1, max_depth + 1):
+            try:
+                best_score, best_index = self._search_root(
+                    me, opponent, board.get_hash(), depth, best_index
+                )
+            except _BudgetExhaustedError:
+                break
+
+            depth_reached = depth
+            self._enforce_budget = True
+
+            if abs(best_score) > WIN_SCORE // 2:
+                break
+
+        row, col = divmod(best_index, width)
+        result: SearchResult = SearchResult(
+            (row, col),
+            best_score,
+            depth_reached,
+            self._nodes,
+            time.perf_counter() - start,
+        )
+        self._last_result = result
+
+        return result
+
+    def choose_move(self, board: Board) -> Cell:
+        """Search `board` and return only the chosen cell."""
+
+        return self.search(board).cell
+
+    def _prepare(self, board: Board, start: float) -> None:
+        width, height = board.get_size()
+        cells: int = width * height
+
+        rules: Tuple[int, int, int] = (width, height, board.get_win_length())
+        if rules != self._rules:
+            self._table.clear()
+            self._rules = rules
+
+        self._board = board
+        self._history = {}
+        self._nodes = 0
+        self._deadline = (
+            start + self._time_limit if self._time_limit is not None else float("inf")
+        )
+        self._enforce_budget = False
+        self._neighborhood = cells >= NEIGHBORHOOD_MIN_CELLS
+        self._width = width
+        self._height = height
+        self._full_mask = (1 << cells) - 1
+
+        first_col: int = 0
+        last_col: int = 0
+        for row in range(height):
+            first_col |= 1 << row * width
+            last_col |= 1 << row * width + width - 1
+
+        self._not_first_col = self._full_mask & ~first_col
+        self._not_last_col = self._full_mask & ~last_col
+
+        # (shift, mask) per direction: `bits >> shift & mask` moves each cell's
+        # next neighbor along the direction onto it, dropping wrapped columns.
+        self._run_shifts = [
+            (1, self._not_last_col),
+            (width, self._full_mask),
+            (width + 1, self._not_last_col),
+            (width - 1, self._not_first_col),
+        ]
+        self._run_weights = [4**length for length in range(board.get_win_length() - 2)]
+
+    def _count_node(self) -> None:
+        self._nodes += 1
+
+        if not self._enforce_budget:
+            return
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            raise _BudgetExhaustedError()
+        if (
+            self._nodes % BUDGET_CHECK_INTERVAL == 0
+            and time.perf_counter() >= self._deadline
+        ):
+            raise _BudgetExhaustedError()
+
+    def _candidates(self, occupied: int) -> List[int]:
+        blank: int = self._full_mask & ~occupied
+
+        if self._neighborhood:
+            width: int = self._width
+
+            if occupied:
+                across: int = (
+                    occupied
+                    | (occupied << 1) & self._not_first_col
+                    | (occupied >> 1) & self._not_last_col
+                )
+                blank = blank & (across | across << width | across >> width) or blank
+            else:
+                blank = 1 << (self._height // 2) * width + width // 2
+
+        indices: List[int] = []
+        while blank:
+            low: int = blank & -blank
+            indices.append(low.bit_length() - 1)
+            blank ^= low
+
+        history: Dict[int, int] = self._history
+        indices.sort(key=lambda index: history.get(index, 0), reverse=True)
+
+        return indices
+
+    def _evaluate(self, me: int, opponent: int) -> int:
+        score: int = 0
+
+        for shift, mask in self._run_shifts:
+            for bits, sign in ((me, 1), (opponent, -1)):
+                run: int = bits
+
+                # After pass n, `run` marks the starts of runs of n + 2 marks.
+                for weight in self._run_weights:
+                    run &= run >> shift & mask
+                    if not run:
+                        break
+                    score += sign * weight * run.bit_count()
+
+        return max(-EVALUATION_LIMIT, min(EVALUATION_LIMIT, score))
+
+    def _search_root(
+        self, me: int, opponent: int, key: int, depth: int, previous_best: int
+    ) -> Tuple[int, int]:
+        moves: List[int] = self._candidates(me | opponent)
+        if previous_best in moves:
+            moves.remove(previous_best)
+            moves.insert(0, previous_best)
+
+        alpha: int = -WIN_SCORE - 1
+        best_index: int = moves[0]
+
+        for index in moves:
+            score: int = self._score_move(
+                me, opponent, key, index, depth, alpha, WIN_SCORE + 1, 0
+            )
+            if score > alpha:
+                alpha = score
+                best_index = index
+
+        return (alpha, best_index)
+
+    def _score_move(
+        self,
+        me: int,
+        opponent: int,
+        key: int,
+        index: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        self._count_node()
+
+        me |= 1 << index
+        key ^= self._player_keys[ply & 1][index]
+
+        if self._board.is_win_through(me, index):
+            return WIN_SCORE - ply
+        if (me | opponent) == self._full_mask:
+            return 0
+        if depth == 1:
+            return self._evaluate(me, opponent)
+
+        return -self._negamax(opponent, me, key, depth - 1, -beta, -alpha, ply + 1)
+
+    def _negamax(
+        self,
+        me: int,
+        opponent: int,
+        key: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        entry: Union[TableEntry, None] = self._table.probe(key)
+
+        if entry is not None and entry.depth >= depth:
+            stored: int = _from_table_score(entry.score, ply)
+
+            if (
+                entry.bound is Bound.EXACT
+                or entry.bound is Bound.LOWER
+                and stored >= beta
+                or entry.bound is Bound.UPPER
+                and stored <= alpha
+            ):
+                return stored
+
+        moves: List[int] = self._candidates(me | opponent)
+
+        if entry is not None and entry.move in moves:
+            moves.remove(entry.move)
+            moves.insert(0, entry.move)
+
+        original_alpha: int = alpha
+        best_score: int = -WIN_SCORE - 1
+        best_index: int = -1
+
+        for index in moves:
+            score: int = self._score_move(
+                me, opponent, key, index, depth, alpha, beta, ply
+            )
+
+            if score > best_score:
+                best_score = score
+                best_index = index
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self._history[index] = self._history.get(index, 0) + depth * depth
+                break
+
+        bound: Bound = Bound.EXACT
+        if best_score <= original_alpha:
+            bound = Bound.UPPER
+        elif best_score >= beta:
+            bound = Bound.LOWER
+
+        self._table.store(
+            key, depth, _to_table_score(best_score, ply), bound, best_index
+        )
+
+        return best_score
+
+
+def choose_move(board: Board, time_limit: float = DEFAULT_TIME_LIMIT) -> Cell:
+    """Choose a move for the player to move on `board` within `time_limit` seconds.
+
+    Args:
+        board (Board): The game board.
+        time_limit (float): Seconds allowed for the search.
+
+    Raises:
+        ValueError: When the game is already over.
+
+    Returns:
+        Cell: The best cell found.
+    """
+
+    return AlphaBetaSearch(time_limit=time_limit).choose_move(board)
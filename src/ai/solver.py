@@ -0,0 +1,277 @@
+"""Perfect-play solver backed by a precomputed position table."""
+
+import random
+
+from functools import cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Tuple, Union
+
+from constants.constants import (
+    Cell,
+    PositionKey,
+    BOARD_SIZE,
+    FULL_BOARD_MASK,
+    WIN_MASKS,
+)
+
+from src.models.board import Board
+
+from src.models.symmetry import canonicalize, untransform_cell_index
+
+from src.storage.tablebase import (
+    ENTRY_COUNT,
+    NO_MOVE,
+    Tablebase,
+    decode_entry,
+    encode_entry,
+)
+
+type SolvedPosition = Tuple[int, Tuple[int, ...]]
+
+WIN: int = 1
+DRAW: int = 0
+LOSS: int = -1
+
+
+_tablebase: Union[Tablebase, None] = None
+
+
+class UnsolvedPositionError(Exception):
+    """Custom error for when a position is not in the solution table."""
+
+    _message: str
+
+    def __init__(self, message: str = "Unsolved position.") -> None:
+        self._message: str = message
+        super().__init__(self._message)
+
+
+def _is_win(bits: int) -> bool:
+    return any(bits & mask == mask for mask in WIN_MASKS)
+
+
+def _solve(table: Dict[PositionKey, SolvedPosition], x_bits: int, o_bits: int) -> int:
+    key, _ = canonicalize(x_bits, o_bits)
+
+    solved: SolvedPosition | None = table.get(key)
+    if solved is not None:
+        return solved[0]
+
+    x_bits, o_bits = key
+
+    x_to_move: bool = x_bits.bit_count() == o_bits.bit_count()
+    opponent_bits: int = o_bits if x_to_move else x_bits
+    occupied: int = x_bits | o_bits
+
+    best_value: int
+    best_moves: List[int] = []
+
+    if _is_win(opponent_bits):
+        best_value = LOSS
+    elif occupied == FULL_BOARD_MASK:
+        best_value = DRAW
+    else:
+        best_value = LOSS - 1
+
+        for index in range(BOARD_SIZE * BOARD_SIZE):
+            bit: int = 1 << index
+            if occupied & bit:
+                continue
+
+            if x_to_move:
+                value: int = -_solve(table, x_bits | bit, o_bits)
+            else:
+                value = -_solve(table, x_bits, o_bits | bit)
+
+            if value > best_value:
+                best_value = value
+                best_moves = [index]
+            elif value == best_value:
+                best_moves.append(index)
+
+    table[key] = (best_value, tuple(best_moves))
+    return best_value
+
+
+@cache
+def get_solution_table() -> Mapping[PositionKey, SolvedPosition]:
+    """Get the table of every position reachable from a blank board.
+
+    The table is built on first use and cached for the life of the process. It is
+    keyed on symmetry-canonical positions, so each of the 5,478 reachable
+    positions is stored once per symmetry class.
+
+    Returns:
+        Mapping[PositionKey, SolvedPosition]: For each canonical (`x_bits`,
+            `o_bits`) key, the minimax value for the player to move (`WIN`,
+            `DRAW` or `LOSS`) and the canonical cell indices of every move that
+            achieves it.
+    """
+
+    table: Dict[PositionKey, SolvedPosition] = {}
+    _solve(table, 0, 0)
+
+    return table
+
+
+def use_tablebase(path: Union[str, Path, None]) -> None:
+    """Answer lookups from the tablebase file at `path` instead of solving.
+
+    With a tablebase, the solution table is never built, and each position has
+    a single best move. Pass `None` to go back to solving in process.
+
+    Raises:
+        TablebaseError: When the file is not a valid tablebase.
+    """
+
+    global _tablebase
+
+    if _tablebase is not None:
+        _tablebase.close()
+
+    _tablebase = Tablebase(path) if path is not None else None
+
+
+def _iter_solved_indexes() -> Iterator[Tuple[int, int, Tuple[int, ...]]]:
+    table: Mapping[PositionKey, SolvedPosition] = get_solution_table()
+
+    for index in range(ENTRY_COUNT):
+        x_bits: int = 0
+        o_bits: int = 0
+        digits: int = index
+
+        for cell in range(BOARD_SIZE * BOARD_SIZE):
+            digits, digit = divmod(digits, 3)
+            if digit == 1:
+                x_bits |= 1 << cell
+            elif digit == 2:
+                o_bits |= 1 << cell
+
+        key, transform = canonicalize(x_bits, o_bits)
+        solved: SolvedPosition | None = table.get(key)
+
+        if solved is not None:
+            value, best_moves = solved
+            yield (
+                index,
+                value,
+                tuple(untransform_cell_index(move, transform) for move in best_moves),
+            )
+
+
+def build_tablebase_entries() -> bytes:
+    """Solve every position and encode the results as tablebase entries.
+
+    Each reachable position's stored move is the lowest cell index among its
+    best moves.
+
+    Returns:
+        bytes: One entry per base-3 index.
+    """
+
+    entries: bytearray = bytearray(ENTRY_COUNT)
+
+    for index, value, best_moves in _iter_solved_indexes():
+        entries[index] = encode_entry(value, min(best_moves, default=NO_MOVE))
+
+    return bytes(entries)
+
+
+def verify_tablebase(tablebase: Tablebase) -> List[int]:
+    """Re-solve every position and compare with `tablebase`.
+
+    An entry passes if its value matches and its move is any best move.
+
+    Returns:
+        List[int]: The base-3 indexes of entries that disagree.
+    """
+
+    expected: Dict[int, Tuple[int, Tuple[int, ...]]] = {
+        index: (value, best_moves)
+        for index, value, best_moves in _iter_solved_indexes()
+    }
+    mismatches: List[int] = []
+
+    for index in range(ENTRY_COUNT):
+        stored: Union[Tuple[int, int], None] = decode_entry(tablebase.get_entry(index))
+        solved: Union[Tuple[int, Tuple[int, ...]], None] = expected.get(index)
+
+        if stored is None or solved is None:
+            if (stored is None) != (solved is None):
+                mismatches.append(index)
+            continue
+
+        value, move = stored
+        best_value, best_moves = solved
+
+        if value != best_value or move not in (best_moves or (NO_MOVE,)):
+            mismatches.append(index)
+
+    return mismatches
+
+
+def solve_position(board: Board) -> SolvedPosition:
+    """Look up the minimax value and best moves for `board`.
+
+    Args:
+        board (Board): The game board.
+
+    Raises:
+        UnsolvedPositionError: When the board is not the standard board, or the
+            position is not reachable from a blank board with "X" moving first.
+
+    Returns:
+        SolvedPosition: The value for the player to move and the cell indices of
+            every best move, or of one best move when a tablebase is in use.
+    """
+
+    if not board.is_standard():
+        raise UnsolvedPositionError("Only the standard board is solved.")
+
+    if _tablebase is not None:
+        entry: Union[Tuple[int, int], None] = _tablebase.lookup(*board.get_bitboards())
+
+        if entry is None:
+            raise UnsolvedPositionError(
+                f"Position {board.get_bitboards()!r} is not reachable "
+                "from a blank board."
+            )
+
+        value, move = entry
+        return (value, () if move == NO_MOVE else (move,))
+
+    key, transform = board.canonicalize()
+
+    try:
+        value, best_moves = get_solution_table()[key]
+    except KeyError as e:
+        raise UnsolvedPositionError(
+            f"Position {board.get_bitboards()!r} is not reachable from a blank board."
+        ) from e
+
+    return (
+        value,
+        tuple(sorted(untransform_cell_index(move, transform) for move in best_moves)),
+    )
+
+
+def choose_move(board: Board) -> Cell:
+    """Choose a best move for the player to move on `board`.
+
+    Args:
+        board (Board): The game board.
+
+    Raises:
+        UnsolvedPositionError: When the position is unreachable or already over.
+
+    Returns:
+        Cell: A cell that achieves the best result, picked at random among ties.
+    """
+
+    _, best_moves = solve_position(board)
+
+    if not best_moves:
+        raise UnsolvedPositionError("No moves left to play.")
+
+    row, col = divmod(random.choice(best_moves), BOARD_SIZE)
+    return (row, col)
@@ -0,0 +1,531 @@
+"""Strong solver for boards of up to 16 cells, such as 4x4.
+
+Every position reachable from a blank board is solved by negamax over plain
+bitboards, and its value for the player to move is stored in a packed two-bit
+table (`src.storage.packed_table`). The table is also the memo: a position that
+is already in it is never searched again.
+
+While solving, the table lives in `multiprocessing.shared_memory`, and worker
+processes fill it together. The tree is expanded in this process down to the
+shallowest depth with enough distinct positions to keep every worker busy, and
+the workers solve the subtrees below them, each finding whatever the others
+have already solved. The top of the tree is then solved in this process.
+
+Entries only ever go from `UNSOLVED` to the position's value, so the workers
+take no locks. Two workers writing to the same byte at the same instant can
+lose one entry; it is then merely unsolved, and is solved again by whoever next
+needs it, including `SolvedTable` during play.
+
+The table is checkpointed to its file every `checkpoint_interval` seconds, and
+once more if the solve is interrupted. A solve resumes from the checkpoint at
+its path, and returns at once if the table there is complete.
+"""
+
+import random
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import cache
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Set, Tuple, Union
+
+from constants.constants import Cell
+
+from src.ai.solver import DRAW, LOSS, WIN, UnsolvedPositionError
+
+from src.models.board import WIN_DIRECTIONS, Board
+
+from src.storage.packed_table import (
+    MAX_CELLS,
+    PackedTableInfo,
+    read_packed_table,
+    write_packed_table,
+)
+
+type Table = Union[bytearray, memoryview]
+
+# A position to solve: the bitboards of the player to move and of the other
+# player, the base-3 index, and the digit the player to move adds to it.
+type _Task = Tuple[int, int, int, int]
+
+DEFAULT_SIZE: int = 4
+DEFAULT_CHECKPOINT_INTERVAL: float = 60.0
+
+# Subtrees per worker the split depth aims for, to even out uneven subtrees.
+SPLIT_POSITIONS_PER_WORKER: int = 8
+
+# `_SOLVED_PER_BYTE[byte]` is the number of solved entries in a table byte.
+_SOLVED_PER_BYTE: bytes = bytes(
+    sum(1 for slot in range(4) if byte >> 2 * slot & 3) for byte in range(256)
+)
+
+# The table a worker process fills, attached by `_attach`.
+_worker_memory: Union[SharedMemory, None] = None
+
+
+class _Layout(NamedTuple):
+    powers: Tuple[int, ...]
+    cell_win_masks: Tuple[Tuple[int, ...], ...]
+    full_mask: int
+
+
+class SolveResult(NamedTuple):
+    """The outcome of `solve_table`."""
+
+    info: PackedTableInfo
+    value: int
+    solved: int
+    seconds: float
+    workers: int
+    resumed: bool
+
+    def describe(self) -> str:
+        """Summarize the solve on one line."""
+
+        width, height, win_length = self.info.get_rules()
+        result: str = {WIN: "X wins", DRAW: "draw", LOSS: "O wins"}[self.value]
+        resumed: str = ", resumed" if self.resumed else ""
+
+        return (
+            f"{width}x{height}, {win_length} in a row: {result} with perfect play. "
+            f"{self.solved:,} positions in {self.seconds:.1f}s "
+            f"on {self.workers} workers{resumed}."
+        )
+
+
+@cache
+def _get_layout(width: int, height: int, win_length: int) -> _Layout:
+    if width * height > MAX_CELLS:
+        raise ValueError(f"Only boards of up to {MAX_CELLS} cells can be solved.")
+
+    lines: List[int] = []
+
+    for row in range(height):
+        for col in range(width):
+            for row_step, col_step in WIN_DIRECTIONS:
+                end_row: int = row + row_step * (win_length - 1)
+                end_col: int = col + col_step * (win_length - 1)
+
+                if 0 <= end_row < height and 0 <= end_col < width:
+                    lines.append(
+                        sum(
+                            1 << (row + row_step * step) * width + col + col_step * step
+                            for step in range(win_length)
+                        )
+                    )
+
+    return _Layout(
+        tuple(3**index for index in range(width * height)),
+        tuple(
+            tuple(line for line in lines if line >> index & 1)
+            for index in range(width * height)
+        ),
+        (1 << width * height) - 1,
+    )
+
+
+def _store(table: Table, index: int, value: int) -> None:
+    # An entry is only ever unsolved or this value, so setting its bits is enough.
+    table[index >> 2] |= value + 2 << ((index & 3) << 1)
+
+
+def _solve(
+    table: Table, layout: _Layout, mover: int, other: int, index: int, digit: int
+) -> int:
+    entry: int = table[index >> 2] >> ((index & 3) << 1) & 3
+    if entry:
+        return entry - 2
+
+    powers, cell_win_masks, full_mask = layout
+    best_value: int = LOSS
+    free: int = full_mask ^ (mover | other)
+
+    while free:
+        low: int = free & -free
+        free ^= low
+        cell: int = low.bit_length() - 1
+        moved: int = mover | low
+        child: int = index + digit * powers[cell]
+
+        for mask in cell_win_masks[cell]:
+            if moved & mask == mask:
+                _store(table, child, LOSS)
+                best_value = WIN
+                break
+        else:
+            if moved | other == full_mask:
+                _store(table, child, DRAW)
+                value: int = DRAW
+            else:
+                value = -_solve(table, layout, other, moved, child, 3 - digit)
+
+            if value > best_value:
+                best_value = value
+
+    _store(table, index, best_value)
+    return best_value
+
+
+def _is_over(layout: _Layout, mover: int, other: int) -> bool:
+    return (mover | other) == layout.full_mask or any(
+        other & mask == mask for masks in layout.cell_win_masks for mask in masks
+    )
+
+
+def _get_buffer(memory: SharedMemory) -> memoryview:
+    if memory.buf is None:
+        raise ValueError(f"Shared memory {memory.name!r} is closed.")
+    return memory.buf
+
+
+def _attach(name: str) -> None:
+    global _worker_memory
+
+    _worker_memory = SharedMemory(name, track=False)
+
+
+def _solve_tasks(rules: Tuple[int, int, int], tasks: List[_Task]) -> None:
+    assert _worker_memory is not None
+
+    layout: _Layout = _get_layout(*rules)
+    table: memoryview = _get_buffer(_worker_memory)
+
+    for mover, other, index, digit in tasks:
+        _solve(table, layout, mover, other, index, digit)
+
+
+def _split(layout: _Layout, positions: int) -> List[_Task]:
+    frontier: Dict[int, _Task] = {0: (0, 0, 0, 1)}
+
+    while len(frontier) < positions:
+        children: Dict[int, _Task] = {}
+
+        for mover, other, index, digit in frontier.values():
+            free: int = layout.full_mask ^ (mover | other)
+
+            while free:
+                low: int = free & -free
+                free ^= low
+                child: int = index + digit * layout.powers[low.bit_length() - 1]
+
+                if not _is_over(layout, other, mover | low):
+                    children[child] = (other, mover | low, child, 3 - digit)
+
+        if not children:
+            break
+        frontier = children
+
+    return list(frontier.values())
+
+
+def _count_solved(entries: Union[bytes, memoryview]) -> int:
+    return sum(bytes(entries).translate(_SOLVED_PER_BYTE))
+
+
+def solve_table(
+    path: Union[str, Path],
+    width: int = DEFAULT_SIZE,
+    height: int = DEFAULT_SIZE,
+    win_length: int = DEFAULT_SIZE,
+    workers: int = 1,
+    checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+) -> SolveResult:
+    """Solve every position reachable from a blank board into the table at `path`.
+
+    Args:
+        path (Union[str, Path]): The packed table file; a checkpoint there is
+            resumed.
+        width (int): The board's width.
+        height (int): The board's height.
+        win_length (int): Marks in a row needed to win.
+        workers (int): Processes that solve subtrees.
+        checkpoint_interval (float): Seconds between checkpoints.
+
+    Raises:
+        ValueError: When the board has more than `MAX_CELLS` cells, the table at
+            `path` solves another board, or `workers` is not positive.
+        TablebaseError: When the file at `path` is not a valid packed table.
+
+    Returns:
+        SolveResult: The value of the blank board for "X" and the solve's stats.
+    """
+
+    if workers <= 0:
+        raise ValueError(f"Invalid worker count: {workers!r}.")
+
+    # Raises on sizes and win lengths that no board can have.
+    Board(width=width, height=height, win_length=win_length)
+    layout: _Layout = _get_layout(width, height, win_length)
+    info: PackedTableInfo = PackedTableInfo(width, height, win_length, False)
+    start: float = time.perf_counter()
+    checkpoint: Union[bytes, None] = None
+
+    if Path(path).exists():
+        saved_info, checkpoint = read_packed_table(path)
+
+        if saved_info.get_rules() != info.get_rules():
+            raise ValueError(f"{str(path)!r} solves another board.")
+
+        if saved_info.complete:
+            value: int = _solve(bytearray(checkpoint), layout, 0, 0, 0, 1)
+            return SolveResult(
+                saved_info, value, _count_solved(checkpoint), 0.0, workers, True
+            )
+
+    memory: SharedMemory = SharedMemory(create=True, size=info.size)
+
+    try:
+        table: memoryview = _get_buffer(memory)
+
+        if checkpoint is not None:
+            table[: info.size] = checkpoint
+
+        _solve_subtrees(memory, info, layout, workers, path, checkpoint_interval, start)
+        value = _solve(table, layout, 0, 0, 0, 1)
+        info = info._replace(complete=True)
+
+        with table[: info.size] as entries:
+            write_packed_table(path, info, entries)
+            solved: int = _count_solved(entries)
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return SolveResult(
+        info,
+        value,
+        solved,
+        time.perf_counter() - start,
+        workers,
+        checkpoint is not None,
+    )
+
+
+def _solve_subtrees(
+    memory: SharedMemory,
+    info: PackedTableInfo,
+    layout: _Layout,
+    workers: int,
+    path: Union[str, Path],
+    checkpoint_interval: float,
+    start: float,
+) -> None:
+    tasks: List[_Task] = _split(layout, workers * SPLIT_POSITIONS_PER_WORKER)
+    chunk_size: int = max(1, len(tasks) // (workers * SPLIT_POSITIONS_PER_WORKER))
+    executor: ProcessPoolExecutor = ProcessPoolExecutor(
+        workers, initializer=_attach, initargs=(memory.name,)
+    )
+
+    def save() -> None:
+        # Workers keep writing, so the checksum must be taken over a snapshot.
+        with _get_buffer(memory)[: info.size] as entries:
+            write_packed_table(path, info, bytes(entries))
+
+    try:
+        pending: Set[Future[None]] = {
+            executor.submit(
+                _solve_tasks, info.get_rules(), tasks[offset : offset + chunk_size]
+            )
+            for offset in range(0, len(tasks), chunk_size)
+        }
+        last_checkpoint: float = start
+
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=max(
+                    0.0, last_checkpoint + checkpoint_interval - time.perf_counter()
+                ),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                future.result()
+
+            if time.perf_counter() - last_checkpoint >= checkpoint_interval:
+                save()
+                last_checkpoint = time.perf_counter()
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        save()
+        raise
+
+    executor.shutdown()
+
+
+class SolvedTable:
+    """A packed table loaded for play.
+
+    Positions the table lacks are solved when first looked up, into this copy of
+    the table only.
+    """
+
+    _info: PackedTableInfo
+    _table: bytearray
+    _layout: _Layout
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Load the packed table at `path`.
+
+        Raises:
+            TablebaseError: When the file is not a valid packed table.
+            OSError: When the file cannot be read.
+        """
+
+        info, entries = read_packed_table(path)
+
+        self._info: PackedTableInfo = info
+        self._table: bytearray = bytearray(entries)
+        self._layout: _Layout = _get_layout(*info.get_rules())
+
+    def get_info(self) -> PackedTableInfo:
+        """Get the board the table solves, and whether it is complete."""
+
+        return self._info
+
+    def solve_position(self, board: Board) -> Tuple[int, Tuple[int, ...]]:
+        """Look up the minimax value and best moves for `board`.
+
+        Args:
+            board (Board): The game board.
+
+        Raises:
+            UnsolvedPositionError: When the table solves another board, or the
+                position is not reachable from a blank board with "X" moving
+                first.
+
+        Returns:
+            Tuple[int, Tuple[int, ...]]: The value for the player to move
+                (`WIN`, `DRAW` or `LOSS`) and the cell indices of every move
+                that achieves it.
+        """
+
+        width, height = board.get_size()
+
+        if (width, height, board.get_win_length()) != self._info.get_rules():
+            raise UnsolvedPositionError(
+                f"The table solves {self._info.width}x{self._info.height} boards "
+                f"with {self._info.win_length} in a row."
+            )
+
+        x_bits, o_bits = board.get_bitboards()
+        if x_bits.bit_count() - o_bits.bit_count() not in (0, 1):
+            raise UnsolvedPositionError(
+                f"Position {board.get_bitboards()!r} is not reachable "
+                "from a blank board."
+            )
+
+        x_to_move: bool = board.get_player_to_move() == "X"
+        mover, other = (x_bits, o_bits) if x_to_move else (o_bits, x_bits)
+        digit: int = 1 if x_to_move else 2
+        index: int = sum(
+            self._layout.powers[cell] * (1 if x_bits >> cell & 1 else 2)
+            for cell in range(width * height)
+            if (x_bits | o_bits) >> cell & 1
+        )
+
+        if _is_over(self._layout, mover, other):
+            return (DRAW if (mover | other) == self._layout.full_mask else LOSS, ())
+
+        best_value: int = LOSS - 1
+        best_moves: List[int] = []
+
+        for cell in range(width * height):
+            if (mover | other) >> cell & 1:
+                continue
+
+            moved: int = mover | 1 << cell
+            value: int
+
+            if any(moved & mask == mask for mask in self._layout.cell_win_masks[cell]):
+                value = WIN
+            elif moved | other == self._layout.full_mask:
+                value = DRAW
+            else:
+                value = -_solve(
+                    self._table,
+                    self._layout,
+                    other,
+                    moved,
+                    index + digit * self._layout.powers[cell],
+                    3 - digit,
+                )
+
+            if value > best_value:
+                best_value = value
+                best_moves = [cell]
+            elif value == best_value:
+                best_moves.append(cell)
+
+        return (best_value, tuple(best_moves))
+
+    def choose_move(self, board: Board) -> Cell:
+        """Choose a best move for the player to move on `board`.
+
+        A winning move that ends the game at once is preferred over other wins.
+
+        Raises:
+            UnsolvedPositionError: When the position is not in the table or the
+                game is already over.
+
+        Returns:
+            Cell: A cell that achieves the best result, picked at random among
+                ties.
+        """
+
+        width, _ = board.get_size()
+        value, best_moves = self.solve_position(board)
+
+        if not best_moves:
+            raise UnsolvedPositionError("No moves left to play.")
+
+        if value == WIN:
+            player_bits: int = board.get_bitboards()[
+                0 if board.get_player_to_move() == "X" else 1
+            ]
+            best_moves = (
+                tuple(
+                    move
+                    for move in best_moves
+                    if board.is_win_through(player_bits | 1 << move, move)
+                )
+                or best_moves
+            )
+
+        row, col = divmod(random.choice(best_moves), width)
+        return (row, col)
+
+
+_default_table: Union[SolvedTable, None] = None
+
+
+def get_default_table() -> Union[SolvedTable, None]:
+    """Get the table used by `choose_move`, if one is loaded."""
+
+    return _default_table
+
+
+def set_default_table(table: Union[SolvedTable, None]) -> None:
+    """Replace the table used by `choose_move`."""
+
+    global _default_table
+
+    _default_table = table
+
+
+def choose_move(board: Board) -> Cell:
+    """Choose a best move for the player to move on `board` from the default table.
+
+    Raises:
+        UnsolvedPositionError: When no table is loaded, the table solves another
+            board, or the game is already over.
+
+    Returns:
+        Cell: A cell that achieves the best result.
+    """
+
+    if _default_table is None:
+        raise UnsolvedPositionError("No packed table is loaded.")
+
+    return _default_table.choose_move(board)
@@ -0,0 +1,196 @@
+"""Bounded transposition table keyed on Zobrist hashes."""
+
+from enum import Enum, auto
+from typing import List, NamedTuple, Union
+
+DEFAULT_TABLE_SIZE: int = 1 << 18
+
+
+class Bound(Enum):
+    """How a stored score relates to the true score of its position."""
+
+    EXACT = auto()
+    LOWER = auto()
+    UPPER = auto()
+
+
+class ReplacementPolicy(Enum):
+    """Which entry keeps a slot when two positions hash to it."""
+
+    DEPTH_PREFERRED = auto()
+    ALWAYS_REPLACE = auto()
+
+
+class TableEntry(NamedTuple):
+    """A stored search result.
+
+    `move` is the cell index of the best move found, or -1 if there was none.
+    """
+
+    key: int
+    depth: int
+    score: int
+    bound: Bound
+    move: int
+
+
+class TableStats(NamedTuple):
+    """Transposition table counters since creation or the last `clear`.
+
+    A collision is a probe that found its slot held by a different position.
+    """
+
+    hits: int
+    misses: int
+    collisions: int
+    stores: int
+    overwrites: int
+    rejected: int
+
+    @property
+    def probes(self) -> int:
+        """Total number of probes."""
+
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of probes that found their position."""
+
+        return self.hits / self.probes if self.probes else 0.0
+
+
+class TranspositionTable:
+    """Fixed-size, directly indexed table of search results.
+
+    A position lives in slot `key & (size - 1)` and the full key is kept to tell
+    positions sharing a slot apart, so memory use never grows past `size`
+    entries.
+    """
+
+    _entries: List[Union[TableEntry, None]]
+    _mask: int
+    _policy: ReplacementPolicy
+    _hits: int
+    _misses: int
+    _collisions: int
+    _stores: int
+    _overwrites: int
+    _rejected: int
+
+    def __init__(
+        self,
+        size: int = DEFAULT_TABLE_SIZE,
+        policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED,
+    ) -> None:
+        """Create an empty table.
+
+        Args:
+            size (int): The number of slots; must be a power of two.
+            policy (ReplacementPolicy): Which entry keeps a contested slot.
+
+        Raises:
+            ValueError: If `size` is not a positive power of two.
+        """
+
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Table size must be a power of two: {size!r}.")
+
+        self._entries: List[Union[TableEntry, None]] = [None] * size
+        self._mask: int = size - 1
+        self._policy: ReplacementPolicy = policy
+        self._reset_stats()
+
+    def __len__(self) -> int:
+        return sum(entry is not None for entry in self._entries)
+
+    def _reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+        self._overwrites = 0
+        self._rejected = 0
+
+    def get_size(self) -> int:
+        """Get the number of slots."""
+
+        return self._mask + 1
+
+    def get_policy(self) -> ReplacementPolicy:
+        """Get the replacement policy."""
+
+        return self._policy
+
+    def get_stats(self) -> TableStats:
+        """Get the hit, miss, collision and store counters."""
+
+        return TableStats(
+            self._hits,
+            self._misses,
+            self._collisions,
+            self._stores,
+            self._overwrites,
+            self._rejected,
+        )
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+
+        self._entries = [None] * (self._mask + 1)
+        self._reset_stats()
+
+    def probe(self, key: int) -> Union[TableEntry, None]:
+        """Look up the entry for the position with hash `key`.
+
+        Args:
+            key (int): The position's Zobrist hash.
+
+        Returns:
+            Union[TableEntry, None]: The entry, or `None` if it is not stored.
+        """
+
+        entry: Union[TableEntry, None] = self._entries[key & self._mask]
+
+        if entry is not None and entry.key == key:
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        if entry is not None:
+            self._collisions += 1
+        return None
+
+    def store(self, key: int, depth: int, score: int, bound: Bound, move: int) -> bool:
+        """Store a search result, subject to the replacement policy.
+
+        Under `DEPTH_PREFERRED`, an entry for another position is only replaced
+        by a search at least as deep. An entry for the same position is always
+        replaced.
+
+        Args:
+            key (int): The position's Zobrist hash.
+            depth (int): The depth searched below the position, in plies.
+            score (int): The score found.
+            bound (Bound): Whether `score` is exact or a bound.
+            move (int): The cell index of the best move, or -1.
+
+        Returns:
+            bool: Whether the result was stored.
+        """
+
+        slot: int = key & self._mask
+        current: Union[TableEntry, None] = self._entries[slot]
+
+        if current is not None and current.key != key:
+            if (
+                self._policy is ReplacementPolicy.DEPTH_PREFERRED
+                and depth < current.depth
+            ):
+                self._rejected += 1
+                return False
+            self._overwrites += 1
+
+        self._entries[slot] = TableEntry(key, depth, score, bound, move)
+        self._stores += 1
+        return True
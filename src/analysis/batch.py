@@ -0,0 +1,145 @@
+"""Batched win/draw evaluation with NumPy.
+
+Requires the optional `numpy` extra: `pip install -e .[numpy]`.
+
+Boards are accepted in any of three encodings:
+
+- An `(N, 3, 3)` integer array of cell values, `EMPTY` (0), `X` (1) or `O` (2).
+- An `(N,)` `uint16` array of base-3 indexes, sum of `value * 3 ** index` over
+  cell indexes `row * BOARD_SIZE + col`.
+- An `(N,)` `uint32` array of packed bitboards, `x_bits | o_bits << 9`.
+"""
+
+from typing import Iterable, Tuple
+
+from constants.constants import BOARD_SIZE, FULL_BOARD_MASK, WIN_MASKS
+
+from src.models.board import Board
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError(
+        "Batched evaluation requires NumPy: `pip install -e .[numpy]`."
+    ) from e
+
+EMPTY: int = 0
+X: int = 1
+O: int = 2  # noqa: E741
+
+CELL_COUNT: int = BOARD_SIZE * BOARD_SIZE
+POSITION_COUNT: int = 3**CELL_COUNT
+
+_CELL_BITS: npt.NDArray[np.uint32] = (1 << np.arange(CELL_COUNT)).astype(np.uint32)
+_POWERS_OF_3: npt.NDArray[np.uint32] = (3 ** np.arange(CELL_COUNT)).astype(np.uint32)
+_WIN_MASKS: npt.NDArray[np.uint32] = np.array(WIN_MASKS, dtype=np.uint32)
+
+
+def _cells_to_bitboards(
+    cells: npt.NDArray[np.integer],
+) -> Tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]:
+    if np.any((cells < EMPTY) | (cells > O)):
+        raise ValueError("Cell values must be EMPTY (0), X (1) or O (2).")
+
+    x_bits = ((cells == X) * _CELL_BITS).sum(axis=1, dtype=np.uint32)
+    o_bits = ((cells == O) * _CELL_BITS).sum(axis=1, dtype=np.uint32)
+
+    return (x_bits, o_bits)
+
+
+def to_bitboards(
+    boards: npt.NDArray[np.integer],
+) -> Tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]:
+    """Convert a batch of boards in any supported encoding to bitboards.
+
+    Args:
+        boards (npt.NDArray[np.integer]): An `(N, 3, 3)` cell array, an `(N,)`
+            `uint16` base-3 array or an `(N,)` `uint32` packed bitboard array.
+
+    Raises:
+        ValueError: If the shape or dtype is not a supported encoding, a cell
+            value is not `EMPTY`, `X` or `O`, or a base-3 index is not below
+            `POSITION_COUNT`.
+
+    Returns:
+        Tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]: The "X" and "O"
+            bitboards, one per board.
+    """
+
+    boards = np.asarray(boards)
+
+    if boards.ndim == 3 and boards.shape[1:] == (BOARD_SIZE, BOARD_SIZE):
+        return _cells_to_bitboards(boards.reshape(-1, CELL_COUNT))
+
+    if boards.ndim == 1 and boards.dtype == np.uint16:
+        if np.any(boards >= POSITION_COUNT):
+            raise ValueError(f"Base-3 indexes must be below {POSITION_COUNT}.")
+
+        digits = boards.astype(np.uint32)[:, None] // _POWERS_OF_3 % 3
+        return _cells_to_bitboards(digits)
+
+    if boards.ndim == 1 and boards.dtype == np.uint32:
+        packed: npt.NDArray[np.uint32] = boards.astype(np.uint32)
+        mask: np.uint32 = np.uint32(FULL_BOARD_MASK)
+        return (packed & mask, packed >> np.uint32(CELL_COUNT) & mask)
+
+    raise ValueError(
+        f"Unsupported board batch: shape {boards.shape!r}, dtype {boards.dtype}."
+    )
+
+
+def pack_boards(boards: Iterable[Board]) -> npt.NDArray[np.uint32]:
+    """Pack `Board` instances into a `uint32` bitboard batch.
+
+    Args:
+        boards (Iterable[Board]): The game boards.
+
+    Returns:
+        npt.NDArray[np.uint32]: One `x_bits | o_bits << 9` entry per board.
+    """
+
+    return np.fromiter(
+        (
+            x_bits | o_bits << CELL_COUNT
+            for x_bits, o_bits in map(Board.get_bitboards, boards)
+        ),
+        dtype=np.uint32,
+    )
+
+
+def evaluate_batch(
+    boards: npt.NDArray[np.integer],
+) -> Tuple[npt.NDArray[np.int8], npt.NDArray[np.bool_]]:
+    """Evaluate win and draw state for a batch of boards.
+
+    Results match `Board.check_win` and `Board.check_draw` exactly: where both
+    players hold a line, the winner is whoever holds the first line in
+    `WIN_MASKS` order.
+
+    Args:
+        boards (npt.NDArray[np.integer]): An `(N, 3, 3)` cell array, an `(N,)`
+            `uint16` base-3 array or an `(N,)` `uint32` packed bitboard array.
+
+    Raises:
+        ValueError: If `boards` is not a valid batch, as for `to_bitboards`.
+
+    Returns:
+        Tuple[npt.NDArray[np.int8], npt.NDArray[np.bool_]]: Per board, the
+            winner (`EMPTY` for no winner, `X` or `O`), and whether it is a draw.
+    """
+
+    x_bits, o_bits = to_bitboards(boards)
+
+    x_lines = (x_bits[:, None] & _WIN_MASKS) == _WIN_MASKS
+    o_lines = (o_bits[:, None] & _WIN_MASKS) == _WIN_MASKS
+    lines = x_lines | o_lines
+
+    has_winner = lines.any(axis=1)
+    first_line = lines.argmax(axis=1)
+    x_wins = x_lines[np.arange(len(first_line)), first_line]
+
+    winners = np.where(has_winner, np.where(x_wins, X, O), EMPTY).astype(np.int8)
+    draws = ((x_bits | o_bits) == FULL_BOARD_MASK) & ~has_winner
+
+    return (winners, draws)
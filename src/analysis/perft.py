@@ -0,0 +1,308 @@
+"""Exhaustive game-tree enumeration ("perft").
+
+Every legal move sequence from a position is played out with `Board.push` and
+`Board.pop`, counting positions per depth and finished games per depth and
+result. The counts from the empty standard board are known exactly, so a full
+run checks move generation and win detection end to end, and its speed is a
+repeatable benchmark of that path.
+
+Subtrees can be split across processes: the tree is walked in this process down
+to the shallowest depth with enough positions to keep every worker busy, and
+each position there is counted in a worker.
+"""
+
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Sequence, Tuple, Union
+
+from constants.constants import CellValue
+
+from src.models.board import Board, GameStatus
+
+# Positions per worker the split depth aims for, to even out uneven subtrees.
+SPLIT_POSITIONS_PER_WORKER: int = 8
+
+_RESULTS: Tuple[GameStatus, ...] = (GameStatus.X_WON, GameStatus.O_WON, GameStatus.DRAW)
+
+
+class PerftResult(NamedTuple):
+    """Counts from one enumeration.
+
+    `nodes_by_depth[d]` counts the positions `d` plies below the start, and
+    `games_by_depth[d]` the games that ended there.
+    """
+
+    nodes_by_depth: Tuple[int, ...]
+    games_by_depth: Tuple[int, ...]
+    x_wins: int
+    o_wins: int
+    draws: int
+    seconds: float
+    workers: int
+
+    @property
+    def nodes(self) -> int:
+        """Positions visited, the start included."""
+
+        return sum(self.nodes_by_depth)
+
+    @property
+    def games(self) -> int:
+        """Games played to the end."""
+
+        return self.x_wins + self.o_wins + self.draws
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Enumeration speed across all workers."""
+
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+    def describe(self) -> str:
+        """Summarize the counts and speed, one depth per line."""
+
+        lines: List[str] = [f"{'depth':>5} {'nodes':>12} {'games':>12}"]
+        lines.extend(
+            f"{depth:>5} {nodes:>12} {games:>12}"
+            for depth, (nodes, games) in enumerate(
+                zip(self.nodes_by_depth, self.games_by_depth, strict=True)
+            )
+        )
+        lines.extend(
+            [
+                f"Nodes:  {self.nodes}",
+                f"Games:  {self.games}",
+                f"X wins: {self.x_wins}",
+                f"O wins: {self.o_wins}",
+                f"Draws:  {self.draws}",
+                f"Time:   {self.seconds:.2f}s "
+                f"({self.nodes_per_second:,.0f} nodes/s on {self.workers} workers)",
+            ]
+        )
+
+        return "\n".join(lines)
+
+
+# Exact counts from the empty standard board.
+STANDARD_NODES_BY_DEPTH: Tuple[int, ...] = (
+    1,
+    9,
+    72,
+    504,
+    3024,
+    15120,
+    54720,
+    148176,
+    200448,
+    127872,
+)
+STANDARD_GAMES_BY_DEPTH: Tuple[int, ...] = (
+    0,
+    0,
+    0,
+    0,
+    0,
+    1440,
+    5328,
+    47952,
+    72576,
+    127872,
+)
+STANDARD_X_WINS: int = 131184
+STANDARD_O_WINS: int = 77904
+STANDARD_DRAWS: int = 46080
+
+
+class _Counts:
+    nodes: List[int]
+    games: List[int]
+    results: List[int]
+
+    def __init__(self, depths: int) -> None:
+        self.nodes = [0] * (depths + 1)
+        self.games = [0] * (depths + 1)
+        self.results = [0] * len(_RESULTS)
+
+    def add(
+        self, nodes: List[int], games: List[int], results: List[int], offset: int
+    ) -> None:
+        for depth, count in enumerate(nodes):
+            self.nodes[depth + offset] += count
+        for depth, count in enumerate(games):
+            self.games[depth + offset] += count
+        for index, count in enumerate(results):
+            self.results[index] += count
+
+
+def _walk(
+    board: Board,
+    depth: int,
+    max_depth: int,
+    counts: _Counts,
+    frontier: Union[List[Tuple[int, ...]], None] = None,
+    path: Tuple[int, ...] = (),
+) -> None:
+    status: GameStatus = board.get_status()
+
+    # Unfinished positions at the split depth are left to the workers.
+    if frontier is not None and depth == max_depth and status is GameStatus.ONGOING:
+        frontier.append(path)
+        return
+
+    counts.nodes[depth] += 1
+
+    if status is not GameStatus.ONGOING:
+        counts.games[depth] += 1
+        counts.results[_RESULTS.index(status)] += 1
+        return
+
+    if depth == max_depth:
+        return
+
+    width: int = board.get_size()[0]
+    moves: int = board.legal_moves()
+
+    while moves:
+        low: int = moves & -moves
+        index: int = low.bit_length() - 1
+
+        board.push(divmod(index, width))
+        _walk(
+            board,
+            depth + 1,
+            max_depth,
+            counts,
+            frontier,
+            path + (index,) if frontier is not None else path,
+        )
+        board.pop()
+        moves ^= low
+
+
+def _start_board(
+    state: List[List[CellValue]], rules: Tuple[int, int, int], path: Sequence[int]
+) -> Board:
+    width, height, win_length = rules
+    board: Board = Board(state, width=width, height=height, win_length=win_length)
+
+    for index in path:
+        board.push(divmod(index, width))
+
+    return board
+
+
+def count_subtree(
+    state: List[List[CellValue]],
+    rules: Tuple[int, int, int],
+    path: Tuple[int, ...],
+    max_depth: int,
+) -> Tuple[List[int], List[int], List[int]]:
+    """Count the subtree below `path` from the position `state`.
+
+    Returns:
+        Tuple[List[int], List[int], List[int]]: Nodes and games per depth below
+            the end of `path`, and X wins, O wins and draws.
+    """
+
+    counts: _Counts = _Counts(max_depth)
+    _walk(_start_board(state, rules, path), 0, max_depth, counts)
+
+    return (counts.nodes, counts.games, counts.results)
+
+
+def perft(
+    board: Board, max_depth: Union[int, None] = None, workers: int = 1
+) -> PerftResult:
+    """Enumerate every legal game from `board`.
+
+    Args:
+        board (Board): The starting position; it is not modified.
+        max_depth (Union[int, None]): The most plies to look ahead, or `None`
+            for every game to its end.
+        workers (int): Processes to split subtrees across; 1 counts in this
+            process.
+
+    Raises:
+        ValueError: If `max_depth` is negative or `workers` is not positive.
+
+    Returns:
+        PerftResult: The counts.
+    """
+
+    width, height = board.get_size()
+    blanks: int = width * height - board.get_move_count()
+
+    if max_depth is None:
+        max_depth = blanks
+    if max_depth < 0:
+        raise ValueError(f"Invalid depth: {max_depth!r}.")
+    if workers <= 0:
+        raise ValueError(f"Invalid worker count: {workers!r}.")
+
+    max_depth = min(max_depth, blanks)
+    rules: Tuple[int, int, int] = (width, height, board.get_win_length())
+    state: List[List[CellValue]] = board.get_board()
+    start: float = time.perf_counter()
+    counts: _Counts = _Counts(max_depth)
+
+    if workers == 1:
+        _walk(_start_board(state, rules, ()), 0, max_depth, counts)
+    else:
+        split_depth: int = 0
+        frontier: List[Tuple[int, ...]] = [()]
+
+        while split_depth < max_depth and len(frontier) < (
+            workers * SPLIT_POSITIONS_PER_WORKER
+        ):
+            split_depth += 1
+            counts = _Counts(max_depth)
+            frontier = []
+            _walk(_start_board(state, rules, ()), 0, split_depth, counts, frontier)
+
+        with ProcessPoolExecutor(workers) as executor:
+            subtrees = executor.map(
+                count_subtree,
+                [state] * len(frontier),
+                [rules] * len(frontier),
+                frontier,
+                [max_depth - split_depth] * len(frontier),
+                chunksize=max(1, len(frontier) // (workers * 4)),
+            )
+
+            for nodes, games, results in subtrees:
+                counts.add(nodes, games, results, split_depth)
+
+    x_wins, o_wins, draws = counts.results
+
+    return PerftResult(
+        tuple(counts.nodes),
+        tuple(counts.games),
+        x_wins,
+        o_wins,
+        draws,
+        time.perf_counter() - start,
+        workers,
+    )
+
+
+def verify_standard(result: PerftResult) -> List[str]:
+    """Compare a full enumeration from the empty standard board with the known counts.
+
+    Returns:
+        List[str]: A description of each count that differs; empty if all match.
+    """
+
+    expected: List[Tuple[str, object, object]] = [
+        ("nodes by depth", STANDARD_NODES_BY_DEPTH, result.nodes_by_depth),
+        ("games by depth", STANDARD_GAMES_BY_DEPTH, result.games_by_depth),
+        ("X wins", STANDARD_X_WINS, result.x_wins),
+        ("O wins", STANDARD_O_WINS, result.o_wins),
+        ("draws", STANDARD_DRAWS, result.draws),
+    ]
+
+    return [
+        f"{name}: expected {known}, got {counted}"
+        for name, known, counted in expected
+        if known != counted
+    ]
@@ -0,0 +1,266 @@
+"""Streaming position statistics over recorded games.
+
+Games are streamed from a record file in byte ranges, replayed on plain
+bitboards, and counted as (position, move, result) triples. Each range is
+counted in its own worker process. Counts are merged in the parent, which spills
+them to sorted files on disk whenever it holds more than `spill_threshold`
+distinct triples, then merges the spill files back in sorted order. Peak memory
+is set by the chunk size and the spill threshold, not by the number of games.
+
+A triple is packed into one int, `(position_key << 4 | move) << 2 | result`,
+where `position_key` is `x_bits | o_bits << 9` and `move` is `END_OF_GAME` for
+the position a game ended in. Sorting by that int groups triples by position.
+"""
+
+import heapq
+import itertools
+import os
+import struct
+import tempfile
+
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
+
+from constants.constants import BOARD_SIZE, CELL_TO_CELL_KEY_MAP
+
+from src.models.board import GameStatus
+
+from src.models.position import Position
+
+from src.storage.records import RESULT_CODES, GameRecord, read_games, split_records
+
+END_OF_GAME: int = 0xF
+DEFAULT_CHUNK_BYTES: int = 1 << 22
+DEFAULT_SPILL_THRESHOLD: int = 1 << 20
+DEFAULT_TOP_MOVES: int = 3
+
+_SPILL_ENTRY: struct.Struct = struct.Struct("<QQ")
+
+
+class PositionSummary(NamedTuple):
+    """Aggregate statistics for one position.
+
+    `continuations` holds the most-played moves from the position, as
+    (cell index, games) pairs, most played first.
+    """
+
+    position: Position
+    visits: int
+    x_wins: int
+    o_wins: int
+    draws: int
+    continuations: Tuple[Tuple[int, int], ...]
+
+    @property
+    def x_win_rate(self) -> float:
+        """The fraction of games through this position that "X" won."""
+
+        return self.x_wins / self.visits if self.visits else 0.0
+
+    @property
+    def o_win_rate(self) -> float:
+        """The fraction of games through this position that "O" won."""
+
+        return self.o_wins / self.visits if self.visits else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        """The fraction of games through this position that were drawn."""
+
+        return self.draws / self.visits if self.visits else 0.0
+
+    def describe(self) -> str:
+        """Summarize the position on one line.
+
+        The position is shown row by row from the top, "." for a blank cell, and
+        continuations by cell key.
+        """
+
+        cells: str = "".join(
+            self.position.get_cell(divmod(index, BOARD_SIZE)) or "."
+            for index in range(BOARD_SIZE * BOARD_SIZE)
+        )
+        continuations: str = " ".join(
+            f"{CELL_TO_CELL_KEY_MAP[divmod(move, BOARD_SIZE)]}:{games}"
+            for move, games in self.continuations
+        )
+
+        return (
+            f"{cells} {self.visits:>10} X {self.x_win_rate:6.1%} "
+            f"D {self.draw_rate:6.1%} O {self.o_win_rate:6.1%}  {continuations}"
+        ).rstrip()
+
+
+def iter_triples(games: Iterable[GameRecord]) -> Iterator[int]:
+    """Replay `games` and yield a packed (position, move, result) triple per ply.
+
+    Each game also yields one triple for its final position, with move
+    `END_OF_GAME`.
+    """
+
+    for game in games:
+        result: int = RESULT_CODES[game.status]
+        x_bits: int = 0
+        o_bits: int = 0
+        x_to_move: bool = True
+
+        for move in game.moves:
+            yield (
+                (x_bits | o_bits << BOARD_SIZE * BOARD_SIZE) << 4 | move
+            ) << 2 | result
+
+            if x_to_move:
+                x_bits |= 1 << move
+            else:
+                o_bits |= 1 << move
+            x_to_move = not x_to_move
+
+        yield (
+            (x_bits | o_bits << BOARD_SIZE * BOARD_SIZE) << 4 | END_OF_GAME
+        ) << 2 | result
+
+
+def count_range(path: str, start: int, end: int) -> Dict[int, int]:
+    """Count the triples of the games in one byte range of a record file.
+
+    Args:
+        path (str): The record file.
+        start (int): Byte offset of the first record.
+        end (int): Byte offset just past the last record.
+
+    Returns:
+        Dict[int, int]: The number of times each triple occurred.
+    """
+
+    return Counter(iter_triples(read_games(path, start, end)))
+
+
+def _spill(counts: Dict[int, int], directory: str) -> str:
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as file:
+        file.write(
+            b"".join(
+                _SPILL_ENTRY.pack(key, count) for key, count in sorted(counts.items())
+            )
+        )
+
+    return file.name
+
+
+def _read_spill(path: str) -> Iterator[Tuple[int, int]]:
+    with open(path, "rb") as file:
+        while entries := file.read(_SPILL_ENTRY.size * 4096):
+            yield from _SPILL_ENTRY.iter_unpack(entries)
+
+
+def _merge_sorted(runs: List[Iterator[Tuple[int, int]]]) -> Iterator[Tuple[int, int]]:
+    for key, group in itertools.groupby(heapq.merge(*runs), key=lambda entry: entry[0]):
+        yield (key, sum(count for _, count in group))
+
+
+def _count_ranges(
+    path: str, ranges: Iterable[Tuple[int, int]], workers: int
+) -> Iterator[Dict[int, int]]:
+    if workers == 1:
+        for start, end in ranges:
+            yield count_range(path, start, end)
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending: Set[Future[Dict[int, int]]] = set()
+
+        for start, end in ranges:
+            # Keep at most two ranges per worker in flight, so finished counts
+            # never pile up faster than they are merged.
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+            pending.add(executor.submit(count_range, path, start, end))
+
+        for future in pending:
+            yield future.result()
+
+
+def _summarize(
+    triples: Iterable[Tuple[int, int]], top_moves: int
+) -> Iterator[PositionSummary]:
+    by_position = itertools.groupby(triples, key=lambda entry: entry[0] >> 6)
+
+    for position_key, group in by_position:
+        results: List[int] = [0] * len(RESULT_CODES)
+        moves: Counter[int] = Counter()
+
+        for key, count in group:
+            results[key & 0b11] += count
+            move: int = key >> 2 & 0xF
+            if move != END_OF_GAME:
+                moves[move] += count
+
+        yield PositionSummary(
+            Position(
+                position_key & (1 << BOARD_SIZE * BOARD_SIZE) - 1,
+                position_key >> BOARD_SIZE * BOARD_SIZE,
+            ),
+            sum(results),
+            results[RESULT_CODES[GameStatus.X_WON]],
+            results[RESULT_CODES[GameStatus.O_WON]],
+            results[RESULT_CODES[GameStatus.DRAW]],
+            tuple(moves.most_common(top_moves)),
+        )
+
+
+def analyze_records(
+    path: str | Path,
+    workers: int | None = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+    top_moves: int = DEFAULT_TOP_MOVES,
+) -> Iterator[PositionSummary]:
+    """Stream per-position statistics for every game in a record file.
+
+    Args:
+        path (str | Path): The record file.
+        workers (int | None): Worker processes. Defaults to one per CPU; 1
+            counts in this process.
+        chunk_bytes (int): Bytes of records counted per task.
+        spill_threshold (int): The most distinct counts held in memory before
+            they are spilled to disk.
+        top_moves (int): The number of most-played continuations per position.
+
+    Raises:
+        RecordFormatError: When the file is not a valid record file.
+        ValueError: When a size or count is not positive.
+
+    Yields:
+        PositionSummary: Statistics for each position reached in any game, in
+            order of position key.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0 or chunk_bytes <= 0 or spill_threshold <= 0:
+        raise ValueError("Workers, chunk size and spill threshold must be positive.")
+
+    path = str(path)
+
+    with tempfile.TemporaryDirectory() as directory:
+        counts: Counter[int] = Counter()
+        spills: List[str] = []
+
+        for chunk_counts in _count_ranges(
+            path, split_records(path, chunk_bytes), workers
+        ):
+            counts.update(chunk_counts)
+
+            if len(counts) > spill_threshold:
+                spills.append(_spill(counts, directory))
+                counts.clear()
+
+        runs: List[Iterator[Tuple[int, int]]] = [_read_spill(spill) for spill in spills]
+        runs.append(iter(sorted(counts.items())))
+        del counts
+
+        yield from _summarize(_merge_sorted(runs), top_moves)
@@ -0,0 +1,170 @@
+"""Vectorized random-playout simulation with NumPy.
+
+Requires the optional `numpy` extra: `pip install -e .[numpy]`.
+
+Every game in a batch starts from a blank board and is advanced in lockstep, one
+ply per array operation, so no `Board` objects are created.
+"""
+
+from typing import Callable, List, NamedTuple
+
+from constants.constants import BOARD_SIZE, WIN_MASKS
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError("Simulation requires NumPy: `pip install -e .[numpy]`.") from e
+
+type Policy = Callable[
+    [npt.NDArray[np.uint16], npt.NDArray[np.uint16], np.random.Generator],
+    npt.NDArray[np.intp],
+]
+
+CELL_COUNT: int = BOARD_SIZE * BOARD_SIZE
+DEFAULT_BATCH_SIZE: int = 1 << 16
+
+_CELL_BITS: npt.NDArray[np.uint16] = (1 << np.arange(CELL_COUNT)).astype(np.uint16)
+_WIN_MASKS: npt.NDArray[np.uint16] = np.array(WIN_MASKS, dtype=np.uint16)
+
+
+class SimulationResult(NamedTuple):
+    """Aggregate results of simulated games.
+
+    `lengths[n]` is the number of games that ended after `n` plies.
+    """
+
+    x_wins: int
+    o_wins: int
+    draws: int
+    lengths: List[int]
+
+    @property
+    def games(self) -> int:
+        """Total number of games played."""
+
+        return self.x_wins + self.o_wins + self.draws
+
+    def describe(self) -> str:
+        """Summarize win/draw/loss rates and game lengths, from X's perspective."""
+
+        games: int = max(self.games, 1)
+        lines: List[str] = [
+            f"Games:  {self.games}",
+            f"X wins: {self.x_wins} ({self.x_wins / games:.2%})",
+            f"Draws:  {self.draws} ({self.draws / games:.2%})",
+            f"O wins: {self.o_wins} ({self.o_wins / games:.2%})",
+            "Game length histogram:",
+        ]
+        lines.extend(
+            f"  {length} plies: {count}"
+            for length, count in enumerate(self.lengths)
+            if count
+        )
+
+        return "\n".join(lines)
+
+
+def random_policy(
+    player_bits: npt.NDArray[np.uint16],
+    opponent_bits: npt.NDArray[np.uint16],
+    rng: np.random.Generator,
+) -> npt.NDArray[np.intp]:
+    """Pick a uniformly random legal cell index for each game.
+
+    Args:
+        player_bits (npt.NDArray[np.uint16]): The bitboard of the player to move.
+        opponent_bits (npt.NDArray[np.uint16]): The bitboard of the other player.
+        rng (np.random.Generator): The random number generator.
+
+    Returns:
+        npt.NDArray[np.intp]: One cell index (`row * BOARD_SIZE + col`) per game.
+    """
+
+    legal = ((player_bits | opponent_bits)[:, None] & _CELL_BITS) == 0
+    legal_counts = legal.sum(axis=1)
+    picks = (rng.random(len(legal_counts)) * legal_counts).astype(np.intp)
+
+    cells: npt.NDArray[np.intp] = (legal.cumsum(axis=1) > picks[:, None]).argmax(axis=1)
+    return cells
+
+
+def _simulate_batch(
+    games: int, x_policy: Policy, o_policy: Policy, rng: np.random.Generator
+) -> SimulationResult:
+    x_bits = np.zeros(games, dtype=np.uint16)
+    o_bits = np.zeros(games, dtype=np.uint16)
+    active = np.arange(games)
+    x_wins: int = 0
+    o_wins: int = 0
+    lengths: List[int] = [0] * (CELL_COUNT + 1)
+
+    for ply in range(CELL_COUNT):
+        x_to_move: bool = ply % 2 == 0
+        mover_bits, other_bits = (x_bits, o_bits) if x_to_move else (o_bits, x_bits)
+        policy: Policy = x_policy if x_to_move else o_policy
+
+        cells = policy(mover_bits[active], other_bits[active], rng)
+        mover_bits[active] |= _CELL_BITS[cells]
+
+        won = ((mover_bits[active][:, None] & _WIN_MASKS) == _WIN_MASKS).any(axis=1)
+        finished: int = int(won.sum())
+
+        if x_to_move:
+            x_wins += finished
+        else:
+            o_wins += finished
+        lengths[ply + 1] += finished
+
+        active = active[~won]
+
+    lengths[CELL_COUNT] += len(active)
+
+    return SimulationResult(x_wins, o_wins, len(active), lengths)
+
+
+def simulate(
+    games: int,
+    x_policy: Policy = random_policy,
+    o_policy: Policy = random_policy,
+    seed: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> SimulationResult:
+    """Play `games` games from a blank board, advancing each batch in lockstep.
+
+    Args:
+        games (int): The number of games to play.
+        x_policy (Policy): Picks X's moves. Defaults to uniformly random.
+        o_policy (Policy): Picks O's moves. Defaults to uniformly random.
+        seed (int | None): Seed for the random number generator.
+        batch_size (int): The most games held in memory at once.
+
+    Raises:
+        ValueError: If `games` is negative or `batch_size` is not positive.
+
+    Returns:
+        SimulationResult: Aggregate results over all games.
+    """
+
+    if games < 0:
+        raise ValueError(f"Invalid number of games: {games!r}.")
+    if batch_size <= 0:
+        raise ValueError(f"Invalid batch size: {batch_size!r}.")
+
+    rng: np.random.Generator = np.random.default_rng(seed)
+    x_wins: int = 0
+    o_wins: int = 0
+    draws: int = 0
+    lengths: List[int] = [0] * (CELL_COUNT + 1)
+
+    for start in range(0, games, batch_size):
+        result = _simulate_batch(
+            min(batch_size, games - start), x_policy, o_policy, rng
+        )
+
+        x_wins += result.x_wins
+        o_wins += result.o_wins
+        draws += result.draws
+        lengths = [a + b for a, b in zip(lengths, result.lengths, strict=True)]
+
+    return SimulationResult(x_wins, o_wins, draws, lengths)
@@ -1,25 +1,38 @@
 """Main game loop functions."""
 
-from typing import Union, cast
+from typing import Mapping, Protocol, Sequence, Union
 
-from constants.constants import PlayerMarker
+from constants.constants import PlayerMarker, Cell
 
-from src.models.board import Board
+from src.models.board import Board, GameStatus
+
+from src.players import Player
 
 from src.ui.prompts import prompt
 
+from src.ui.renderer import TerminalRenderer, get_renderer
+
 from src.utils.colorize import magenta, yellow
 
 
+class GameObserver(Protocol):
+    """Receives the events of games played by `loop_game`."""
+
+    def on_move(self, board: Board, cell: Cell, player_marker: PlayerMarker) -> None:
+        """Called after `player_marker` has played at `cell`."""
+
+    def on_game_end(self, board: Board) -> None:
+        """Called once the game is won or drawn."""
+
+
 def _end_game(board: Board, winner: Union[PlayerMarker, None]) -> None:
     """End game if result is a draw or win."""
 
-    print(f"\n{board.stringify_board()}")
+    result: str = "   Draw!   " if winner is None else f"  {winner} wins!  "
+    renderer: TerminalRenderer = get_renderer()
 
-    if winner is None:
-        print(f"\n{yellow('   Draw!   ')}\n")
-    else:
-        print(f"\n{yellow(f'  {winner} wins!  ')}\n")
+    renderer.draw(board, f"{yellow(result)}\n\n")
+    renderer.reset()
 
 
 def display_title() -> None:
@@ -28,21 +41,35 @@ def display_title() -> None:
     print(magenta("\nTIC-TAC-TOE"))
 
 
-def loop_game(board: Board) -> None:
-    """Execute main game loop."""
+def loop_game(
+    board: Board,
+    players: Mapping[PlayerMarker, Player] | None = None,
+    observers: Sequence[GameObserver] = (),
+) -> None:
+    """Execute main game loop.
 
-    player: PlayerMarker | None = None
+    Args:
+        board (Board): The game board.
+        players (Mapping[PlayerMarker, Player] | None): The player type for "X"
+            and for "O". Defaults to two human players.
+        observers (Sequence[GameObserver]): Notified of every move and of the
+            end of the game.
+    """
 
-    win, winner = board.check_win()
+    if players is None:
+        players = {"X": prompt, "O": prompt}
 
-    while not win and winner is None:
-        if board.check_draw():
-            _end_game(board, None)
+    while board.get_status() is GameStatus.ONGOING:
+        player: PlayerMarker = board.get_player_to_move()
+        players[player](player, board)
 
-        player = "X" if player == "O" or player is None else "O"
-        prompt(player, board)
+        last_move: Cell | None = board.get_last_move()
+        if last_move is not None:
+            for observer in observers:
+                observer.on_move(board, last_move, player)
 
-        win, winner = board.check_win()
+    for observer in observers:
+        observer.on_game_end(board)
 
-    winner = cast(PlayerMarker, winner)
+    _, winner = board.check_win()
     _end_game(board, winner)
@@ -0,0 +1,322 @@
+"""Opt-in latency instrumentation.
+
+Nothing here runs unless `install` is called. It swaps timed wrappers in for the
+instrumented functions and methods, so an uninstrumented process runs the
+original code with no checks added. `uninstall` swaps the originals back.
+
+Instrumented calls, each kept as a latency histogram:
+
+- `board.make_move`, `board.try_move`: move validation and bookkeeping.
+- `board.update_status`: the win and draw detection run after every move.
+- `board.get_status`, `board.check_win`, `board.check_draw`: result checks.
+- `render.draw`: drawing a frame, whether in full or redrawn in place.
+- `prompt.input`: time spent waiting for a human to type a move.
+- `turn.<player type>`: a whole turn of each player type, as run by `loop_game`.
+
+Snapshots also carry the terminal renderer's frame and byte counters.
+"""
+
+import atexit
+import bisect
+import builtins
+import functools
+import json
+import signal
+import sys
+import time
+
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    TextIO,
+    Tuple,
+    Union,
+    cast,
+)
+
+from src import game_loop, players
+
+from src.models.board import Board
+
+from src.ui import prompts
+
+from src.ui.renderer import RenderStats, TerminalRenderer, get_renderer
+
+FORMATS: Tuple[str, ...] = ("json", "prometheus")
+ENV_VAR: str = "TTT_INSTRUMENT"
+METRIC_PREFIX: str = "tictactoe"
+
+# Upper bounds, in seconds, of the histogram buckets: 1, 2.5 and 5 per decade
+# from a microsecond to ten seconds.
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(
+    mantissa * 10.0**exponent
+    for exponent in range(-6, 1)
+    for mantissa in (1.0, 2.5, 5.0)
+) + (10.0,)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets."""
+
+    _counts: List[int]
+    _sum: float
+    _min: float
+    _max: float
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._sum: float = 0.0
+        self._min: float = float("inf")
+        self._max: float = 0.0
+
+    def clear(self) -> None:
+        """Discard every recorded call."""
+
+        self._counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._sum = 0.0
+        self._min = float("inf")
+        self._max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one call that took `seconds`."""
+
+        self._counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self._sum += seconds
+        self._min = min(self._min, seconds)
+        self._max = max(self._max, seconds)
+
+    def get_count(self) -> int:
+        """Get the number of recorded calls."""
+
+        return sum(self._counts)
+
+    def get_cumulative_counts(self) -> List[Tuple[float, int]]:
+        """Get (upper bound, calls at or under it) per bucket, ending with +Inf."""
+
+        cumulative: List[Tuple[float, int]] = []
+        total: int = 0
+
+        for bound, count in zip(
+            BUCKET_BOUNDS + (float("inf"),), self._counts, strict=True
+        ):
+            total += count
+            cumulative.append((bound, total))
+
+        return cumulative
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the histogram as plain data."""
+
+        count: int = self.get_count()
+
+        return {
+            "count": count,
+            "sum": self._sum,
+            "min": self._min if count else 0.0,
+            "max": self._max,
+            "buckets": {
+                ("+Inf" if bound == float("inf") else repr(bound)): total
+                for bound, total in self.get_cumulative_counts()
+            },
+        }
+
+
+HISTOGRAMS: Dict[str, Histogram] = {}
+
+_MISSING: object = object()
+
+_originals: List[Tuple[Any, str, Any]] = []
+
+
+def get_histogram(name: str) -> Histogram:
+    """Get the histogram called `name`, creating it if needed."""
+
+    return HISTOGRAMS.setdefault(name, Histogram())
+
+
+def timed(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap `function` so every call is recorded in histogram `name`."""
+
+    histogram: Histogram = get_histogram(name)
+    perf_counter: Callable[[], float] = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start: float = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            histogram.observe(perf_counter() - start)
+
+    return wrapper
+
+
+def _swap(owner: Any, attribute: str, name: str, default: Any = _MISSING) -> None:
+    original: Any = getattr(owner, attribute, _MISSING)
+    _originals.append((owner, attribute, original))
+    setattr(
+        owner, attribute, timed(name, default if original is _MISSING else original)
+    )
+
+
+def _swap_item(owner: MutableMapping[str, Any], key: str, name: str) -> None:
+    original: Any = owner[key]
+    _originals.append((owner, key, original))
+    owner[key] = timed(name, original)
+
+
+def is_installed() -> bool:
+    """Whether the timed wrappers are in place."""
+
+    return bool(_originals)
+
+
+def install() -> None:
+    """Swap timed wrappers in for the instrumented calls.
+
+    Calls already bound to a name before `install`, such as a player looked up
+    from `PLAYER_TYPES` earlier, are not instrumented.
+    """
+
+    if is_installed():
+        return
+
+    for method in (
+        "make_move",
+        "try_move",
+        "get_status",
+        "check_win",
+        "check_draw",
+    ):
+        _swap(Board, method, f"board.{method}")
+
+    _swap(Board, "_update_status", "board.update_status")
+    _swap(TerminalRenderer, "draw", "render.draw")
+
+    # `prompt` calls the builtin `input`; a module global of the same name
+    # shadows it for that module only.
+    _swap(prompts, "input", "prompt.input", builtins.input)
+    _swap(game_loop, "prompt", "turn.human")
+
+    player_types = cast(MutableMapping[str, Any], players.PLAYER_TYPES)
+    for player_type in list(player_types):
+        _swap_item(player_types, player_type, f"turn.{player_type}")
+
+
+def uninstall() -> None:
+    """Restore the original calls. Recorded histograms are kept."""
+
+    while _originals:
+        owner, attribute, original = _originals.pop()
+
+        if isinstance(owner, dict):
+            owner[attribute] = original
+        elif original is _MISSING:
+            delattr(owner, attribute)
+        else:
+            setattr(owner, attribute, original)
+
+
+def reset() -> None:
+    """Discard the calls recorded in every histogram."""
+
+    for histogram in HISTOGRAMS.values():
+        histogram.clear()
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Get every histogram as plain data, keyed by name."""
+
+    return {
+        name: histogram.snapshot() for name, histogram in sorted(HISTOGRAMS.items())
+    }
+
+
+def format_json() -> str:
+    """Render every histogram, and the terminal renderer's counters, as JSON."""
+
+    return json.dumps(
+        {
+            "timestamp": time.time(),
+            "histograms": snapshot(),
+            "render": get_renderer().get_stats()._asdict(),
+        },
+        indent=2,
+    )
+
+
+def _metric_name(name: str) -> str:
+    return f"{METRIC_PREFIX}_{name.replace('.', '_')}_seconds"
+
+
+def format_prometheus() -> str:
+    """Render every histogram and the renderer's counters as Prometheus text."""
+
+    lines: List[str] = []
+
+    for name, histogram in sorted(HISTOGRAMS.items()):
+        metric: str = _metric_name(name)
+        data: Dict[str, Any] = histogram.snapshot()
+
+        lines.append(f"# HELP {metric} Latency of {name} calls.")
+        lines.append(f"# TYPE {metric} histogram")
+        lines.extend(
+            f'{metric}_bucket{{le="{bound}"}} {total}'
+            for bound, total in data["buckets"].items()
+        )
+        lines.append(f"{metric}_sum {data['sum']!r}")
+        lines.append(f"{metric}_count {data['count']}")
+
+    render_stats: RenderStats = get_renderer().get_stats()
+    for counter, value, description in (
+        ("render_frames", render_stats.frames, "Frames drawn"),
+        ("render_bytes", render_stats.bytes_written, "Bytes written for frames"),
+    ):
+        lines.append(f"# HELP {METRIC_PREFIX}_{counter}_total {description}.")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{counter}_total counter")
+        lines.append(f"{METRIC_PREFIX}_{counter}_total {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def dump(output_format: str, output: Union[Path, None] = None) -> None:
+    """Write a snapshot of every histogram.
+
+    Args:
+        output_format (str): "json" or "prometheus".
+        output (Union[Path, None]): The file to overwrite, or `None` for stderr.
+    """
+
+    text: str = format_json() if output_format == "json" else format_prometheus()
+
+    if output is None:
+        stream: TextIO = sys.stderr
+        stream.write(text)
+        stream.flush()
+    else:
+        output.write_text(text)
+
+
+def enable(output_format: str, output: Union[Path, None] = None) -> None:
+    """Install instrumentation and dump snapshots at exit and on SIGUSR1.
+
+    Args:
+        output_format (str): "json" or "prometheus".
+        output (Union[Path, None]): The file to overwrite, or `None` for stderr.
+
+    Raises:
+        ValueError: When `output_format` is not one of `FORMATS`.
+    """
+
+    if output_format not in FORMATS:
+        raise ValueError(f"Invalid instrumentation format: {output_format!r}.")
+
+    install()
+    atexit.register(dump, output_format, output)
+
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: dump(output_format, output))
@@ -1,19 +1,417 @@
 """CLI Tic-Tac-Toe."""
 
+import argparse
+import os
 import sys
 
-from src.models.board import Board
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, List, Sequence
 
-from .game_loop import display_title, loop_game
+from constants.constants import PlayerMarker, Cell, BOARD_SIZE, WIN_LENGTH
 
+from src.ai.strong_solver import DEFAULT_CHECKPOINT_INTERVAL
 
-def main() -> None:
+from src.instrumentation import ENV_VAR, FORMATS, enable
+
+from src.models.board import Board, MoveResult
+
+from src.models.cell_keys import cell_key_to_cell
+
+from src.players import PLAYER_TYPES, Player
+
+from src.server import DEFAULT_HOST, DEFAULT_PORT, run_server
+
+from src.storage.records import RecordWriter
+
+from src.storage.sessions import GameSession, SessionNotFoundError, SessionStore
+
+from .game_loop import GameObserver, display_title, loop_game
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="tic-tac-toe", description=__doc__)
+    parser.add_argument(
+        "-x",
+        "--player-x",
+        choices=sorted(PLAYER_TYPES),
+        default="human",
+        help="who plays X (default: human)",
+    )
+    parser.add_argument(
+        "-o",
+        "--player-o",
+        choices=sorted(PLAYER_TYPES),
+        default="human",
+        help="who plays O (default: human)",
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=BOARD_SIZE,
+        help=f"number of columns (default: {BOARD_SIZE})",
+    )
+    parser.add_argument(
+        "--height",
+        type=int,
+        default=BOARD_SIZE,
+        help=f"number of rows (default: {BOARD_SIZE})",
+    )
+    parser.add_argument(
+        "--win-length",
+        type=int,
+        default=WIN_LENGTH,
+        help=f"marks in a row needed to win (default: {WIN_LENGTH})",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="adjudicate games read from stdin, one line of cell keys per game",
+    )
+    parser.add_argument(
+        "--simulate",
+        type=int,
+        metavar="GAMES",
+        help="play GAMES random games headlessly and report results (needs numpy)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="host networked games for clients over TCP instead of playing locally",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help=f"interface for --serve (default: {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"port for --serve (default: {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="PATH",
+        help="append the game to the binary game record file PATH",
+    )
+    parser.add_argument(
+        "--session-db",
+        type=Path,
+        metavar="PATH",
+        help="log every move to the SQLite session database PATH",
+    )
+    parser.add_argument(
+        "--resume",
+        type=int,
+        metavar="ID",
+        help="resume game ID from the --session-db database",
+    )
+    parser.add_argument(
+        "--analyze",
+        type=Path,
+        metavar="PATH",
+        help="print per-position statistics for the games in record file PATH",
+    )
+    parser.add_argument(
+        "--perft",
+        nargs="?",
+        const="",
+        metavar="KEYS",
+        help=(
+            "count every legal game from the position after the cell keys KEYS "
+            "(e.g. '5 1'), or from the empty board, and check known totals"
+        ),
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        help="the most plies --perft looks ahead (default: to the end of every game)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "processes for --analyze, --perft, --build-packed-table and mcts "
+            "(default: one per CPU)"
+        ),
+    )
+    parser.add_argument(
+        "--tablebase",
+        type=Path,
+        metavar="PATH",
+        help="answer the solver player from the tablebase file PATH",
+    )
+    parser.add_argument(
+        "--packed-table",
+        type=Path,
+        metavar="PATH",
+        help="answer the perfect player from the packed table file PATH",
+    )
+    parser.add_argument(
+        "--build-packed-table",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "solve every position of the board set by --width, --height and "
+            "--win-length (up to 16 cells) into the packed table PATH, resuming "
+            "from a checkpoint there"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=DEFAULT_CHECKPOINT_INTERVAL,
+        metavar="SECONDS",
+        help=(
+            "seconds between checkpoints of --build-packed-table "
+            f"(default: {DEFAULT_CHECKPOINT_INTERVAL:g})"
+        ),
+    )
+    parser.add_argument(
+        "--build-tablebase",
+        type=Path,
+        metavar="PATH",
+        help="solve every position and write the tablebase file PATH",
+    )
+    parser.add_argument(
+        "--verify-tablebase",
+        type=Path,
+        metavar="PATH",
+        help="re-solve every position and report entries of PATH that differ",
+    )
+    parser.add_argument(
+        "--instrument",
+        choices=FORMATS,
+        default=os.environ.get(ENV_VAR) or None,
+        help=(
+            "time hot-path calls and dump latency histograms in this format at "
+            f"exit and on SIGUSR1 (default: ${ENV_VAR})"
+        ),
+    )
+    parser.add_argument(
+        "--instrument-output",
+        type=Path,
+        metavar="PATH",
+        help="file for --instrument snapshots (default: stderr)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="random seed for --simulate",
+    )
+
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    try:
+        args.board = Board(
+            width=args.width, height=args.height, win_length=args.win_length
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not args.board.is_standard() and "solver" in (args.player_x, args.player_o):
+        parser.error("the solver only plays on the standard 3x3 board")
+
+    if "perfect" in (args.player_x, args.player_o) and args.packed_table is None:
+        parser.error("the perfect player needs --packed-table")
+
+    if args.instrument is not None and args.instrument not in FORMATS:
+        parser.error(f"${ENV_VAR} must be one of: {', '.join(FORMATS)}")
+
+    if not args.board.is_standard() and args.record is not None:
+        parser.error("only games on the standard 3x3 board can be recorded")
+
+    if args.resume is not None and args.session_db is None:
+        parser.error("--resume needs --session-db")
+
+    if args.resume is not None and args.record is not None:
+        parser.error("a resumed game cannot be recorded")
+
+    return args
+
+
+def main(argv: Sequence[str] | None = None) -> None:
     """Execute game."""
 
-    board: Board = Board()
+    args: argparse.Namespace = _parse_args(argv)
+
+    if args.instrument is not None:
+        enable(args.instrument, args.instrument_output)
+
+    if args.serve:
+        if args.session_db is None:
+            run_server(args.host, args.port)
+        else:
+            with SessionStore(args.session_db) as sessions:
+                run_server(args.host, args.port, sessions)
+        sys.exit(0)
+
+    if args.batch:
+        from src.adjudicate import Adjudicator
+
+        width, height = args.board.get_size()
+        Adjudicator(width, height, args.board.get_win_length()).run(
+            sys.stdin.buffer, sys.stdout.buffer
+        )
+        sys.exit(0)
+
+    if args.simulate is not None:
+        from src.analysis.simulate import simulate
+
+        print(simulate(args.simulate, seed=args.seed).describe())
+        sys.exit(0)
+
+    if args.build_packed_table is not None:
+        from src.ai.strong_solver import solve_table
+        from src.storage.tablebase import TablebaseError
+
+        width, height = args.board.get_size()
+        try:
+            solved = solve_table(
+                args.build_packed_table,
+                width,
+                height,
+                args.board.get_win_length(),
+                args.workers or os.cpu_count() or 1,
+                args.checkpoint_interval,
+            )
+        except (OSError, TablebaseError, ValueError) as e:
+            sys.exit(str(e))
+        except KeyboardInterrupt:
+            sys.exit(
+                f"Interrupted; resume from the checkpoint at {args.build_packed_table}."
+            )
+
+        print(solved.describe())
+        sys.exit(0)
+
+    if args.packed_table is not None:
+        from src.ai.strong_solver import SolvedTable, set_default_table
+        from src.storage.tablebase import TablebaseError
+
+        try:
+            table: SolvedTable = SolvedTable(args.packed_table)
+        except (OSError, TablebaseError) as e:
+            sys.exit(str(e))
+
+        width, height = args.board.get_size()
+        info = table.get_info()
+
+        if info.get_rules() != (width, height, args.board.get_win_length()):
+            sys.exit(
+                f"{args.packed_table} solves {info.width}x{info.height} boards with "
+                f"{info.win_length} in a row; pass them as --width, --height and "
+                "--win-length."
+            )
+        if not info.complete:
+            sys.exit(
+                f"{args.packed_table} is an unfinished checkpoint; finish it with "
+                "--build-packed-table."
+            )
+
+        set_default_table(table)
+
+    if args.build_tablebase is not None:
+        from src.ai.solver import build_tablebase_entries
+        from src.storage.tablebase import write_tablebase
+
+        write_tablebase(args.build_tablebase, build_tablebase_entries())
+        sys.exit(0)
+
+    if args.verify_tablebase is not None:
+        from src.ai.solver import verify_tablebase
+        from src.storage.tablebase import Tablebase, TablebaseError
+
+        try:
+            with Tablebase(args.verify_tablebase) as tablebase:
+                mismatches = verify_tablebase(tablebase)
+        except (OSError, TablebaseError) as e:
+            sys.exit(str(e))
+
+        for index in mismatches:
+            print(f"entry {index} differs")
+        print(f"{len(mismatches)} mismatched entries")
+        sys.exit(1 if mismatches else 0)
+
+    if args.tablebase is not None:
+        from src.ai.solver import use_tablebase
+        from src.storage.tablebase import TablebaseError
+
+        try:
+            use_tablebase(args.tablebase)
+        except (OSError, TablebaseError) as e:
+            sys.exit(str(e))
+
+    players: Dict[PlayerMarker, Player] = {
+        "X": PLAYER_TYPES[args.player_x],
+        "O": PLAYER_TYPES[args.player_o],
+    }
+
+    if args.perft is not None:
+        from src.analysis.perft import perft, verify_standard
+
+        start_board: Board = args.board
+        for cell_key in args.perft.split():
+            cell: Cell | None = cell_key_to_cell(cell_key, *start_board.get_size())
+            if cell is None or start_board.push(cell) is not MoveResult.OK:
+                sys.exit(f"Illegal move in --perft: {cell_key!r}.")
+
+        result = perft(start_board, args.depth, args.workers or os.cpu_count() or 1)
+        print(result.describe())
+
+        if (
+            start_board.is_standard()
+            and start_board.get_move_count() == 0
+            and args.depth is None
+        ):
+            failures = verify_standard(result)
+            for failure in failures:
+                print(f"Mismatch in {failure}")
+            print("Known totals: " + ("FAILED" if failures else "verified"))
+            sys.exit(1 if failures else 0)
+        sys.exit(0)
+
+    if args.analyze is not None:
+        from src.analysis.position_stats import analyze_records
+
+        for summary in analyze_records(args.analyze, args.workers):
+            print(summary.describe())
+        sys.exit(0)
+
+    if "mcts" in (args.player_x, args.player_o):
+        from src.ai.mcts import MonteCarloTreeSearch, set_default_search
+
+        set_default_search(
+            MonteCarloTreeSearch(workers=args.workers or os.cpu_count() or 1)
+        )
+
+    with ExitStack() as stack:
+        board: Board = args.board
+        observers: List[GameObserver] = []
+
+        if args.session_db is not None:
+            store: SessionStore = stack.enter_context(SessionStore(args.session_db))
+
+            if args.resume is not None:
+                try:
+                    board = store.load_game(args.resume)
+                except SessionNotFoundError as e:
+                    sys.exit(str(e))
+
+            session: GameSession = store.open_session(board, args.resume)
+            observers.append(session)
+
+        if args.record is not None:
+            observers.append(stack.enter_context(RecordWriter(args.record)))
+
+        display_title()
+        if args.session_db is not None:
+            print(f"Game {session.get_id()}")
+
+        loop_game(board, players, observers)
 
-    display_title()
-    loop_game(board)
     sys.exit(0)
 
 
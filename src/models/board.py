@@ -1,59 +1,204 @@
 """Game board."""
 
-from copy import deepcopy
-from typing import Set, List, Tuple, Union, cast
+from enum import Enum, auto
+from functools import _CacheInfo, cache, lru_cache
+from typing import List, Tuple, Union
 
 from constants.constants import (
     PlayerMarker,
     CellValue,
-    RowsCols,
     Cell,
+    PositionKey,
     BOARD_SIZE,
-    GRID_TOP,
+    WIN_LENGTH,
+    GRID_TOP_JOINER,
     GRID_COL_JOINER,
-    GRID_ROW_JOINER,
-    GRID_BOTTOM,
+    GRID_CROSS_JOINER,
+    GRID_BOTTOM_JOINER,
+    GRID_ROW_LINE,
+    MIN_CELL_WIDTH,
+    VALID_MOVES,
+    WIN_MASKS,
+    CELL_WIN_MASKS,
 )
 
+from src.models.cell_keys import cell_to_cell_key
+
+from src.models.errors import InvalidCellError, InvalidMoveError
+
+from src.models.position import Position
+
+from src.models.symmetry import canonicalize
+
+from src.models.zobrist import ZobristKeys, get_zobrist_keys, hash_bitboards
+
 from src.utils.colorize import grey, red, green
 
 
-class InvalidCellError(Exception):
-    """Custom error for when an invalid cell is requested."""
+class GameStatus(Enum):
+    """Status enum for the state of a game."""
 
-    _message: str
+    ONGOING = auto()
+    X_WON = auto()
+    O_WON = auto()
+    DRAW = auto()
 
-    def __init__(self, message: str = "Invalid cell."):
-        self._message: str = message
-        super().__init__(self._message)
 
+class MoveResult(Enum):
+    """Outcome of `Board.try_move`."""
 
-class InvalidMoveError(Exception):
-    """Custom error for when an invalid move is attempted."""
+    OK = auto()
+    INVALID_CELL = auto()
+    OCCUPIED = auto()
+    INVALID_MARKER = auto()
 
-    _message: str
 
-    def __init__(self, message: str = "Invalid move."):
-        self._message: str = message
-        super().__init__(self._message)
+# Directions scanned for a win through the last move: across, down, and both
+# diagonals. Each is scanned both ways.
+WIN_DIRECTIONS: Tuple[Tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
 
+RENDER_CACHE_SIZE: int = 1024
 
-BLANK_BOARD: List[List[CellValue]] = [
-    [None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
-]
 
-VALID_MOVES: Set[PlayerMarker] = {"X", "O"}
+def _cell_width(width: int, height: int) -> int:
+    return max(MIN_CELL_WIDTH, len(str(width * height)) + 2)
 
 
-class Board:
-    """Game board."""
+# `_cell_fragments(width, height)[row * width + col]` holds the colorized display
+# of that cell when blank, when "X" and when "O".
+@cache
+def _cell_fragments(width: int, height: int) -> Tuple[Tuple[str, str, str], ...]:
+    cell_width: int = _cell_width(width, height)
+
+    return tuple(
+        (
+            grey(f"{cell_to_cell_key((row, col), width, height):^{cell_width}}"),
+            red(f"{'X':^{cell_width}}"),
+            green(f"{'O':^{cell_width}}"),
+        )
+        for row in range(height)
+        for col in range(width)
+    )
+
+
+# The top, row joiner and bottom of the grid.
+@cache
+def _grid_parts(width: int, height: int) -> Tuple[str, str, str]:
+    cell_width: int = _cell_width(width, height)
+    blank: str = " " * cell_width
+
+    return (
+        f"{GRID_TOP_JOINER.join([blank] * width)}\n",
+        f"\n{GRID_CROSS_JOINER.join([GRID_ROW_LINE * cell_width] * width)}\n",
+        f"\n{GRID_BOTTOM_JOINER.join([blank] * width)}",
+    )
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_board(x_bits: int, o_bits: int, width: int, height: int) -> str:
+    cell_fragments: Tuple[Tuple[str, str, str], ...] = _cell_fragments(width, height)
+    grid_top, grid_row_joiner, grid_bottom = _grid_parts(width, height)
+
+    rows: List[str] = []
+    for row in range(height):
+        cols: List[str] = []
 
-    _board: List[List[CellValue]]
+        for col in range(width):
+            index: int = row * width + col
+            blank, x_display, o_display = cell_fragments[index]
+
+            if x_bits >> index & 1:
+                cols.append(x_display)
+            elif o_bits >> index & 1:
+                cols.append(o_display)
+            else:
+                cols.append(blank)
+
+        rows.append(GRID_COL_JOINER.join(cols))
+
+    board_display: str = f"{grid_top}{grid_row_joiner.join(rows)}{grid_bottom}"
+    return board_display
+
+
+def get_render_cache_info() -> _CacheInfo:
+    """Get hit, miss and size counters for the board render cache.
+
+    Returns:
+        _CacheInfo: The `hits`, `misses`, `maxsize` and `currsize` of the cache.
+    """
+
+    return _render_board.cache_info()
+
+
+def clear_render_cache() -> None:
+    """Empty the board render cache and reset its counters."""
+
+    _render_board.cache_clear()
+
+
+class Board:
+    """Game board.
+
+    Board state is held as two bitboards, one for "X" and one for "O", where bit
+    `row * width + col` is set when that player has played at (`row`, `col`).
+    The game status and a 64-bit Zobrist hash of the position are tracked
+    incrementally as moves are made.
+
+    Every move is kept on a move stack, so `pop` takes back the last one in
+    O(1), restoring the status and hash along with the bitboards. Search code
+    can make and unmake moves on one board with `push` and `pop` instead of
+    copying it per node.
+
+    The standard board is 3x3 with three in a row to win. Other sizes and win
+    lengths (m,n,k-games) are set per board; wins on them are found by scanning
+    only the lines through the last move.
+    """
+
+    _width: int
+    _height: int
+    _win_length: int
+    _cell_win_masks: Union[Tuple[Tuple[int, ...], ...], None]
+    _x_bits: int
+    _o_bits: int
+    _move_count: int
+    _last_move: Union[Cell, None]
+    _status: GameStatus
+    _move_stack: List[Tuple[int, GameStatus, Union[Cell, None]]]
+    _zobrist_keys: ZobristKeys
+    _hash: int
 
     def __init__(
-        self, starting_state: List[List[CellValue]] = deepcopy(BLANK_BOARD)
+        self,
+        starting_state: Union[List[List[CellValue]], None] = None,
+        width: int = BOARD_SIZE,
+        height: int = BOARD_SIZE,
+        win_length: int = WIN_LENGTH,
     ) -> None:
-        self._board: List[List[CellValue]] = starting_state
+        if width < 1 or height < 1:
+            raise ValueError(f"Invalid board size: {width!r}x{height!r}.")
+
+        if not 1 <= win_length <= max(width, height):
+            raise ValueError(f"Invalid win length: {win_length!r}.")
+
+        self._width: int = width
+        self._height: int = height
+        self._win_length: int = win_length
+        self._cell_win_masks: Union[Tuple[Tuple[int, ...], ...], None] = (
+            CELL_WIN_MASKS if self.is_standard() else None
+        )
+
+        self._x_bits: int = 0
+        self._o_bits: int = 0
+        self._last_move: Union[Cell, None] = None
+        self._move_stack: List[Tuple[int, GameStatus, Union[Cell, None]]] = []
+
+        if starting_state is not None:
+            self._load_state(starting_state)
+
+        self._move_count: int = (self._x_bits | self._o_bits).bit_count()
+        self._status: GameStatus = self._scan_status()
+        self._zobrist_keys: ZobristKeys = get_zobrist_keys(width * height)
+        self._hash: int = hash_bitboards(self._x_bits, self._o_bits, self._zobrist_keys)
 
     def __str__(self) -> str:
         return "Board"
@@ -61,15 +206,317 @@ class Board:
     def __repr__(self) -> str:
         return "Board()"
 
+    def _load_state(self, starting_state: List[List[CellValue]]) -> None:
+        if len(starting_state) != self._height or any(
+            len(row_values) != self._width for row_values in starting_state
+        ):
+            raise ValueError(
+                f"Starting state must be {self._height} rows of {self._width} cells."
+            )
+
+        for row, row_values in enumerate(starting_state):
+            for col, value in enumerate(row_values):
+                bit: int = 1 << (row * self._width + col)
+
+                match value:
+                    case None:
+                        pass
+                    case "X":
+                        self._x_bits |= bit
+                    case "O":
+                        self._o_bits |= bit
+                    case _:
+                        raise ValueError(f"Invalid value: {value!r}.")
+
     def _is_valid_cell(self, cell: Cell) -> bool:
         row, col = cell
 
-        return 0 <= row <= BOARD_SIZE and 0 <= col <= BOARD_SIZE
+        return 0 <= row < self._height and 0 <= col < self._width
+
+    def _cell_bit(self, cell: Cell) -> int:
+        row, col = cell
+
+        return 1 << (row * self._width + col)
+
+    def _is_win_at(self, player_bits: int, index: int) -> bool:
+        """Whether `player_bits` has `win_length` in a row through cell `index`.
+
+        Scans at most `win_length - 1` cells each way along each direction.
+        """
 
-    def _is_blank_cell(self, cell: Cell) -> bool:
+        width: int = self._width
+        height: int = self._height
+        win_length: int = self._win_length
+        row, col = divmod(index, width)
+
+        for d_row, d_col in WIN_DIRECTIONS:
+            run: int = 1
+
+            for step_row, step_col in ((d_row, d_col), (-d_row, -d_col)):
+                r: int = row + step_row
+                c: int = col + step_col
+
+                while (
+                    run < win_length
+                    and 0 <= r < height
+                    and 0 <= c < width
+                    and player_bits >> (r * width + c) & 1
+                ):
+                    run += 1
+                    r += step_row
+                    c += step_col
+
+            if run >= win_length:
+                return True
+
+        return False
+
+    def _scan_status(self) -> GameStatus:
+        if self._cell_win_masks is not None:
+            for mask in WIN_MASKS:
+                if self._x_bits & mask == mask:
+                    return GameStatus.X_WON
+                if self._o_bits & mask == mask:
+                    return GameStatus.O_WON
+        else:
+            for index in range(self._width * self._height):
+                if self._x_bits >> index & 1 and self._is_win_at(self._x_bits, index):
+                    return GameStatus.X_WON
+                if self._o_bits >> index & 1 and self._is_win_at(self._o_bits, index):
+                    return GameStatus.O_WON
+
+        if self._move_count == self._width * self._height:
+            return GameStatus.DRAW
+        return GameStatus.ONGOING
+
+    def _update_status(self, index: int, move_value: PlayerMarker) -> None:
+        self._move_count += 1
+
+        if self._status is not GameStatus.ONGOING:
+            return
+
+        player_bits: int = self._x_bits if move_value == "X" else self._o_bits
+
+        if self.is_win_through(player_bits, index):
+            self._status = GameStatus.X_WON if move_value == "X" else GameStatus.O_WON
+        elif self._move_count == self._width * self._height:
+            self._status = GameStatus.DRAW
+
+    def _apply_move(self, cell: Cell, move_value: PlayerMarker) -> MoveResult:
         row, col = cell
 
-        return self._board[row][col] is None
+        if not (0 <= row < self._height and 0 <= col < self._width):
+            return MoveResult.INVALID_CELL
+
+        index: int = row * self._width + col
+
+        if (self._x_bits | self._o_bits) >> index & 1:
+            return MoveResult.OCCUPIED
+
+        if move_value not in VALID_MOVES:
+            return MoveResult.INVALID_MARKER
+
+        if move_value == "X":
+            self._x_bits |= 1 << index
+            self._hash ^= self._zobrist_keys[0][index]
+        else:
+            self._o_bits |= 1 << index
+            self._hash ^= self._zobrist_keys[1][index]
+
+        self._move_stack.append((index, self._status, self._last_move))
+        self._last_move = cell
+        self._update_status(index, move_value)
+
+        return MoveResult.OK
+
+    def _require_standard(self, feature: str) -> None:
+        if not self.is_standard():
+            raise ValueError(f"{feature} is only supported on the standard board.")
+
+    def is_standard(self) -> bool:
+        """Whether this is the standard 3x3, three-in-a-row board."""
+
+        return (self._width, self._height, self._win_length) == (
+            BOARD_SIZE,
+            BOARD_SIZE,
+            WIN_LENGTH,
+        )
+
+    def get_size(self) -> Tuple[int, int]:
+        """Get the size of the board.
+
+        Returns:
+            Tuple[int, int]: The width (columns) and height (rows) of the board.
+        """
+
+        return (self._width, self._height)
+
+    def get_win_length(self) -> int:
+        """Get the number of marks in a row needed to win.
+
+        Returns:
+            int: The win length.
+        """
+
+        return self._win_length
+
+    def get_last_move(self) -> Union[Cell, None]:
+        """Get the cell most recently played.
+
+        Returns:
+            Union[Cell, None]: The cell, or `None` if no move has been made.
+        """
+
+        return self._last_move
+
+    def get_history(self) -> Tuple[Cell, ...]:
+        """Get the cells played since the board was created, in order.
+
+        Moves in a starting state are not included, and moves taken back with
+        `pop` are removed.
+
+        Returns:
+            Tuple[Cell, ...]: The cells, oldest first.
+        """
+
+        return tuple(divmod(index, self._width) for index, _, _ in self._move_stack)
+
+    def get_player_to_move(self) -> PlayerMarker:
+        """Get the player whose turn it is, "X" moving first.
+
+        Returns:
+            PlayerMarker: "X" if "X" has played no more moves than "O", else "O".
+        """
+
+        if self._x_bits.bit_count() <= self._o_bits.bit_count():
+            return "X"
+        return "O"
+
+    def get_cell_key(self, cell: Cell) -> str:
+        """Get the cell key a player types to play at (`row`, `col`).
+
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
+
+        Returns:
+            str: The cell key.
+        """
+
+        return cell_to_cell_key(cell, self._width, self._height)
+
+    def get_status(self) -> GameStatus:
+        """Get the status of the game.
+
+        Returns:
+            GameStatus: Whether the game is ongoing, won by "X", won by "O", or
+                drawn.
+        """
+
+        return self._status
+
+    def get_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the position, kept up to date in O(1).
+
+        Equal positions on boards of the same size have equal hashes in every
+        process. Unlike `hash(board)`, this follows the board's contents.
+
+        Returns:
+            int: The hash.
+        """
+
+        return self._hash
+
+    def get_move_count(self) -> int:
+        """Get the number of moves played on the board.
+
+        Returns:
+            int: The number of nonblank cells.
+        """
+
+        return self._move_count
+
+    def is_win_through(self, player_bits: int, index: int) -> bool:
+        """Whether `player_bits` has `win_length` in a row through cell `index`.
+
+        Only lines through `index` are checked, so this is the cheap test for
+        whether the move just played at `index` won. Search code calls it on raw
+        bitboards without touching the board's own state.
+
+        Args:
+            player_bits (int): One player's bitboard, bit `row * width + col` set
+                for each cell that player holds.
+            index (int): The cell index, `row * width + col`.
+
+        Returns:
+            bool: `True` if a winning line passes through `index`.
+        """
+
+        if self._cell_win_masks is not None:
+            return any(
+                player_bits & mask == mask for mask in self._cell_win_masks[index]
+            )
+        return self._is_win_at(player_bits, index)
+
+    @classmethod
+    def from_position(cls, position: Position) -> "Board":
+        """Create a standard board holding `position`.
+
+        Args:
+            position (Position): The position to start from.
+
+        Returns:
+            Board: A new board.
+        """
+
+        board: Board = cls()
+        board._x_bits = position.x_bits
+        board._o_bits = position.o_bits
+        board._move_count = (board._x_bits | board._o_bits).bit_count()
+        board._status = board._scan_status()
+        board._hash = hash_bitboards(board._x_bits, board._o_bits, board._zobrist_keys)
+
+        return board
+
+    def snapshot(self) -> Position:
+        """Get an immutable, hashable snapshot of the game board state in O(1).
+
+        Raises:
+            ValueError: If this is not the standard board.
+
+        Returns:
+            Position: The current position.
+        """
+
+        self._require_standard("Snapshotting")
+
+        return Position(self._x_bits, self._o_bits)
+
+    def get_bitboards(self) -> Tuple[int, int]:
+        """Get the raw bitboards of the game board state.
+
+        Returns:
+            Tuple[int, int]: The "X" bitboard and the "O" bitboard.
+        """
+
+        return (self._x_bits, self._o_bits)
+
+    def canonicalize(self) -> Tuple[PositionKey, int]:
+        """Get the symmetry-canonical key of the game board state.
+
+        All eight rotations and reflections of a position share one canonical key,
+        so caches keyed on it hold each position once.
+
+        Raises:
+            ValueError: If this is not the standard board.
+
+        Returns:
+            Tuple[PositionKey, int]: The canonical (`x_bits`, `o_bits`) key and the
+                transform that maps this board onto it.
+        """
+
+        self._require_standard("Canonicalization")
+
+        return canonicalize(self._x_bits, self._o_bits)
 
     def get_board(self) -> List[List[CellValue]]:
         """Get a copy of the game board state.
@@ -78,7 +525,10 @@ class Board:
             List[List[CellValue]]: A copy of the game board state.
         """
 
-        board_copy: List[List[CellValue]] = [row[:] for row in self._board]
+        board_copy: List[List[CellValue]] = [
+            [self.get_cell((row, col)) for col in range(self._width)]
+            for row in range(self._height)
+        ]
         return board_copy
 
     def get_cell(self, cell: Cell) -> CellValue:
@@ -100,8 +550,84 @@ class Board:
         if not self._is_valid_cell(cell):
             raise InvalidCellError(f"({row}, {col}) is not a valid cell.")
 
-        cell_value: CellValue = self._board[row][col]
-        return cell_value
+        bit: int = self._cell_bit(cell)
+
+        if self._x_bits & bit:
+            return "X"
+        if self._o_bits & bit:
+            return "O"
+        return None
+
+    def legal_moves(self) -> int:
+        """Get the cells that can be played, without raising.
+
+        Returns:
+            int: A bitmask with bit `row * width + col` set for each blank cell,
+                or 0 once the game is over.
+        """
+
+        if self._status is not GameStatus.ONGOING:
+            return 0
+        return ((1 << self._width * self._height) - 1) ^ (self._x_bits | self._o_bits)
+
+    def try_move(self, cell: Cell, move_value: PlayerMarker) -> MoveResult:
+        """Play `move_value` ("X" or "O") at (`row`, `col`) if it is legal.
+
+        Checks the same things as `make_move`, but reports a rejected move with
+        its result instead of raising, and leaves the board unchanged.
+
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
+            move_value (PlayerMarker): "X" or "O".
+
+        Returns:
+            MoveResult: `MoveResult.OK` if the move was played, or why it was not.
+        """
+
+        return self._apply_move(cell, move_value)
+
+    def push(self, cell: Cell) -> MoveResult:
+        """Play the player to move at (`row`, `col`), if it is legal.
+
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
+
+        Returns:
+            MoveResult: `MoveResult.OK` if the move was played, or why it was not.
+        """
+
+        return self._apply_move(cell, self.get_player_to_move())
+
+    def pop(self) -> Cell:
+        """Take back the last move played, restoring the board as it was.
+
+        Raises:
+            InvalidMoveError: When no move has been played since the board was
+                created.
+
+        Returns:
+            Cell: The cell that was cleared.
+        """
+
+        if not self._move_stack:
+            raise InvalidMoveError("No moves to take back.")
+
+        index, status, last_move = self._move_stack.pop()
+        bit: int = 1 << index
+
+        if self._x_bits & bit:
+            self._x_bits ^= bit
+            self._hash ^= self._zobrist_keys[0][index]
+        else:
+            self._o_bits ^= bit
+            self._hash ^= self._zobrist_keys[1][index]
+
+        self._move_count -= 1
+        self._status = status
+        self._last_move = last_move
+
+        row, col = divmod(index, self._width)
+        return (row, col)
 
     def make_move(self, cell: Cell, move_value: PlayerMarker) -> None:
         """Play `move_value` ("X" or "O") at (`row`, `col`).
@@ -118,68 +644,68 @@ class Board:
 
         row, col = cell
 
-        if not self._is_valid_cell(cell):
-            raise InvalidCellError(f"({row}, {col}) is not a valid cell.")
+        match self._apply_move(cell, move_value):
+            case MoveResult.INVALID_CELL:
+                raise InvalidCellError(f"({row}, {col}) is not a valid cell.")
+            case MoveResult.OCCUPIED:
+                raise InvalidMoveError(
+                    f"{self.get_cell(cell)!r} already played at ({row}, {col})."
+                )
+            case MoveResult.INVALID_MARKER:
+                raise InvalidMoveError(f"Invalid move: {move_value!r}.")
 
-        if not self._is_blank_cell(cell):
-            raise InvalidMoveError(
-                f"{self._board[row][col]!r} already played at ({row}, {col})."
-            )
+    def stringify_board(self) -> str:
+        """Generate a string representation of the board.
 
-        if not move_value in VALID_MOVES:
-            raise InvalidMoveError(f"Invalid move: {move_value!r}.")
+        Renders are cached on the bitboards, so re-rendering an unchanged
+        position is a dict lookup. See `get_render_cache_info`.
 
-        self._board[row][col] = move_value
+        Returns:
+            str: A stringified, colorized representation of the board.
+        """
 
-    def stringify_board(self) -> str:
-        """Generate a string representation of the board.
+        return _render_board(self._x_bits, self._o_bits, self._width, self._height)
+
+    def stringify_cell(self, cell: Cell) -> str:
+        """Generate the colorized display of one cell, as `stringify_board` shows it.
+
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
 
         Raises:
-            ValueError: If attempt is made to stringify a board of
-                incorrect dimensions.
-            ValueError: If the value of a cell is not "X", "O", or `None`.
+            InvalidCellError: When an invalid (`row`, `col`) is requested.
 
         Returns:
-            str: A stringified, colorized representation of the board.
+            str: The cell's display.
         """
 
-        rows: List[str] = []
-        for row in range(BOARD_SIZE):
-            cols: List[str] = []
+        row, col = cell
 
-            row = cast(RowsCols, row)
-            for col in range(BOARD_SIZE):
-                col = cast(RowsCols, col)
+        if not self._is_valid_cell(cell):
+            raise InvalidCellError(f"({row}, {col}) is not a valid cell.")
 
-                value: CellValue = self.get_cell((row, col))
-                cell_display: str = ""
+        index: int = row * self._width + col
+        blank, x_display, o_display = _cell_fragments(self._width, self._height)[index]
 
-                match value:
-                    case None:
-                        match row:
-                            case 0:
-                                cell_display = grey(f" {row + 7 + col} ")
-                            case 1:
-                                cell_display = grey(f" {row + 3 + col} ")
-                            case 2:
-                                cell_display = grey(f" {row - 1 + col} ")
-                            case _:
-                                raise ValueError(f"Invalid row index: {row!r}.")
+        if self._x_bits >> index & 1:
+            return x_display
+        if self._o_bits >> index & 1:
+            return o_display
+        return blank
 
-                    case "X":
-                        cell_display = red(" X ")
-                    case "O":
-                        cell_display = green(" O ")
-                    case _:
-                        raise ValueError(f"Invalid value: {value!r}.")
+    def get_cell_screen_position(self, cell: Cell) -> Tuple[int, int]:
+        """Get where a cell's display starts in the output of `stringify_board`.
 
-                cols.append(cell_display)
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
 
-            row_display: str = GRID_COL_JOINER.join(cols)
-            rows.append(row_display)
+        Returns:
+            Tuple[int, int]: The 0-based line and character column.
+        """
 
-        board_display: str = f"{GRID_TOP}{GRID_ROW_JOINER.join(rows)}{GRID_BOTTOM}"
-        return board_display
+        row, col = cell
+
+        return (1 + 2 * row, col * (_cell_width(self._width, self._height) + 1))
 
     def check_win(self) -> Tuple[bool, Union[PlayerMarker, None]]:
         """
@@ -191,38 +717,13 @@ class Board:
                 is the winning value ("X" or "O") if `True`, or `None` if `False`.
         """
 
-        def _check_cell_values(
-            a: CellValue, b: CellValue, c: CellValue
-        ) -> Union[PlayerMarker, None]:
-            if a is not None and a == b and b == c:
-                return a
-            return None
-
-        for row in self._board:
-            winner = _check_cell_values(row[0], row[1], row[2])
-            if winner:
-                return (True, winner)
-
-        for col in range(BOARD_SIZE):
-            winner = _check_cell_values(
-                self._board[0][col], self._board[1][col], self._board[2][col]
-            )
-            if winner:
-                return (True, winner)
-
-        winner = _check_cell_values(
-            self._board[0][0], self._board[1][1], self._board[2][2]
-        )
-        if winner:
-            return (True, winner)
-
-        winner = _check_cell_values(
-            self._board[0][2], self._board[1][1], self._board[2][0]
-        )
-        if winner:
-            return (True, winner)
-
-        return (False, None)
+        match self._status:
+            case GameStatus.X_WON:
+                return (True, "X")
+            case GameStatus.O_WON:
+                return (True, "O")
+            case _:
+                return (False, None)
 
     def check_draw(self) -> bool:
         """Checks the board for a draw state.
@@ -230,8 +731,5 @@ class Board:
         Returns:
             bool: Whether the game is a draw (`True`) or not (`False`).
         """
-        is_draw: bool = all(
-            cell is not None for row in self._board for cell in row
-        ) and self.check_win() == (False, None)
 
-        return is_draw
+        return self._status is GameStatus.DRAW
@@ -0,0 +1,50 @@
+"""Cell key mapping.
+
+Cell keys number the cells from "1" in numeric keypad order: left to right along
+the bottom row, then upwards. On the standard board they match a keypad's layout.
+"""
+
+from typing import Union, cast
+
+from constants.constants import (
+    CellKey,
+    Cell,
+    BOARD_SIZE,
+    CELL_KEY_TO_CELL_MAP,
+    CELL_TO_CELL_KEY_MAP,
+)
+
+
+def cell_to_cell_key(
+    cell: Cell, width: int = BOARD_SIZE, height: int = BOARD_SIZE
+) -> str:
+    """Get the cell key for (`row`, `col`) on a `width` by `height` board."""
+
+    if width == height == BOARD_SIZE:
+        return CELL_TO_CELL_KEY_MAP[cell]
+
+    row, col = cell
+    return str((height - 1 - row) * width + col + 1)
+
+
+def cell_key_to_cell(
+    cell_key: str, width: int = BOARD_SIZE, height: int = BOARD_SIZE
+) -> Union[Cell, None]:
+    """Get the (`row`, `col`) for `cell_key` on a `width` by `height` board.
+
+    Returns:
+        Union[Cell, None]: The cell, or `None` if `cell_key` is not valid.
+    """
+
+    if width == height == BOARD_SIZE:
+        return CELL_KEY_TO_CELL_MAP.get(cast(CellKey, cell_key))
+
+    if not cell_key.isdecimal() or cell_key.startswith("0"):
+        return None
+
+    index: int = int(cell_key) - 1
+    if index >= width * height:
+        return None
+
+    flipped_row, col = divmod(index, width)
+    return (height - 1 - flipped_row, col)
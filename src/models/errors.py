@@ -0,0 +1,21 @@
+"""Game board errors."""
+
+
+class InvalidCellError(Exception):
+    """Custom error for when an invalid cell is requested."""
+
+    _message: str
+
+    def __init__(self, message: str = "Invalid cell."):
+        self._message: str = message
+        super().__init__(self._message)
+
+
+class InvalidMoveError(Exception):
+    """Custom error for when an invalid move is attempted."""
+
+    _message: str
+
+    def __init__(self, message: str = "Invalid move."):
+        self._message: str = message
+        super().__init__(self._message)
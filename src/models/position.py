@@ -0,0 +1,131 @@
+"""Immutable board positions."""
+
+from typing import Tuple, Type
+
+from constants.constants import (
+    PlayerMarker,
+    CellValue,
+    Cell,
+    PositionKey,
+    BOARD_SIZE,
+    FULL_BOARD_MASK,
+    VALID_MOVES,
+)
+
+from src.models.errors import InvalidCellError, InvalidMoveError
+
+
+class Position:
+    """Immutable, hashable game board position.
+
+    A position is a single int, `x_bits | o_bits << 9`, so it has no per-instance
+    dict and no nested lists, and hashing and equality are plain int operations.
+    """
+
+    __slots__ = ("_key",)
+
+    _key: int
+
+    def __init__(self, x_bits: int = 0, o_bits: int = 0) -> None:
+        if x_bits & o_bits or (x_bits | o_bits) & ~FULL_BOARD_MASK:
+            raise ValueError(f"Invalid bitboards: ({x_bits!r}, {o_bits!r}).")
+
+        object.__setattr__(self, "_key", x_bits | o_bits << BOARD_SIZE * BOARD_SIZE)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._key
+
+    def __repr__(self) -> str:
+        return f"Position(x_bits={self.x_bits:#011b}, o_bits={self.o_bits:#011b})"
+
+    def __reduce__(self) -> Tuple[Type["Position"], PositionKey]:
+        return (Position, (self.x_bits, self.o_bits))
+
+    @property
+    def key(self) -> int:
+        """The packed `x_bits | o_bits << 9` encoding of the position."""
+
+        return self._key
+
+    @property
+    def x_bits(self) -> int:
+        """The "X" bitboard."""
+
+        return self._key & FULL_BOARD_MASK
+
+    @property
+    def o_bits(self) -> int:
+        """The "O" bitboard."""
+
+        return self._key >> BOARD_SIZE * BOARD_SIZE
+
+    def get_cell(self, cell: Cell) -> CellValue:
+        """Get the value at (`row`, `col`).
+
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
+
+        Raises:
+            InvalidCellError: When an invalid (`row`, `col`) is requested.
+
+        Returns:
+            CellValue: The value ("X", "O", or `None`) at (`row`, `col`).
+        """
+
+        row, col = cell
+
+        if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+            raise InvalidCellError(f"({row}, {col}) is not a valid cell.")
+
+        index: int = row * BOARD_SIZE + col
+
+        if self._key >> index & 1:
+            return "X"
+        if self._key >> (index + BOARD_SIZE * BOARD_SIZE) & 1:
+            return "O"
+        return None
+
+    def with_move(self, cell: Cell, move_value: PlayerMarker) -> "Position":
+        """Get the position after playing `move_value` at (`row`, `col`).
+
+        Args:
+            cell (Cell): The tuple corresponding to the cell location on the board.
+            move_value (PlayerMarker): "X" or "O".
+
+        Raises:
+            InvalidCellError: When an attempt is made to play on an invalid cell.
+            InvalidMoveError: When an attempt is made to play on a nonblank cell.
+            InvalidMoveError: When an attempt is made to play a move other than "X"
+                or "O".
+
+        Returns:
+            Position: A new position; this one is unchanged.
+        """
+
+        row, col = cell
+
+        current_value: CellValue = self.get_cell(cell)
+        if current_value is not None:
+            raise InvalidMoveError(
+                f"{current_value!r} already played at ({row}, {col})."
+            )
+
+        if move_value not in VALID_MOVES:
+            raise InvalidMoveError(f"Invalid move: {move_value!r}.")
+
+        bit: int = 1 << (row * BOARD_SIZE + col)
+
+        if move_value == "X":
+            return Position(self.x_bits | bit, self.o_bits)
+        return Position(self.x_bits, self.o_bits | bit)
@@ -0,0 +1,81 @@
+"""Board symmetries."""
+
+from typing import List, Tuple
+
+from constants.constants import (
+    PositionKey,
+    FULL_BOARD_MASK,
+    SYMMETRY_PERMUTATIONS,
+)
+
+
+def _build_transform_table(permutation: Tuple[int, ...]) -> Tuple[int, ...]:
+    table: List[int] = []
+
+    for bits in range(FULL_BOARD_MASK + 1):
+        transformed_bits: int = 0
+        for index, target in enumerate(permutation):
+            if bits >> index & 1:
+                transformed_bits |= 1 << target
+        table.append(transformed_bits)
+
+    return tuple(table)
+
+
+# `TRANSFORM_TABLES[transform][bits]` is bitboard `bits` under `transform`.
+TRANSFORM_TABLES: Tuple[Tuple[int, ...], ...] = tuple(
+    _build_transform_table(permutation) for permutation in SYMMETRY_PERMUTATIONS
+)
+
+INVERSE_PERMUTATIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(permutation.index(index) for index in range(len(permutation)))
+    for permutation in SYMMETRY_PERMUTATIONS
+)
+
+
+def transform_bits(bits: int, transform: int) -> int:
+    """Apply symmetry `transform` to bitboard `bits`."""
+
+    return TRANSFORM_TABLES[transform][bits]
+
+
+def transform_cell_index(index: int, transform: int) -> int:
+    """Map cell `index` of the original board onto the transformed board."""
+
+    return SYMMETRY_PERMUTATIONS[transform][index]
+
+
+def untransform_cell_index(index: int, transform: int) -> int:
+    """Map cell `index` of the transformed board back onto the original board."""
+
+    return INVERSE_PERMUTATIONS[transform][index]
+
+
+def canonicalize(x_bits: int, o_bits: int) -> Tuple[PositionKey, int]:
+    """Map a position to the representative of its symmetry class.
+
+    The representative is the smallest (`x_bits`, `o_bits`) key over all eight
+    rotations and reflections, found with one table lookup per bitboard per
+    transform.
+
+    Args:
+        x_bits (int): The "X" bitboard.
+        o_bits (int): The "O" bitboard.
+
+    Returns:
+        Tuple[PositionKey, int]: The canonical (`x_bits`, `o_bits`) key and the
+            index into `SYMMETRY_PERMUTATIONS` of the transform that produces it.
+    """
+
+    best_key: PositionKey = (x_bits, o_bits)
+    best_transform: int = 0
+
+    for transform in range(1, len(TRANSFORM_TABLES)):
+        table: Tuple[int, ...] = TRANSFORM_TABLES[transform]
+        key: PositionKey = (table[x_bits], table[o_bits])
+
+        if key < best_key:
+            best_key = key
+            best_transform = transform
+
+    return (best_key, best_transform)
@@ -0,0 +1,60 @@
+"""Zobrist hashing.
+
+A position's Zobrist hash is the XOR of one random 64-bit key per occupied cell,
+drawn separately for "X" and "O". Playing or taking back a move XORs a single key,
+so the hash is kept up to date in O(1).
+"""
+
+import random
+
+from functools import cache
+from typing import Tuple
+
+ZOBRIST_SEED: int = 0x7A0B_5157
+
+# `(x_keys, o_keys)`: the key for "X" and for "O" at each cell index.
+type ZobristKeys = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+@cache
+def get_zobrist_keys(cells: int) -> ZobristKeys:
+    """Get the Zobrist keys for a board of `cells` cells.
+
+    Keys are drawn from a fixed seed, so hashes are the same in every process.
+
+    Args:
+        cells (int): The number of cells on the board.
+
+    Returns:
+        ZobristKeys: The "X" keys and the "O" keys, indexed by cell index.
+    """
+
+    rng: random.Random = random.Random(ZOBRIST_SEED)
+
+    x_keys: Tuple[int, ...] = tuple(rng.getrandbits(64) for _ in range(cells))
+    o_keys: Tuple[int, ...] = tuple(rng.getrandbits(64) for _ in range(cells))
+
+    return (x_keys, o_keys)
+
+
+def hash_bitboards(x_bits: int, o_bits: int, keys: ZobristKeys) -> int:
+    """Compute the Zobrist hash of a position from scratch.
+
+    Args:
+        x_bits (int): The "X" bitboard.
+        o_bits (int): The "O" bitboard.
+        keys (ZobristKeys): The keys for the board's size.
+
+    Returns:
+        int: The 64-bit hash.
+    """
+
+    zobrist_hash: int = 0
+
+    for bits, player_keys in ((x_bits, keys[0]), (o_bits, keys[1])):
+        while bits:
+            low: int = bits & -bits
+            zobrist_hash ^= player_keys[low.bit_length() - 1]
+            bits ^= low
+
+    return zobrist_hash
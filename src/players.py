@@ -0,0 +1,54 @@
+"""Player types."""
+
+from typing import Callable, Mapping
+
+from constants.constants import PlayerMarker, Cell
+
+from src.agents import (
+    Agent,
+    MCTSAgent,
+    RandomAgent,
+    ScriptedAgent,
+    SearchAgent,
+    SolverAgent,
+    StrongSolverAgent,
+)
+
+from src.models.board import Board
+
+from src.ui.prompts import announce_move, prompt
+
+type Player = Callable[[PlayerMarker, Board], None]
+
+
+def agent_player(agent: Agent) -> Player:
+    """Make a player that plays `agent`'s moves, showing each one.
+
+    Args:
+        agent (Agent): Chooses the moves.
+
+    Returns:
+        Player: The player.
+    """
+
+    def play(player_marker: PlayerMarker, board: Board) -> None:
+        cell: Cell = agent.choose_move(board)
+
+        announce_move(player_marker, board, cell)
+        board.make_move(cell, player_marker)
+
+    return play
+
+
+# "solver" plays perfectly from the solved position table, and "perfect" from a
+# packed table solved for larger boards. "search" and "mcts" work on boards of any
+# size; "mcts" keeps its search tree from move to move.
+PLAYER_TYPES: Mapping[str, Player] = {
+    "human": prompt,
+    "solver": agent_player(SolverAgent()),
+    "perfect": agent_player(StrongSolverAgent()),
+    "search": agent_player(SearchAgent()),
+    "mcts": agent_player(MCTSAgent()),
+    "random": agent_player(RandomAgent()),
+    "scripted": agent_player(ScriptedAgent()),
+}
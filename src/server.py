@@ -0,0 +1,353 @@
+"""Asyncio multi-game server.
+
+Clients connect over TCP and are paired in order of arrival. Each pairing plays one
+game on its own `Board`, over a line protocol that a plain `nc` session can drive:
+the server sends the rendered board followed by a prompt line, and the player to
+move replies with a cell key ("1" to "9") and a newline. Lines sent out of turn
+are rejected rather than kept for the player's next move.
+"""
+
+import asyncio
+
+from typing import Dict, Union
+
+from constants.constants import PlayerMarker, Cell
+
+from src.models.board import Board, GameStatus, MoveResult
+
+from src.models.cell_keys import cell_key_to_cell
+
+from src.storage.sessions import GameSession, SessionStore
+
+from src.utils.colorize import cyan, green, magenta, red, yellow
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+
+LINE_LIMIT: int = 64
+MOVE_TIMEOUT: float = 300.0
+WRITE_TIMEOUT: float = 10.0
+
+
+class ConnectionClosedError(Exception):
+    """Custom error for when a client disconnects or stops reading."""
+
+    _message: str
+
+    def __init__(self, message: str = "Connection closed.") -> None:
+        self._message: str = message
+        super().__init__(self._message)
+
+
+class Connection:
+    """A connected client.
+
+    Its input is read as it arrives, so a disconnect is noticed at once. A line
+    is only taken as a reply while `receive` is waiting for one; any other line
+    is discarded and answered with a notice.
+    """
+
+    _reader: asyncio.StreamReader
+    _writer: asyncio.StreamWriter
+    _write_timeout: float
+    _closed: bool
+    _reply: Union["asyncio.Future[str]", None]
+    _read_task: "asyncio.Task[None]"
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        write_timeout: float = WRITE_TIMEOUT,
+    ) -> None:
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter = writer
+        self._write_timeout: float = write_timeout
+        self._closed: bool = False
+        self._reply: Union["asyncio.Future[str]", None] = None
+        self._read_task: "asyncio.Task[None]" = asyncio.create_task(self._read_lines())
+
+    async def _read_lines(self) -> None:
+        try:
+            while True:
+                line: bytes = await self._reader.readuntil(b"\n")
+
+                if self._reply is not None and not self._reply.done():
+                    self._reply.set_result(line.decode(errors="replace").strip())
+                else:
+                    await self.send(yellow(" Not your turn. "))
+        except (
+            ConnectionError,
+            ConnectionClosedError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+        ):
+            pass
+        finally:
+            self._closed = True
+            if self._reply is not None and not self._reply.done():
+                self._reply.set_exception(ConnectionClosedError())
+
+    def is_closed(self) -> bool:
+        """Whether the client has disconnected or been disconnected."""
+
+        return self._closed or self._writer.is_closing()
+
+    async def wait_disconnected(self) -> None:
+        """Wait until the client disconnects or sends an overlong line."""
+
+        await asyncio.wait((self._read_task,))
+
+    async def send(self, text: str) -> None:
+        """Send `text` to the client as one or more lines.
+
+        Waits for the transport to drain, so a client that stops reading is
+        disconnected after `write_timeout` seconds instead of buffering output
+        without bound.
+
+        Raises:
+            ConnectionClosedError: When the client is gone or too slow to read.
+        """
+
+        try:
+            self._writer.write(f"{text}\n".encode())
+            await asyncio.wait_for(self._writer.drain(), self._write_timeout)
+        except (ConnectionError, asyncio.TimeoutError) as e:
+            raise ConnectionClosedError() from e
+
+    async def receive(self, timeout: float) -> str:
+        """Receive one line from the client, without its line ending.
+
+        Only a line sent after the call is received.
+
+        Raises:
+            ConnectionClosedError: When the client disconnects, sends an
+                overlong line, or sends nothing within `timeout` seconds.
+        """
+
+        if self._closed:
+            raise ConnectionClosedError()
+
+        self._reply = asyncio.get_running_loop().create_future()
+        try:
+            return await asyncio.wait_for(self._reply, timeout)
+        except asyncio.TimeoutError as e:
+            raise ConnectionClosedError() from e
+        finally:
+            self._reply = None
+
+    async def close(self) -> None:
+        """Close the connection."""
+
+        self._read_task.cancel()
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+def _player_str(player_marker: PlayerMarker) -> str:
+    return red("X") if player_marker == "X" else green("O")
+
+
+async def play_game(
+    connections: Dict[PlayerMarker, Connection],
+    move_timeout: float = MOVE_TIMEOUT,
+    sessions: Union[SessionStore, None] = None,
+) -> Union[GameStatus, None]:
+    """Play one game between two connected clients.
+
+    Args:
+        connections (Dict[PlayerMarker, Connection]): The client playing "X" and
+            the client playing "O".
+        move_timeout (float): Seconds a player may take over a move.
+        sessions (Union[SessionStore, None]): Where to log the game's moves, so
+            it can be resumed if a player disconnects.
+
+    Returns:
+        Union[GameStatus, None]: The final status of the game, or `None` if a
+            player disconnected before it finished.
+    """
+
+    board: Board = Board()
+    player: PlayerMarker = "X"
+    session: Union[GameSession, None] = (
+        sessions.open_session(board) if sessions is not None else None
+    )
+
+    try:
+        for player_marker, connection in connections.items():
+            await connection.send(f"You are {_player_str(player_marker)}.")
+
+        while board.get_status() is GameStatus.ONGOING:
+            connection = connections[player]
+            opponent: PlayerMarker = "O" if player == "X" else "X"
+
+            await connections[opponent].send(f"Waiting for {_player_str(player)}...")
+
+            while True:
+                await connection.send(f"\n{board.stringify_board()}\n")
+                await connection.send(f"   {_player_str(player)} {cyan('→')}")
+                move: str = await connection.receive(move_timeout)
+
+                cell: Union[Cell, None] = cell_key_to_cell(move)
+
+                if cell is not None and board.try_move(cell, player) is MoveResult.OK:
+                    if session is not None:
+                        session.on_move(board, cell, player)
+                    break
+
+                await connection.send(red(" Try again "))
+
+            player = opponent
+    except ConnectionClosedError:
+        for connection in connections.values():
+            if not connection.is_closed():
+                try:
+                    await connection.send(yellow(" Opponent left. "))
+                except ConnectionClosedError:
+                    pass
+        return None
+
+    if session is not None:
+        session.on_game_end(board)
+
+    winner: Union[PlayerMarker, None] = board.check_win()[1]
+    result: str = "   Draw!   " if winner is None else f"  {winner} wins!  "
+
+    for connection in connections.values():
+        try:
+            await connection.send(f"\n{board.stringify_board()}\n\n{yellow(result)}")
+        except ConnectionClosedError:
+            pass
+
+    return board.get_status()
+
+
+class GameServer:
+    """Pairs incoming connections and hosts one game per pair.
+
+    Every connection is served by its own coroutine; no thread is spent per game.
+    """
+
+    _move_timeout: float
+    _sessions: Union[SessionStore, None]
+    _waiting: Union[Connection, None]
+    _finished: Dict[Connection, asyncio.Event]
+
+    def __init__(
+        self,
+        move_timeout: float = MOVE_TIMEOUT,
+        sessions: Union[SessionStore, None] = None,
+    ) -> None:
+        self._move_timeout: float = move_timeout
+        self._sessions: Union[SessionStore, None] = sessions
+        self._waiting: Union[Connection, None] = None
+        self._finished: Dict[Connection, asyncio.Event] = {}
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client for the lifetime of its connection."""
+
+        connection: Connection = Connection(reader, writer)
+
+        try:
+            await connection.send(magenta("TIC-TAC-TOE"))
+
+            opponent: Union[Connection, None] = self._waiting
+            if opponent is not None and opponent.is_closed():
+                self._finished.pop(opponent).set()
+                opponent = None
+
+            if opponent is None:
+                await self._wait_for_opponent(connection)
+                return
+
+            self._waiting = None
+            try:
+                await play_game(
+                    {"X": opponent, "O": connection},
+                    self._move_timeout,
+                    self._sessions,
+                )
+            finally:
+                self._finished.pop(opponent).set()
+        except ConnectionClosedError:
+            pass
+        finally:
+            await connection.close()
+
+    async def _wait_for_opponent(self, connection: Connection) -> None:
+        finished: asyncio.Event = asyncio.Event()
+        self._finished[connection] = finished
+        self._waiting = connection
+
+        await connection.send("Waiting for an opponent...")
+
+        paired: "asyncio.Task[bool]" = asyncio.create_task(finished.wait())
+        disconnected: "asyncio.Task[None]" = asyncio.create_task(
+            connection.wait_disconnected()
+        )
+        await asyncio.wait((paired, disconnected), return_when=asyncio.FIRST_COMPLETED)
+        disconnected.cancel()
+
+        if self._waiting is connection:
+            self._waiting = None
+            del self._finished[connection]
+            paired.cancel()
+            return
+
+        await paired
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    move_timeout: float = MOVE_TIMEOUT,
+    sessions: Union[SessionStore, None] = None,
+) -> asyncio.Server:
+    """Start a game server listening on `host`:`port`.
+
+    Args:
+        host (str): The interface to listen on.
+        port (int): The port to listen on, or 0 for any free port.
+        move_timeout (float): Seconds a player may take over a move.
+        sessions (Union[SessionStore, None]): Where to log every game's moves.
+
+    Returns:
+        asyncio.Server: The running server.
+    """
+
+    game_server: GameServer = GameServer(move_timeout, sessions)
+
+    return await asyncio.start_server(
+        game_server.handle_connection, host, port, limit=LINE_LIMIT, backlog=4096
+    )
+
+
+def run_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    sessions: Union[SessionStore, None] = None,
+) -> None:
+    """Run a game server on `host`:`port` until interrupted.
+
+    Args:
+        host (str): The interface to listen on.
+        port (int): The port to listen on.
+        sessions (Union[SessionStore, None]): Where to log every game's moves.
+    """
+
+    async def _run() -> None:
+        server: asyncio.Server = await serve(host, port, sessions=sessions)
+
+        async with server:
+            print(f"Serving on {host}:{port}")
+            await server.serve_forever()
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
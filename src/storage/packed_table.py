@@ -0,0 +1,153 @@
+"""Packed solution tables for boards of up to 16 cells.
+
+A packed table holds two bits per position, indexed by the position's base-3
+encoding as in `src.storage.tablebase`: the sum of `value * 3 ** index` over the
+cells, with blank = 0, "X" = 1 and "O" = 2. A 4x4 board has 3^16 = 43,046,721
+entries, so its table is about 10.8 MB. Entry `index` is bits `2 * (index % 4)`
+and up of byte `index // 4`.
+
+Each entry is `UNSOLVED`, or the minimax value for the player to move plus 2
+(`LOSS_ENTRY`, `DRAW_ENTRY` or `WIN_ENTRY`). Unreachable positions stay
+`UNSOLVED`.
+
+The entries follow a 20-byte header: `PACKED_TABLE_MAGIC`, the format version,
+the board's width, height and win length, a flags byte (`COMPLETE` once every
+reachable position is solved), three reserved bytes, the entry count and the
+CRC-32 of the entries, little-endian. A table without `COMPLETE` is a
+checkpoint of an unfinished solve.
+"""
+
+import os
+import struct
+import zlib
+
+from pathlib import Path
+from typing import NamedTuple, Tuple, Union
+
+from src.storage.tablebase import TablebaseError
+
+PACKED_TABLE_MAGIC: bytes = b"TTTP"
+PACKED_TABLE_VERSION: int = 1
+PACKED_TABLE_HEADER: struct.Struct = struct.Struct("<4sBBBBBxxxII")
+
+MAX_CELLS: int = 16
+COMPLETE: int = 0x1
+
+UNSOLVED: int = 0
+LOSS_ENTRY: int = 1
+DRAW_ENTRY: int = 2
+WIN_ENTRY: int = 3
+
+
+class PackedTableInfo(NamedTuple):
+    """The board a packed table solves, and whether it is finished."""
+
+    width: int
+    height: int
+    win_length: int
+    complete: bool
+
+    @property
+    def entry_count(self) -> int:
+        """The number of entries: one per base-3 index."""
+
+        count: int = 3 ** (self.width * self.height)
+        return count
+
+    @property
+    def size(self) -> int:
+        """The number of bytes the entries take up."""
+
+        return packed_size(self.entry_count)
+
+    def get_rules(self) -> Tuple[int, int, int]:
+        """Get the width, height and win length."""
+
+        return (self.width, self.height, self.win_length)
+
+
+def packed_size(entry_count: int) -> int:
+    """Get the number of bytes that hold `entry_count` two-bit entries."""
+
+    return (entry_count + 3) // 4
+
+
+def write_packed_table(
+    path: Union[str, Path],
+    info: PackedTableInfo,
+    entries: Union[bytes, bytearray, memoryview],
+) -> None:
+    """Write `entries` to a packed table file at `path`, with its header.
+
+    The file is written beside `path` and then renamed over it, so `path`
+    always holds either the old table or the new one.
+
+    Raises:
+        ValueError: When there are not exactly `info.size` bytes of entries.
+    """
+
+    if len(entries) != info.size:
+        raise ValueError(f"Expected {info.size} bytes of entries, got {len(entries)}.")
+
+    header: bytes = PACKED_TABLE_HEADER.pack(
+        PACKED_TABLE_MAGIC,
+        PACKED_TABLE_VERSION,
+        info.width,
+        info.height,
+        info.win_length,
+        COMPLETE if info.complete else 0,
+        info.entry_count,
+        zlib.crc32(entries),
+    )
+    partial: Path = Path(f"{path}.partial")
+
+    with open(partial, "wb") as file:
+        file.write(header)
+        file.write(entries)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(partial, path)
+
+
+def read_packed_table(path: Union[str, Path]) -> Tuple[PackedTableInfo, bytes]:
+    """Read and validate the packed table at `path`.
+
+    Raises:
+        TablebaseError: When the file is not a packed table, is of another
+            version, or fails its checksum.
+        OSError: When the file cannot be read.
+
+    Returns:
+        Tuple[PackedTableInfo, bytes]: The table's header and its entries.
+    """
+
+    data: bytes = Path(path).read_bytes()
+
+    if len(data) < PACKED_TABLE_HEADER.size:
+        raise TablebaseError(f"{str(path)!r} is not a packed table.")
+
+    magic, version, width, height, win_length, flags, count, checksum = (
+        PACKED_TABLE_HEADER.unpack_from(data)
+    )
+
+    if magic != PACKED_TABLE_MAGIC:
+        raise TablebaseError(f"{str(path)!r} is not a packed table.")
+    if version != PACKED_TABLE_VERSION:
+        raise TablebaseError(f"Unsupported packed table version: {version!r}.")
+
+    info: PackedTableInfo = PackedTableInfo(
+        width, height, win_length, bool(flags & COMPLETE)
+    )
+    entries: bytes = data[PACKED_TABLE_HEADER.size :]
+
+    if (
+        width * height > MAX_CELLS
+        or count != info.entry_count
+        or len(entries) != info.size
+    ):
+        raise TablebaseError(f"{str(path)!r} is not a packed table.")
+    if zlib.crc32(entries) != checksum:
+        raise TablebaseError(f"{str(path)!r} failed its checksum.")
+
+    return (info, entries)
@@ -0,0 +1,303 @@
+"""Compact binary game records.
+
+A record file is a 5-byte header, `RECORD_MAGIC` followed by the format version,
+then one record per game, appended in the order the games finished. A record is
+one byte holding the number of moves in its high nibble and the result in its low
+nibble, followed by the moves as 4-bit cell indices (`row * 3 + col`), two to a
+byte, first move in the high nibble. A 9-move game takes 6 bytes.
+
+Only games on the standard board, played from a blank board with "X" moving
+first, can be recorded.
+"""
+
+import mmap
+import os
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Mapping, NamedTuple, Tuple, Union
+
+from constants.constants import Cell, PlayerMarker, BOARD_SIZE
+
+from src.models.board import Board, GameStatus
+
+RECORD_MAGIC: bytes = b"TTTR"
+RECORD_VERSION: int = 1
+FILE_HEADER: bytes = RECORD_MAGIC + bytes([RECORD_VERSION])
+DEFAULT_BUFFER_SIZE: int = 1 << 16
+
+CELL_COUNT: int = BOARD_SIZE * BOARD_SIZE
+
+RESULT_CODES: Mapping[GameStatus, int] = {
+    GameStatus.ONGOING: 0,
+    GameStatus.X_WON: 1,
+    GameStatus.O_WON: 2,
+    GameStatus.DRAW: 3,
+}
+RESULTS: Tuple[GameStatus, ...] = tuple(RESULT_CODES)
+
+
+class RecordFormatError(Exception):
+    """Custom error for when a record file is not valid."""
+
+    _message: str
+
+    def __init__(self, message: str = "Invalid record file.") -> None:
+        self._message: str = message
+        super().__init__(self._message)
+
+
+class GameRecord(NamedTuple):
+    """One recorded game: its cell indices in order of play, and how it ended.
+
+    A status of `GameStatus.ONGOING` marks a game abandoned before it finished.
+    """
+
+    moves: Tuple[int, ...]
+    status: GameStatus
+
+    def replay(self) -> Board:
+        """Play the recorded moves onto a blank board, "X" first.
+
+        Raises:
+            InvalidMoveError: When the record holds an illegal move.
+
+        Returns:
+            Board: The final position.
+        """
+
+        board: Board = Board()
+        player: PlayerMarker = "X"
+
+        for index in self.moves:
+            row, col = divmod(index, BOARD_SIZE)
+            board.make_move((row, col), player)
+            player = "O" if player == "X" else "X"
+
+        return board
+
+
+def encode_game(record: GameRecord) -> bytes:
+    """Encode `record` in the record format.
+
+    Raises:
+        ValueError: When the record has too many moves or an invalid cell index.
+
+    Returns:
+        bytes: The encoded record, `1 + ceil(moves / 2)` bytes long.
+    """
+
+    moves: Tuple[int, ...] = record.moves
+
+    if len(moves) > CELL_COUNT:
+        raise ValueError(f"Too many moves to record: {len(moves)!r}.")
+    if any(not 0 <= index < CELL_COUNT for index in moves):
+        raise ValueError(f"Invalid cell index in {moves!r}.")
+
+    encoded: bytearray = bytearray((len(moves) << 4 | RESULT_CODES[record.status],))
+
+    for position in range(0, len(moves), 2):
+        low: int = moves[position + 1] if position + 1 < len(moves) else 0
+        encoded.append(moves[position] << 4 | low)
+
+    return bytes(encoded)
+
+
+def decode_game(data: Union[bytes, mmap.mmap], offset: int) -> Tuple[GameRecord, int]:
+    """Decode the record starting at `offset` in `data`.
+
+    Raises:
+        RecordFormatError: When the record is truncated or malformed.
+
+    Returns:
+        Tuple[GameRecord, int]: The record and the offset just past it.
+    """
+
+    header: int = data[offset]
+    move_count: int = header >> 4
+    result_code: int = header & 0xF
+    end: int = offset + 1 + (move_count + 1) // 2
+
+    if move_count > CELL_COUNT or result_code >= len(RESULTS):
+        raise RecordFormatError(f"Invalid record header at byte {offset}.")
+    if end > len(data):
+        raise RecordFormatError(f"Truncated record at byte {offset}.")
+
+    moves: List[int] = []
+    for byte in data[offset + 1 : end]:
+        moves.append(byte >> 4)
+        moves.append(byte & 0xF)
+    del moves[move_count:]
+
+    if any(index >= CELL_COUNT for index in moves):
+        raise RecordFormatError(f"Invalid cell index in record at byte {offset}.")
+
+    return (GameRecord(tuple(moves), RESULTS[result_code]), end)
+
+
+class RecordWriter:
+    """Append-only, buffered writer of game records.
+
+    Besides writing `GameRecord`s directly, a writer can be passed to `loop_game`
+    as an observer, and records every game the loop plays.
+    """
+
+    _file: BinaryIO
+    _buffer: bytearray
+    _buffer_size: int
+    _moves: List[int]
+
+    def __init__(
+        self, path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE
+    ) -> None:
+        """Open `path` for appending, creating it with a header if needed.
+
+        Args:
+            path (Union[str, Path]): The record file.
+            buffer_size (int): Bytes held in memory before they are written.
+
+        Raises:
+            RecordFormatError: When `path` exists but is not a record file.
+        """
+
+        path = Path(path)
+
+        if path.exists() and path.stat().st_size:
+            with path.open("rb") as existing:
+                if existing.read(len(FILE_HEADER)) != FILE_HEADER:
+                    raise RecordFormatError(f"{str(path)!r} is not a record file.")
+
+        self._file: BinaryIO = path.open("ab")
+        self._buffer: bytearray = bytearray()
+        self._buffer_size: int = buffer_size
+        self._moves: List[int] = []
+
+        if self._file.tell() == 0:
+            self._buffer += FILE_HEADER
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def write(self, record: GameRecord) -> None:
+        """Append `record` to the file."""
+
+        self._buffer += encode_game(record)
+
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush buffered records and close the file."""
+
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def on_move(self, board: Board, cell: Cell, player_marker: PlayerMarker) -> None:
+        """Note a move of the game in progress.
+
+        Raises:
+            ValueError: When the game is not on the standard board.
+        """
+
+        if not board.is_standard():
+            raise ValueError("Only games on the standard board can be recorded.")
+
+        row, col = cell
+        self._moves.append(row * BOARD_SIZE + col)
+
+    def on_game_end(self, board: Board) -> None:
+        """Record the game in progress."""
+
+        self.write(GameRecord(tuple(self._moves), board.get_status()))
+        self._moves.clear()
+
+
+@contextmanager
+def _map_records(path: Union[str, Path]) -> Iterator[mmap.mmap]:
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            raise RecordFormatError(f"{str(path)!r} is empty.")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[: len(FILE_HEADER)] != FILE_HEADER:
+                raise RecordFormatError(f"{str(path)!r} is not a record file.")
+
+            yield data
+
+
+def read_games(
+    path: Union[str, Path], start: Union[int, None] = None, end: Union[int, None] = None
+) -> Iterator[GameRecord]:
+    """Lazily read the games in a record file.
+
+    The file is memory-mapped, so games are decoded as they are iterated and the
+    file is never read into memory as a whole.
+
+    Args:
+        path (Union[str, Path]): The record file.
+        start (Union[int, None]): Byte offset of the first record to read.
+            Defaults to the first record in the file.
+        end (Union[int, None]): Byte offset to stop reading at. Defaults to the
+            end of the file.
+
+    Raises:
+        RecordFormatError: When the file is not a record file, or holds a
+            truncated or malformed record.
+
+    Yields:
+        GameRecord: Each recorded game, in the order it was written.
+    """
+
+    with _map_records(path) as data:
+        offset: int = len(FILE_HEADER) if start is None else start
+        stop: int = len(data) if end is None else end
+
+        while offset < stop:
+            record, offset = decode_game(data, offset)
+            yield record
+
+
+def split_records(
+    path: Union[str, Path], chunk_bytes: int
+) -> Iterator[Tuple[int, int]]:
+    """Split a record file into byte ranges of whole records.
+
+    Only each record's first byte is read, so splitting is much cheaper than
+    decoding. Each range can be read independently with `read_games`.
+
+    Args:
+        path (Union[str, Path]): The record file.
+        chunk_bytes (int): The least size of each range but the last.
+
+    Raises:
+        RecordFormatError: When the file is not a record file.
+
+    Yields:
+        Tuple[int, int]: The `start` and `end` offsets of each range.
+    """
+
+    with _map_records(path) as data:
+        size: int = len(data)
+        start: int = len(FILE_HEADER)
+        offset: int = start
+
+        while offset < size:
+            offset += 1 + ((data[offset] >> 4) + 1) // 2
+
+            if offset - start >= chunk_bytes:
+                yield (start, min(offset, size))
+                start = offset
+
+        if start < size:
+            yield (start, size)
@@ -0,0 +1,359 @@
+"""Durable game sessions in SQLite.
+
+Every move of a recorded game is logged to a SQLite database in WAL mode, so a
+game survives a crash or disconnect and can be rebuilt from its move log.
+
+Writes never wait for the disk. They are queued and applied by one writer thread
+that commits whatever has queued up, across all games, as one transaction, so a
+busy server pays one commit per batch rather than one per move. If a batch
+fails, its writes are retried one at a time, so only the game whose write
+failed loses it, and the error is reported to that game alone. With
+`synchronous=NORMAL`, a committed batch survives a crash of the process; after
+a power loss the last batches may be lost, but the database stays consistent.
+"""
+
+import queue
+import sqlite3
+import threading
+
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from constants.constants import PlayerMarker, Cell
+
+from src.models.board import Board, GameStatus, MoveResult
+
+DEFAULT_BATCH_SIZE: int = 256
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    win_length INTEGER NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS moves (
+    game_id INTEGER NOT NULL REFERENCES games (id),
+    ply INTEGER NOT NULL,
+    cell INTEGER NOT NULL,
+    marker TEXT NOT NULL,
+    PRIMARY KEY (game_id, ply)
+) WITHOUT ROWID;
+"""
+
+type _Write = Tuple[int, str, Tuple[Union[int, str], ...]]
+
+
+class SessionNotFoundError(Exception):
+    """Custom error for when a game is not in the session database."""
+
+    _message: str
+
+    def __init__(self, message: str = "Game not found.") -> None:
+        self._message: str = message
+        super().__init__(self._message)
+
+
+class SessionStore:
+    """A session database, with a background writer thread.
+
+    Only one store should write to a database at a time.
+    """
+
+    _path: str
+    _batch_size: int
+    _queue: "queue.Queue[Union[_Write, None]]"
+    _lock: threading.Lock
+    _next_id: int
+    _batches: int
+    _writes: int
+    _errors: Dict[int, sqlite3.Error]
+    _writer: threading.Thread
+
+    def __init__(
+        self, path: Union[str, Path], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """Open or create the session database at `path`.
+
+        Args:
+            path (Union[str, Path]): The database file.
+            batch_size (int): The most writes committed in one transaction.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+            sqlite3.Error: When the database cannot be opened.
+        """
+
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch size: {batch_size!r}.")
+
+        self._path: str = str(path)
+        self._batch_size: int = batch_size
+        self._queue: "queue.Queue[Union[_Write, None]]" = queue.Queue()
+        self._lock: threading.Lock = threading.Lock()
+        self._batches: int = 0
+        self._writes: int = 0
+        self._errors: Dict[int, sqlite3.Error] = {}
+
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+            (last_id,) = connection.execute("SELECT MAX(id) FROM games").fetchone()
+        connection.close()
+
+        self._next_id: int = (last_id or 0) + 1
+        self._writer: threading.Thread = threading.Thread(
+            target=self._write_batches, name="session-writer", daemon=True
+        )
+        self._writer.start()
+
+    def __enter__(self) -> "SessionStore":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection = sqlite3.connect(self._path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _write_batches(self) -> None:
+        connection: sqlite3.Connection = self._connect()
+
+        try:
+            while True:
+                batch: List[Union[_Write, None]] = [self._queue.get()]
+
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                writes: List[_Write] = [write for write in batch if write is not None]
+                try:
+                    with connection:
+                        for _, statement, parameters in writes:
+                            connection.execute(statement, parameters)
+                    self._batches += 1
+                    self._writes += len(writes)
+                except sqlite3.Error:
+                    self._write_singly(connection, writes)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+                if None in batch:
+                    return
+        finally:
+            connection.close()
+
+    def _write_singly(
+        self, connection: sqlite3.Connection, writes: List[_Write]
+    ) -> None:
+        for game_id, statement, parameters in writes:
+            try:
+                with connection:
+                    connection.execute(statement, parameters)
+                self._batches += 1
+                self._writes += 1
+            except sqlite3.Error as e:
+                with self._lock:
+                    self._errors.setdefault(game_id, e)
+
+    def _raise_error(self, game_id: Union[int, None] = None) -> None:
+        with self._lock:
+            if game_id is None:
+                game_id = next(iter(self._errors), None)
+            error: Union[sqlite3.Error, None] = (
+                None if game_id is None else self._errors.pop(game_id, None)
+            )
+
+        if error is not None:
+            raise error
+
+    def _submit(
+        self, game_id: int, statement: str, *parameters: Union[int, str]
+    ) -> None:
+        self._raise_error(game_id)
+        if not self._writer.is_alive():
+            raise RuntimeError("The session store is closed.")
+
+        self._queue.put((game_id, statement, parameters))
+
+    def get_stats(self) -> Tuple[int, int]:
+        """Get the number of batches committed and the writes they held."""
+
+        return (self._batches, self._writes)
+
+    def create_game(self, board: Board) -> int:
+        """Record a new game on a blank board like `board`.
+
+        Returns:
+            int: The game's id.
+        """
+
+        with self._lock:
+            game_id: int = self._next_id
+            self._next_id += 1
+
+        width, height = board.get_size()
+        self._submit(
+            game_id,
+            "INSERT INTO games VALUES (?, ?, ?, ?, ?)",
+            game_id,
+            width,
+            height,
+            board.get_win_length(),
+            GameStatus.ONGOING.name,
+        )
+
+        return game_id
+
+    def record_move(
+        self, game_id: int, ply: int, index: int, player_marker: PlayerMarker
+    ) -> None:
+        """Queue a move for the game's log.
+
+        Args:
+            game_id (int): The game's id.
+            ply (int): The move's number, from 1.
+            index (int): The cell index played, `row * width + col`.
+            player_marker (PlayerMarker): "X" or "O".
+
+        Raises:
+            sqlite3.Error: When an earlier write of the game failed to commit.
+        """
+
+        self._submit(
+            game_id,
+            "INSERT OR REPLACE INTO moves VALUES (?, ?, ?, ?)",
+            game_id,
+            ply,
+            index,
+            player_marker,
+        )
+
+    def record_status(self, game_id: int, status: GameStatus) -> None:
+        """Queue the game's status, such as its result once it ends."""
+
+        self._submit(
+            game_id, "UPDATE games SET status = ? WHERE id = ?", status.name, game_id
+        )
+
+    def flush(self, game_id: Union[int, None] = None) -> None:
+        """Wait until every queued write is committed.
+
+        Args:
+            game_id (Union[int, None]): The game whose failed writes to report,
+                or `None` for any game's.
+
+        Raises:
+            sqlite3.Error: When a write failed to commit since the last check.
+        """
+
+        self._queue.join()
+        self._raise_error(game_id)
+
+    def close(self) -> None:
+        """Commit every queued write and stop the writer thread."""
+
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def load_game(self, game_id: int) -> Board:
+        """Rebuild a game's board from its move log.
+
+        Queued writes are committed first.
+
+        Raises:
+            sqlite3.Error: When one of the game's writes failed to commit since
+                the last check.
+            SessionNotFoundError: When there is no game `game_id`, or its move
+                log is not a legal game.
+
+        Returns:
+            Board: The board, with the logged moves played in order.
+        """
+
+        self.flush(game_id)
+
+        with self._connect() as connection:
+            game: Union[Tuple[int, int, int], None] = connection.execute(
+                "SELECT width, height, win_length FROM games WHERE id = ?", (game_id,)
+            ).fetchone()
+            moves: List[Tuple[int, PlayerMarker]] = connection.execute(
+                "SELECT cell, marker FROM moves WHERE game_id = ? ORDER BY ply",
+                (game_id,),
+            ).fetchall()
+        connection.close()
+
+        if game is None:
+            raise SessionNotFoundError(f"No game {game_id!r}.")
+
+        width, height, win_length = game
+        board: Board = Board(width=width, height=height, win_length=win_length)
+
+        for index, player_marker in moves:
+            row, col = divmod(index, width)
+
+            if board.try_move((row, col), player_marker) is not MoveResult.OK:
+                raise SessionNotFoundError(f"Game {game_id!r} has an illegal move log.")
+
+        return board
+
+    def open_session(
+        self, board: Board, game_id: Union[int, None] = None
+    ) -> "GameSession":
+        """Record the game played on `board` from here on.
+
+        Args:
+            board (Board): The game board.
+            game_id (Union[int, None]): The id of a game being resumed, or `None`
+                to create a new game.
+
+        Returns:
+            GameSession: An observer that logs the game's moves.
+        """
+
+        if game_id is None:
+            game_id = self.create_game(board)
+
+        return GameSession(self, game_id)
+
+
+class GameSession:
+    """Logs one game's moves and result to a `SessionStore` as it is played.
+
+    Implements the `GameObserver` protocol of `loop_game`.
+    """
+
+    _store: SessionStore
+    _game_id: int
+
+    def __init__(self, store: SessionStore, game_id: int) -> None:
+        self._store: SessionStore = store
+        self._game_id: int = game_id
+
+    def get_id(self) -> int:
+        """Get the game's id."""
+
+        return self._game_id
+
+    def on_move(self, board: Board, cell: Cell, player_marker: PlayerMarker) -> None:
+        """Queue the move for the game's log."""
+
+        row, col = cell
+        width, _ = board.get_size()
+
+        self._store.record_move(
+            self._game_id, board.get_move_count(), row * width + col, player_marker
+        )
+
+    def on_game_end(self, board: Board) -> None:
+        """Queue the game's result."""
+
+        self._store.record_status(self._game_id, board.get_status())
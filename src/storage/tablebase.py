@@ -0,0 +1,150 @@
+"""Memory-mapped tablebase files.
+
+A tablebase holds one byte per standard-board position, indexed by the position's
+base-3 encoding: the sum of `value * 3 ** index` over the cells, with blank = 0,
+"X" = 1 and "O" = 2. That is 3^9 = 19,683 entries, most of them unreachable.
+
+Each entry holds the minimax value for the player to move in its high nibble
+(`value + 2`, so 0 marks an unreachable position) and a best move's cell index in
+its low nibble (`NO_MOVE` once the game is over).
+
+The entries follow a 16-byte header: `TABLEBASE_MAGIC`, the format version, three
+reserved bytes, the entry count and the CRC-32 of the entries, little-endian.
+Files are opened with `mmap`, so lookups read the page cache directly and every
+process that opens the same file shares one copy.
+"""
+
+import mmap
+import struct
+import zlib
+
+from pathlib import Path
+from typing import Tuple, Union
+
+from constants.constants import BOARD_SIZE
+
+TABLEBASE_MAGIC: bytes = b"TTTB"
+TABLEBASE_VERSION: int = 1
+TABLEBASE_HEADER: struct.Struct = struct.Struct("<4sBxxxII")
+
+CELL_COUNT: int = BOARD_SIZE * BOARD_SIZE
+ENTRY_COUNT: int = 3**CELL_COUNT
+UNREACHABLE: int = 0
+NO_MOVE: int = 0xF
+
+# `_BASE_3_DIGITS[bits]` is the base-3 number with a 1 digit for each set bit.
+_BASE_3_DIGITS: Tuple[int, ...] = tuple(
+    sum(3**index for index in range(CELL_COUNT) if bits >> index & 1)
+    for bits in range(1 << CELL_COUNT)
+)
+
+
+class TablebaseError(Exception):
+    """Custom error for when a tablebase file is not valid."""
+
+    _message: str
+
+    def __init__(self, message: str = "Invalid tablebase.") -> None:
+        self._message: str = message
+        super().__init__(self._message)
+
+
+def base3_index(x_bits: int, o_bits: int) -> int:
+    """Get the base-3 index of a standard-board position from its bitboards."""
+
+    return _BASE_3_DIGITS[x_bits] + 2 * _BASE_3_DIGITS[o_bits]
+
+
+def encode_entry(value: int, move: int) -> int:
+    """Pack a minimax value (-1, 0 or 1) and a cell index or `NO_MOVE` into a byte."""
+
+    return (value + 2) << 4 | move
+
+
+def decode_entry(entry: int) -> Union[Tuple[int, int], None]:
+    """Unpack an entry byte into (value, move), or `None` if it is unreachable."""
+
+    if entry >> 4 == UNREACHABLE:
+        return None
+    return ((entry >> 4) - 2, entry & 0xF)
+
+
+def write_tablebase(path: Union[str, Path], entries: bytes) -> None:
+    """Write `entries` to a tablebase file at `path`, with its header.
+
+    Raises:
+        ValueError: When there are not exactly `ENTRY_COUNT` entries.
+    """
+
+    if len(entries) != ENTRY_COUNT:
+        raise ValueError(f"Expected {ENTRY_COUNT} entries, got {len(entries)}.")
+
+    header: bytes = TABLEBASE_HEADER.pack(
+        TABLEBASE_MAGIC, TABLEBASE_VERSION, ENTRY_COUNT, zlib.crc32(entries)
+    )
+    Path(path).write_bytes(header + entries)
+
+
+class Tablebase:
+    """A read-only, memory-mapped tablebase file."""
+
+    _data: mmap.mmap
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Open and validate the tablebase at `path`.
+
+        Raises:
+            TablebaseError: When the file is not a tablebase, is of another
+                version, or fails its checksum.
+        """
+
+        with open(path, "rb") as file:
+            try:
+                self._data: mmap.mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError as e:
+                raise TablebaseError(f"{str(path)!r} is empty.") from e
+
+        if len(self._data) != TABLEBASE_HEADER.size + ENTRY_COUNT:
+            self.close()
+            raise TablebaseError(f"{str(path)!r} is not a tablebase.")
+
+        magic, version, count, checksum = TABLEBASE_HEADER.unpack_from(self._data)
+
+        if magic != TABLEBASE_MAGIC or count != ENTRY_COUNT:
+            self.close()
+            raise TablebaseError(f"{str(path)!r} is not a tablebase.")
+        if version != TABLEBASE_VERSION:
+            self.close()
+            raise TablebaseError(f"Unsupported tablebase version: {version!r}.")
+        if zlib.crc32(self._data[TABLEBASE_HEADER.size :]) != checksum:
+            self.close()
+            raise TablebaseError(f"{str(path)!r} failed its checksum.")
+
+    def __enter__(self) -> "Tablebase":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file."""
+
+        self._data.close()
+
+    def get_entry(self, index: int) -> int:
+        """Get the raw entry byte at base-3 `index`."""
+
+        return self._data[TABLEBASE_HEADER.size + index]
+
+    def lookup(self, x_bits: int, o_bits: int) -> Union[Tuple[int, int], None]:
+        """Look up a position by its bitboards.
+
+        Returns:
+            Union[Tuple[int, int], None]: The value for the player to move and a
+                best move's cell index (`NO_MOVE` if the game is over), or `None`
+                if the position is unreachable.
+        """
+
+        return decode_entry(self.get_entry(base3_index(x_bits, o_bits)))
@@ -0,0 +1,479 @@
+"""Parallel agent tournaments with Elo ratings.
+
+Agents from `AGENT_TYPES` play round-robin or Swiss tournaments. Games are sent
+to worker processes in chunks, and each result is appended to a JSON Lines file
+as soon as its chunk comes back, so an interrupted tournament keeps every game
+already played. Every pairing plays an even number of games, each agent taking
+"X" in half of them.
+
+Ratings are maximum-likelihood Elo ratings over all games, draws counting half,
+centered on `BASE_RATING`. Each pair of agents that met is also credited one
+virtual draw, which keeps the ratings of agents that won or lost every game
+finite. Confidence intervals come from the standard error of each rating.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import sys
+
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from constants.constants import BOARD_SIZE, WIN_LENGTH
+
+from src.agents import AGENT_TYPES, DEFAULT_MOVE_TIME, Agent, play_game
+
+from src.models.board import Board, GameStatus
+
+BASE_RATING: float = 1500.0
+DEFAULT_GAMES_PER_PAIRING: int = 2
+DEFAULT_ROUNDS: int = 5
+DEFAULT_CHUNK_SIZE: int = 8
+CONFIDENCE_Z: float = 1.96
+
+FORMATS: Tuple[str, ...] = ("round-robin", "swiss")
+RESULT_NAMES: Dict[GameStatus, str] = {
+    GameStatus.X_WON: "x",
+    GameStatus.O_WON: "o",
+    GameStatus.DRAW: "draw",
+}
+X_SCORES: Dict[str, float] = {"x": 1.0, "o": 0.0, "draw": 0.5}
+
+_ELO_SCALE: float = 400 / math.log(10)
+_MAX_FIT_ITERATIONS: int = 1000
+_FIT_TOLERANCE: float = 1e-9
+
+
+class Pairing(NamedTuple):
+    """One scheduled game."""
+
+    game: int
+    round: int
+    x: str
+    o: str
+    seed: int
+
+
+class GameResult(NamedTuple):
+    """The result of one game: "x", "o" or "draw"."""
+
+    game: int
+    round: int
+    x: str
+    o: str
+    result: str
+    plies: int
+
+    def to_json(self) -> str:
+        """Serialize as one JSON line, without the line ending."""
+
+        return json.dumps(self._asdict())
+
+
+class EloRating(NamedTuple):
+    """An agent's rating and its 95% confidence interval, `rating ± error`."""
+
+    agent: str
+    rating: float
+    error: float
+    games: int
+    score: float
+
+    def describe(self) -> str:
+        """Summarize the rating on one line."""
+
+        return (
+            f"{self.agent:<12} {self.rating:7.1f} ± {self.error:5.1f}  "
+            f"{self.score:6.1f}/{self.games:<5} ({self.score / max(self.games, 1):.1%})"
+        )
+
+
+def play_chunk(
+    pairings: Sequence[Pairing], rules: Tuple[int, int, int], move_time: float
+) -> List[GameResult]:
+    """Play a chunk of games, creating fresh agents for each game.
+
+    Args:
+        pairings (Sequence[Pairing]): The games to play.
+        rules (Tuple[int, int, int]): Board width, height and win length.
+        move_time (float): Seconds per move for agents that search.
+
+    Returns:
+        List[GameResult]: One result per pairing, in order.
+    """
+
+    width, height, win_length = rules
+    results: List[GameResult] = []
+
+    for pairing in pairings:
+        board: Board = Board(width=width, height=height, win_length=win_length)
+        x_agent: Agent = AGENT_TYPES[pairing.x](move_time, pairing.seed)
+        o_agent: Agent = AGENT_TYPES[pairing.o](move_time, pairing.seed + 1)
+        status: GameStatus = play_game(board, x_agent, o_agent)
+
+        results.append(
+            GameResult(
+                pairing.game,
+                pairing.round,
+                pairing.x,
+                pairing.o,
+                RESULT_NAMES[status],
+                board.get_move_count(),
+            )
+        )
+
+    return results
+
+
+def _pair_games(
+    pairs: Iterable[Tuple[str, str]],
+    games_per_pairing: int,
+    round_number: int,
+    first_game: int,
+    rng: random.Random,
+) -> List[Pairing]:
+    pairings: List[Pairing] = []
+
+    for first, second in pairs:
+        for game in range(games_per_pairing):
+            x, o = (first, second) if game % 2 == 0 else (second, first)
+            pairings.append(
+                Pairing(
+                    first_game + len(pairings),
+                    round_number,
+                    x,
+                    o,
+                    rng.getrandbits(32),
+                )
+            )
+
+    return pairings
+
+
+def swiss_pairs(
+    agents: Sequence[str],
+    scores: Dict[str, float],
+    played: Set[Tuple[str, str]],
+) -> List[Tuple[str, str]]:
+    """Pair agents with the closest scores, avoiding rematches where possible.
+
+    With an odd number of agents, the lowest-ranked agent left unpaired sits out.
+
+    Args:
+        agents (Sequence[str]): Agent types, in seeding order for ties.
+        scores (Dict[str, float]): Points so far.
+        played (Set[Tuple[str, str]]): Pairs that have already met, both ways.
+
+    Returns:
+        List[Tuple[str, str]]: The round's pairs.
+    """
+
+    standings: List[str] = sorted(agents, key=lambda agent: -scores.get(agent, 0.0))
+    pairs: List[Tuple[str, str]] = []
+
+    while len(standings) > 1:
+        first: str = standings.pop(0)
+        opponent: str = next(
+            (agent for agent in standings if (first, agent) not in played),
+            standings[0],
+        )
+        standings.remove(opponent)
+        pairs.append((first, opponent))
+
+    return pairs
+
+
+def _run_games(
+    executor: ProcessPoolExecutor,
+    pairings: Sequence[Pairing],
+    rules: Tuple[int, int, int],
+    move_time: float,
+    chunk_size: int,
+) -> Iterator[GameResult]:
+    futures: List[Future[List[GameResult]]] = [
+        executor.submit(
+            play_chunk, pairings[start : start + chunk_size], rules, move_time
+        )
+        for start in range(0, len(pairings), chunk_size)
+    ]
+
+    for future in as_completed(futures):
+        yield from future.result()
+
+
+def run_tournament(
+    agents: Sequence[str],
+    output: TextIO,
+    tournament_format: str = "round-robin",
+    games_per_pairing: int = DEFAULT_GAMES_PER_PAIRING,
+    rounds: int = DEFAULT_ROUNDS,
+    rules: Tuple[int, int, int] = (BOARD_SIZE, BOARD_SIZE, WIN_LENGTH),
+    move_time: float = DEFAULT_MOVE_TIME,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 0,
+) -> List[GameResult]:
+    """Play a tournament, writing each result to `output` as it arrives.
+
+    Args:
+        agents (Sequence[str]): Distinct agent types from `AGENT_TYPES`.
+        output (TextIO): Receives one JSON line per game, flushed as it arrives.
+        tournament_format (str): "round-robin" or "swiss".
+        games_per_pairing (int): Games each time two agents meet; must be even,
+            so colors are swapped evenly.
+        rounds (int): Rounds of a Swiss tournament.
+        rules (Tuple[int, int, int]): Board width, height and win length.
+        move_time (float): Seconds per move for agents that search.
+        workers (int | None): Worker processes. Defaults to one per CPU.
+        chunk_size (int): Games sent to a worker at a time.
+        seed (int): Seed for the schedule and the agents.
+
+    Raises:
+        ValueError: When an argument is invalid.
+
+    Returns:
+        List[GameResult]: Every result, in the order they arrived.
+    """
+
+    if len(set(agents)) != len(agents) or len(agents) < 2:
+        raise ValueError("A tournament needs at least two distinct agents.")
+    if unknown := [agent for agent in agents if agent not in AGENT_TYPES]:
+        raise ValueError(f"Unknown agents: {', '.join(unknown)}.")
+    if tournament_format not in FORMATS:
+        raise ValueError(f"Unknown format: {tournament_format!r}.")
+    if games_per_pairing <= 0 or games_per_pairing % 2:
+        raise ValueError("Games per pairing must be a positive even number.")
+    if rounds <= 0 or chunk_size <= 0 or move_time <= 0:
+        raise ValueError("Rounds, chunk size and move time must be positive.")
+    if "solver" in agents and rules != (BOARD_SIZE, BOARD_SIZE, WIN_LENGTH):
+        raise ValueError("The solver only plays the standard 3x3 board.")
+
+    # Raises `ValueError` for an invalid size before any worker starts.
+    Board(width=rules[0], height=rules[1], win_length=rules[2])
+
+    round_count: int = 1 if tournament_format == "round-robin" else rounds
+    rng: random.Random = random.Random(seed)
+    results: List[GameResult] = []
+    scores: Dict[str, float] = defaultdict(float)
+    played: Set[Tuple[str, str]] = set()
+
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as executor:
+        for round_number in range(1, round_count + 1):
+            pairs: List[Tuple[str, str]] = (
+                list(itertools.combinations(agents, 2))
+                if tournament_format == "round-robin"
+                else swiss_pairs(agents, scores, played)
+            )
+
+            pairings: List[Pairing] = _pair_games(
+                pairs, games_per_pairing, round_number, len(results), rng
+            )
+
+            for result in _run_games(executor, pairings, rules, move_time, chunk_size):
+                output.write(result.to_json() + "\n")
+                output.flush()
+                results.append(result)
+
+                scores[result.x] += X_SCORES[result.result]
+                scores[result.o] += 1 - X_SCORES[result.result]
+
+            for first, second in pairs:
+                played.update({(first, second), (second, first)})
+
+    return results
+
+
+def compute_elo(results: Iterable[GameResult]) -> List[EloRating]:
+    """Fit Elo ratings to game results.
+
+    Args:
+        results (Iterable[GameResult]): The games.
+
+    Returns:
+        List[EloRating]: One rating per agent, highest first.
+    """
+
+    games: Dict[Tuple[str, str], float] = defaultdict(float)
+    points: Dict[Tuple[str, str], float] = defaultdict(float)
+
+    for result in results:
+        score: float = X_SCORES[result.result]
+        games[(result.x, result.o)] += 1
+        games[(result.o, result.x)] += 1
+        points[(result.x, result.o)] += score
+        points[(result.o, result.x)] += 1 - score
+
+    agents: List[str] = sorted({first for first, _ in games})
+    played_games: Dict[str, int] = {
+        agent: int(sum(count for (first, _), count in games.items() if first == agent))
+        for agent in agents
+    }
+    totals: Dict[str, float] = {
+        agent: sum(score for (first, _), score in points.items() if first == agent)
+        for agent in agents
+    }
+
+    # One virtual draw per pair that met.
+    for pair in list(games):
+        games[pair] += 1
+        points[pair] += 0.5
+
+    opponents: Dict[str, List[str]] = {
+        agent: [second for first, second in games if first == agent] for agent in agents
+    }
+    strengths: Dict[str, float] = dict.fromkeys(agents, 0.0)
+    information: Dict[str, float] = dict.fromkeys(agents, 0.0)
+
+    # Newton steps on each rating in turn, in natural-log units.
+    for _ in range(_MAX_FIT_ITERATIONS):
+        largest_step: float = 0.0
+
+        for agent in agents:
+            expected: float = 0.0
+            information[agent] = 0.0
+
+            for opponent in opponents[agent]:
+                p: float = 1 / (1 + math.exp(strengths[opponent] - strengths[agent]))
+                expected += games[(agent, opponent)] * p
+                information[agent] += games[(agent, opponent)] * p * (1 - p)
+
+            actual: float = sum(
+                points[(agent, opponent)] for opponent in opponents[agent]
+            )
+            step: float = (actual - expected) / information[agent]
+            strengths[agent] += step
+            largest_step = max(largest_step, abs(step))
+
+        mean: float = sum(strengths.values()) / len(agents) if agents else 0.0
+        for agent in agents:
+            strengths[agent] -= mean
+
+        if largest_step < _FIT_TOLERANCE:
+            break
+
+    ratings: List[EloRating] = [
+        EloRating(
+            agent,
+            BASE_RATING + _ELO_SCALE * strengths[agent],
+            CONFIDENCE_Z * _ELO_SCALE / math.sqrt(information[agent]),
+            played_games[agent],
+            totals[agent],
+        )
+        for agent in agents
+    ]
+
+    return sorted(ratings, key=lambda rating: -rating.rating)
+
+
+def read_results(path: str | Path) -> Iterator[GameResult]:
+    """Read the results a tournament wrote to `path`."""
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield GameResult(**json.loads(line))
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="tournament", description="Play agents against each other."
+    )
+    parser.add_argument(
+        "agents",
+        nargs="+",
+        choices=sorted(AGENT_TYPES),
+        metavar="AGENT",
+        help=f"agents to enter: {', '.join(sorted(AGENT_TYPES))}",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="round-robin",
+        dest="tournament_format",
+        help="tournament format (default: round-robin)",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=DEFAULT_GAMES_PER_PAIRING,
+        help=f"games per pairing, even (default: {DEFAULT_GAMES_PER_PAIRING})",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help=f"rounds of a Swiss tournament (default: {DEFAULT_ROUNDS})",
+    )
+    parser.add_argument("--width", type=int, default=BOARD_SIZE)
+    parser.add_argument("--height", type=int, default=BOARD_SIZE)
+    parser.add_argument("--win-length", type=int, default=WIN_LENGTH)
+    parser.add_argument(
+        "--move-time",
+        type=float,
+        default=DEFAULT_MOVE_TIME,
+        help=f"seconds per move for search and mcts (default: {DEFAULT_MOVE_TIME})",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"games sent to a worker at a time (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("tournament.jsonl"),
+        help="file results are appended to as they arrive (default: tournament.jsonl)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run a tournament and print the ratings."""
+
+    args: argparse.Namespace = _parse_args(argv)
+
+    try:
+        with open(args.output, "a", encoding="utf-8") as output:
+            results: List[GameResult] = run_tournament(
+                args.agents,
+                output,
+                args.tournament_format,
+                args.games,
+                args.rounds,
+                (args.width, args.height, args.win_length),
+                args.move_time,
+                args.workers,
+                args.chunk_size,
+                args.seed,
+            )
+    except ValueError as e:
+        sys.exit(f"tournament: {e}")
+
+    for rating in compute_elo(results):
+        print(rating.describe())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,16 @@
 """Prompt players for moves."""
 
-from typing import cast
+from typing import Union
 
-from constants.constants import (
-    PlayerMarker,
-    CellKey,
-    Cell,
-    VALID_CELL_KEYS,
-    CELL_KEY_TO_CELL_MAP,
-)
+from constants.constants import PlayerMarker, Cell
 
-from src.models.board import Board, InvalidCellError, InvalidMoveError
+from src.models.board import Board, MoveResult
 
-from src.utils.colorize import red, green, cyan
-
-
-class InvalidCellKeyError(Exception):
-    """Custom exception for when an incorrect cell key is provided."""
-
-    _message: str
-
-    def __init__(self, message: str = "Invalid cell key.") -> None:
-        self._message: str = message
-        super().__init__(self._message)
+from src.models.cell_keys import cell_key_to_cell
 
+from src.ui.renderer import TerminalRenderer, get_renderer
 
-def _get_cell_from_cell_key(cell_key: CellKey) -> Cell:
-    if not cell_key in VALID_CELL_KEYS:
-        raise InvalidCellKeyError(f"Invalid cell key: {cell_key!r}.")
-
-    cell: Cell = CELL_KEY_TO_CELL_MAP[cell_key]
-    return cell
+from src.utils.colorize import red, green, cyan
 
 
 def prompt(player_marker: PlayerMarker, board: Board) -> None:
@@ -41,17 +21,35 @@ def prompt(player_marker: PlayerMarker, board: Board) -> None:
         board (Board): The game board.
     """
 
+    renderer: TerminalRenderer = get_renderer()
     player_str = red("X") if player_marker == "X" else green("O")
-    player_prompt: str = f"\n   {player_str} {cyan('→')} "
+    player_prompt: str = f"   {player_str} {cyan('→')} "
+    status: str = player_prompt
 
     while True:
-        print(f"\n{board.stringify_board()}")
-        move: str = input(player_prompt)
+        renderer.draw(board, status)
+        move: str = input()
+        renderer.note_line_feed()
 
-        try:
-            cell = _get_cell_from_cell_key(cast(CellKey, move))
-            board.make_move(cell, player_marker)
+        cell: Union[Cell, None] = cell_key_to_cell(move, *board.get_size())
+
+        if cell is not None and board.try_move(cell, player_marker) is MoveResult.OK:
             break
-        except (InvalidCellKeyError, InvalidCellError, InvalidMoveError) as _:
-            print(red(" Try again "))
-            continue
+
+        status = f"{red(' Try again ')}\n{player_prompt}"
+
+
+def announce_move(player_marker: PlayerMarker, board: Board, cell: Cell) -> None:
+    """Show the board and the move a computer player `player_marker` chose.
+
+    Args:
+        player_marker (PlayerMarker): "X" or "O".
+        board (Board): The game board, before the move is played.
+        cell (Cell): The cell the computer player chose.
+    """
+
+    player_str = red("X") if player_marker == "X" else green("O")
+
+    get_renderer().draw(
+        board, f"   {player_str} {cyan('→')} {board.get_cell_key(cell)}\n"
+    )
@@ -0,0 +1,197 @@
+"""Single-write terminal renderer.
+
+A frame is a blank line, the board, a blank line and a status text, such as a
+move prompt. Each frame is built into one string and written with a single
+`write`. On a terminal, frames after the first are redrawn in place: the cursor
+is moved back up with ANSI escapes, only the cells that changed are rewritten,
+and the status text is replaced. Anywhere else every frame is written in full.
+"""
+
+import sys
+
+from typing import List, NamedTuple, TextIO, Tuple, Union
+
+from src.models.board import Board
+
+# Frame lines above the first board line, and between the last board line and
+# the status text.
+FRAME_TOP_MARGIN: int = 1
+FRAME_STATUS_MARGIN: int = 1
+
+ANSI_CURSOR_UP: str = "\033[{}A"
+ANSI_CURSOR_DOWN: str = "\033[{}B"
+ANSI_CURSOR_COLUMN: str = "\033[{}G"
+ANSI_CLEAR_TO_END: str = "\033[J"
+
+
+class RenderStats(NamedTuple):
+    """Counters for the frames a renderer has written."""
+
+    frames: int
+    bytes_written: int
+    last_frame_bytes: int
+
+    @property
+    def bytes_per_frame(self) -> float:
+        """Average bytes written per frame."""
+
+        return self.bytes_written / self.frames if self.frames else 0.0
+
+
+class TerminalRenderer:
+    """Draws board frames to a text stream, in place when it is a terminal.
+
+    Anything else written to the stream between frames throws off in-place
+    redraws; call `reset` after such output so the next frame is drawn in full.
+    """
+
+    _stream: TextIO
+    _interactive: bool
+    _frame: Union[Tuple[int, int, int, int], None]
+    _status_line: int
+    _cursor_line: int
+    _frames: int
+    _bytes_written: int
+    _last_frame_bytes: int
+
+    def __init__(
+        self, stream: Union[TextIO, None] = None, interactive: Union[bool, None] = None
+    ) -> None:
+        """Create a renderer.
+
+        Args:
+            stream (Union[TextIO, None]): Where frames are written. Defaults to
+                `sys.stdout`.
+            interactive (Union[bool, None]): Whether to redraw in place. Defaults
+                to whether `stream` is a terminal.
+        """
+
+        self._stream: TextIO = stream if stream is not None else sys.stdout
+        self._interactive: bool = (
+            interactive if interactive is not None else self._stream.isatty()
+        )
+        self._frame: Union[Tuple[int, int, int, int], None] = None
+        self._status_line: int = 0
+        self._cursor_line: int = 0
+        self._frames: int = 0
+        self._bytes_written: int = 0
+        self._last_frame_bytes: int = 0
+
+    def is_interactive(self) -> bool:
+        """Whether frames are redrawn in place."""
+
+        return self._interactive
+
+    def get_stats(self) -> RenderStats:
+        """Get the frame and byte counters."""
+
+        return RenderStats(self._frames, self._bytes_written, self._last_frame_bytes)
+
+    def reset(self) -> None:
+        """Draw the next frame in full, below whatever is on screen."""
+
+        self._frame = None
+
+    def note_line_feed(self) -> None:
+        """Note that the cursor moved down a line outside the renderer.
+
+        Call this after reading a line of input at the end of a frame, since
+        the terminal echoes its line ending.
+        """
+
+        self._cursor_line += 1
+
+    def draw(self, board: Board, status: str = "") -> int:
+        """Draw `board` followed by `status`.
+
+        The cursor is left at the end of `status`, so a status without a final
+        newline works as an input prompt.
+
+        Args:
+            board (Board): The game board.
+            status (str): Text shown below the board.
+
+        Returns:
+            int: The number of bytes written.
+        """
+
+        width, height = board.get_size()
+        x_bits, o_bits = board.get_bitboards()
+
+        if (
+            self._interactive
+            and self._frame is not None
+            and self._frame[2:] == (width, height)
+        ):
+            text: str = self._redraw(board, x_bits, o_bits, status)
+        else:
+            board_display: str = board.stringify_board()
+            text = (
+                "\n" * FRAME_TOP_MARGIN
+                + board_display
+                + "\n" * (FRAME_STATUS_MARGIN + 1)
+                + status
+            )
+            self._status_line = (
+                FRAME_TOP_MARGIN + board_display.count("\n") + 1 + FRAME_STATUS_MARGIN
+            )
+
+        self._frame = (x_bits, o_bits, width, height)
+        self._cursor_line = self._status_line + status.count("\n")
+
+        self._stream.write(text)
+        self._stream.flush()
+
+        frame_bytes: int = len(text.encode())
+        self._frames += 1
+        self._bytes_written += frame_bytes
+        self._last_frame_bytes = frame_bytes
+
+        return frame_bytes
+
+    def _move_to(self, parts: List[str], line: int, column: int) -> None:
+        if line < self._cursor_line:
+            parts.append(ANSI_CURSOR_UP.format(self._cursor_line - line))
+        elif line > self._cursor_line:
+            parts.append(ANSI_CURSOR_DOWN.format(line - self._cursor_line))
+
+        parts.append(ANSI_CURSOR_COLUMN.format(column + 1))
+        self._cursor_line = line
+
+    def _redraw(self, board: Board, x_bits: int, o_bits: int, status: str) -> str:
+        assert self._frame is not None
+        previous_x_bits, previous_o_bits, width, _ = self._frame
+        changed: int = (x_bits ^ previous_x_bits) | (o_bits ^ previous_o_bits)
+        parts: List[str] = []
+
+        while changed:
+            low: int = changed & -changed
+            row, col = divmod(low.bit_length() - 1, width)
+            line, column = board.get_cell_screen_position((row, col))
+
+            self._move_to(parts, FRAME_TOP_MARGIN + line, column)
+            parts.append(board.stringify_cell((row, col)))
+            changed ^= low
+
+        self._move_to(parts, self._status_line, 0)
+        parts.append(ANSI_CLEAR_TO_END)
+        parts.append(status)
+
+        return "".join(parts)
+
+
+_default_renderer: Union[TerminalRenderer, None] = None
+
+
+def get_renderer() -> TerminalRenderer:
+    """Get the renderer shared by the prompts and the game loop.
+
+    It is created on first use, writing to `sys.stdout` as it is at that time.
+    """
+
+    global _default_renderer
+
+    if _default_renderer is None or _default_renderer._stream is not sys.stdout:
+        _default_renderer = TerminalRenderer()
+
+    return _default_renderer
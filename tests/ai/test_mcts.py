@@ -0,0 +1,136 @@
+"""Test suite for the Monte Carlo tree search."""
+
+import unittest
+
+from typing import List
+
+from constants.constants import CellValue
+
+from src.ai.mcts import MCTSResult, MonteCarloTreeSearch
+
+from src.models.board import Board, GameStatus
+
+
+class TestMonteCarloTreeSearchStandardBoard(unittest.TestCase):
+    def test_search_takes_immediate_win(self) -> None:
+        winnable_state: List[List[CellValue]] = [
+            ["X", "X", None],
+            ["O", "O", None],
+            [None, None, None],
+        ]
+
+        result: MCTSResult = MonteCarloTreeSearch(
+            time_limit=None, iterations=2000, seed=0
+        ).search(Board(starting_state=winnable_state))
+
+        self.assertEqual(result.cell, (0, 2))
+        self.assertEqual(result.value, 1.0)
+
+    def test_search_blocks_forced_loss(self) -> None:
+        losing_state: List[List[CellValue]] = [
+            ["X", "X", None],
+            [None, "O", None],
+            [None, None, None],
+        ]
+
+        result: MCTSResult = MonteCarloTreeSearch(
+            time_limit=None, iterations=5000, seed=0
+        ).search(Board(starting_state=losing_state))
+
+        self.assertEqual(result.cell, (0, 2))
+
+    def test_search_reports_statistics(self) -> None:
+        result: MCTSResult = MonteCarloTreeSearch(
+            time_limit=None, iterations=500, seed=0
+        ).search(Board())
+
+        self.assertEqual(result.iterations, 500)
+        self.assertEqual(result.workers, 1)
+        self.assertEqual(result.tree_size, 501)
+        self.assertGreater(result.iterations_per_second, 0)
+        self.assertIn("500 iterations", result.describe())
+
+    def test_search_does_not_modify_board(self) -> None:
+        board: Board = Board()
+        board.make_move((1, 1), "X")
+
+        MonteCarloTreeSearch(time_limit=None, iterations=200, seed=0).search(board)
+
+        self.assertEqual(board.get_bitboards(), (1 << 4, 0))
+        self.assertEqual(board.get_history(), ((1, 1),))
+
+    def test_tree_is_reused_after_moves_are_played(self) -> None:
+        tree_sizes: List[int] = []
+
+        for reuse_tree in [True, False]:
+            search: MonteCarloTreeSearch = MonteCarloTreeSearch(
+                time_limit=None, iterations=5000, reuse_tree=reuse_tree, seed=0
+            )
+            board: Board = Board()
+            board.push(search.choose_move(board))
+            board.push((0, 0) if board.get_cell((0, 0)) is None else (2, 2))
+
+            tree_sizes.append(search.search(board).tree_size)
+
+        reused, fresh = tree_sizes
+        self.assertGreater(reused, fresh)
+
+    def test_tree_is_discarded_for_an_unrelated_position(self) -> None:
+        search: MonteCarloTreeSearch = MonteCarloTreeSearch(
+            time_limit=None, iterations=300, seed=0
+        )
+        search.search(Board(width=4, height=4, win_length=3))
+
+        result: MCTSResult = search.search(Board())
+
+        self.assertEqual(result.tree_size, 301)
+
+    def test_self_play_draws(self) -> None:
+        board: Board = Board()
+
+        with MonteCarloTreeSearch(time_limit=None, iterations=3000, seed=0) as search:
+            while board.get_status() is GameStatus.ONGOING:
+                board.push(search.choose_move(board))
+
+        self.assertIs(board.get_status(), GameStatus.DRAW)
+
+    def test_root_parallel_search_merges_workers(self) -> None:
+        with MonteCarloTreeSearch(
+            time_limit=None, iterations=1000, workers=2, seed=0
+        ) as search:
+            result: MCTSResult = search.search(Board())
+
+        self.assertEqual(result.workers, 2)
+        self.assertEqual(result.iterations, 1000)
+        self.assertEqual(result.tree_size, 1002)
+
+    def test_search_rejects_finished_game(self) -> None:
+        board: Board = Board()
+        for cell in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            board.push(cell)
+
+        with self.assertRaises(ValueError):
+            MonteCarloTreeSearch().search(board)
+
+    def test_rejects_invalid_budgets(self) -> None:
+        for kwargs in [
+            {"time_limit": 0},
+            {"iterations": 0},
+            {"time_limit": None},
+            {"workers": 0},
+        ]:
+            with self.assertRaises(ValueError):
+                MonteCarloTreeSearch(**kwargs)  # type: ignore[arg-type]
+
+
+class TestMonteCarloTreeSearchLargeBoard(unittest.TestCase):
+    def test_search_takes_immediate_win_on_large_board(self) -> None:
+        board: Board = Board(width=7, height=7, win_length=4)
+        for cell in [(3, 0), (0, 0), (3, 1), (0, 6), (3, 2), (6, 6)]:
+            board.push(cell)
+
+        result: MCTSResult = MonteCarloTreeSearch(
+            time_limit=None, iterations=3000, seed=0
+        ).search(board)
+
+        self.assertEqual(result.cell, (3, 3))
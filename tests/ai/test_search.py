@@ -0,0 +1,196 @@
+"""Test suite for the alpha-beta search."""
+
+import unittest
+
+from typing import List, Set, Tuple
+
+from constants.constants import CellValue
+
+from src.ai import solver
+
+from src.ai.search import WIN_SCORE, AlphaBetaSearch, SearchResult
+
+from src.ai.transposition import TranspositionTable
+
+from src.models.board import Board, GameStatus
+
+from src.models.position import Position
+
+
+def reachable_positions(board: Board, seen: Set[Tuple[int, int]]) -> None:
+    """Collect the bitboards of every unfinished position reachable from `board`."""
+
+    if board.get_bitboards() in seen or board.get_status() is not GameStatus.ONGOING:
+        return
+
+    seen.add(board.get_bitboards())
+    legal_moves: int = board.legal_moves()
+
+    for index in range(9):
+        if legal_moves >> index & 1:
+            board.push(divmod(index, 3))
+            reachable_positions(board, seen)
+            board.pop()
+
+
+class TestAlphaBetaSearchStandardBoard(unittest.TestCase):
+    def test_blank_board_is_a_draw(self) -> None:
+        result: SearchResult = AlphaBetaSearch(time_limit=None).search(Board())
+
+        self.assertEqual(result.score, 0)
+        self.assertEqual(result.depth, 9)
+        self.assertFalse(result.is_decided())
+
+    def test_search_takes_immediate_win(self) -> None:
+        winnable_state: List[List[CellValue]] = [
+            ["X", "X", None],
+            ["O", "O", None],
+            [None, None, None],
+        ]
+
+        result: SearchResult = AlphaBetaSearch(time_limit=None).search(
+            Board(starting_state=winnable_state)
+        )
+
+        self.assertEqual(result.cell, (0, 2))
+        self.assertEqual(result.score, WIN_SCORE)
+        self.assertTrue(result.is_decided())
+
+    def test_search_blocks_forced_loss(self) -> None:
+        losing_state: List[List[CellValue]] = [
+            ["X", "X", None],
+            [None, "O", None],
+            [None, None, None],
+        ]
+
+        result: SearchResult = AlphaBetaSearch(time_limit=None).search(
+            Board(starting_state=losing_state)
+        )
+
+        self.assertEqual(result.cell, (0, 2))
+
+    def test_search_plays_a_best_move_in_every_position(self) -> None:
+        positions: Set[Tuple[int, int]] = set()
+        reachable_positions(Board(), positions)
+        self.assertEqual(len(positions), 4520)
+
+        for x_bits, o_bits in sorted(positions):
+            board: Board = Board.from_position(Position(x_bits, o_bits))
+            _, best_moves = solver.solve_position(board)
+            search: AlphaBetaSearch = AlphaBetaSearch(
+                time_limit=None, table=TranspositionTable(1024)
+            )
+
+            row, col = search.search(board).cell
+
+            with self.subTest(x_bits=x_bits, o_bits=o_bits):
+                self.assertIn(row * 3 + col, best_moves)
+
+    def test_search_does_not_modify_board(self) -> None:
+        board: Board = Board()
+        board.make_move((1, 1), "X")
+
+        AlphaBetaSearch(time_limit=None).search(board)
+
+        self.assertEqual(board.get_bitboards(), (1 << 4, 0))
+        self.assertEqual(board.get_move_count(), 1)
+
+    def test_search_rejects_finished_game(self) -> None:
+        won_state: List[List[CellValue]] = [
+            ["X", "X", "X"],
+            ["O", "O", None],
+            [None, None, None],
+        ]
+
+        with self.assertRaises(ValueError):
+            AlphaBetaSearch().search(Board(starting_state=won_state))
+
+
+class TestAlphaBetaSearchBudget(unittest.TestCase):
+    def test_node_limit_stops_search_early(self) -> None:
+        search: AlphaBetaSearch = AlphaBetaSearch(time_limit=None, node_limit=200)
+        result: SearchResult = search.search(Board())
+
+        self.assertLess(result.depth, 9)
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertIs(search.get_last_result(), result)
+
+    def test_first_iteration_always_completes(self) -> None:
+        board: Board = Board(width=7, height=7, win_length=4)
+        board.make_move((3, 3), "X")
+
+        result: SearchResult = AlphaBetaSearch(time_limit=None, node_limit=1).search(
+            board
+        )
+
+        self.assertEqual(result.depth, 1)
+        self.assertIsNone(board.get_cell(result.cell))
+
+    def test_max_depth_limits_iterations(self) -> None:
+        result: SearchResult = AlphaBetaSearch(time_limit=None, max_depth=3).search(
+            Board()
+        )
+
+        self.assertEqual(result.depth, 3)
+
+    def test_invalid_limits_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            AlphaBetaSearch(time_limit=0)
+        with self.assertRaises(ValueError):
+            AlphaBetaSearch(node_limit=0)
+
+
+class TestAlphaBetaSearchLargeBoard(unittest.TestCase):
+    def test_search_completes_open_four(self) -> None:
+        board: Board = Board(width=15, height=15, win_length=5)
+        for col in range(5, 9):
+            board.make_move((7, col), "X")
+        for col in range(4):
+            board.make_move((0, col * 2), "O")
+
+        result: SearchResult = AlphaBetaSearch(time_limit=None, max_depth=2).search(
+            board
+        )
+
+        self.assertIn(result.cell, [(7, 4), (7, 9)])
+        self.assertTrue(result.is_decided())
+
+    def test_search_blocks_four_in_a_row(self) -> None:
+        board: Board = Board(width=15, height=15, win_length=5)
+        for row, col in [(3, 3), (3, 4), (3, 5), (3, 6)]:
+            board.make_move((row, col), "X")
+        for row, col in [(10, 10), (12, 10), (3, 2)]:
+            board.make_move((row, col), "O")
+
+        result: SearchResult = AlphaBetaSearch(time_limit=None, max_depth=2).search(
+            board
+        )
+
+        self.assertEqual(result.cell, (3, 7))
+
+
+class TestAlphaBetaSearchTranspositionTable(unittest.TestCase):
+    def test_table_is_used_and_kept_between_searches(self) -> None:
+        search: AlphaBetaSearch = AlphaBetaSearch(time_limit=None)
+        search.search(Board())
+        first_hits: int = search.get_table().get_stats().hits
+
+        self.assertGreater(first_hits, 0)
+
+        board: Board = Board()
+        board.make_move((0, 0), "X")
+        search.search(board)
+
+        self.assertGreater(search.get_table().get_stats().hits, first_hits)
+
+    def test_table_is_cleared_for_other_rules(self) -> None:
+        search: AlphaBetaSearch = AlphaBetaSearch(time_limit=None)
+        search.search(Board())
+        search.search(Board(width=3, height=3, win_length=2))
+
+        fresh_search: AlphaBetaSearch = AlphaBetaSearch(time_limit=None)
+        fresh_search.search(Board(width=3, height=3, win_length=2))
+
+        self.assertEqual(
+            search.get_table().get_stats(), fresh_search.get_table().get_stats()
+        )
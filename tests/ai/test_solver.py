@@ -0,0 +1,86 @@
+"""Test suite for the perfect-play solver."""
+
+import unittest
+
+from typing import List
+
+from constants.constants import CellValue
+
+from src.ai.solver import (
+    DRAW,
+    LOSS,
+    WIN,
+    UnsolvedPositionError,
+    choose_move,
+    get_solution_table,
+    solve_position,
+)
+
+from src.models.board import Board
+
+
+class TestSolverSolutionTable(unittest.TestCase):
+    def test_solution_table_holds_one_entry_per_symmetry_class(self) -> None:
+        self.assertEqual(len(get_solution_table()), 765)
+
+    def test_blank_board_is_a_draw(self) -> None:
+        value, best_moves = solve_position(Board())
+
+        self.assertEqual(value, DRAW)
+        self.assertEqual(len(best_moves), 9)
+
+    def test_finished_positions_have_no_best_moves(self) -> None:
+        won_state: List[List[CellValue]] = [
+            ["X", "X", "X"],
+            ["O", "O", None],
+            [None, None, None],
+        ]
+
+        self.assertEqual(solve_position(Board(starting_state=won_state)), (LOSS, ()))
+
+
+class TestSolverChooseMove(unittest.TestCase):
+    def test_choose_move_takes_immediate_win(self) -> None:
+        winnable_state: List[List[CellValue]] = [
+            ["X", "X", None],
+            ["O", "O", None],
+            [None, None, None],
+        ]
+        board: Board = Board(starting_state=winnable_state)
+
+        self.assertEqual(solve_position(board)[0], WIN)
+        self.assertEqual(choose_move(board), (0, 2))
+
+    def test_choose_move_blocks_immediate_loss(self) -> None:
+        losing_state: List[List[CellValue]] = [
+            ["X", "X", None],
+            [None, "O", None],
+            [None, None, None],
+        ]
+        board: Board = Board(starting_state=losing_state)
+
+        self.assertEqual(choose_move(board), (0, 2))
+
+    def test_choose_move_maps_best_moves_back_to_board_orientation(self) -> None:
+        winnable_states: List[List[List[CellValue]]] = [
+            [["X", "O", None], ["X", "O", None], [None, None, None]],
+            [[None, "X", "X"], [None, "O", "O"], [None, None, None]],
+            [[None, "O", "X"], [None, "O", "X"], [None, None, None]],
+        ]
+        winning_cells = [(2, 0), (0, 0), (2, 2)]
+
+        for winnable_state, winning_cell in zip(
+            winnable_states, winning_cells, strict=True
+        ):
+            board: Board = Board(starting_state=winnable_state)
+            self.assertEqual(choose_move(board), winning_cell)
+
+    def test_choose_move_raises_on_unreachable_position(self) -> None:
+        unreachable_state: List[List[CellValue]] = [
+            ["O", None, None],
+            [None, None, None],
+            [None, None, None],
+        ]
+
+        with self.assertRaises(UnsolvedPositionError):
+            choose_move(Board(starting_state=unreachable_state))
@@ -0,0 +1,202 @@
+"""Test suite for the strong solver and its packed tables."""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+from src.ai import solver
+
+from src.ai.solver import DRAW, LOSS, WIN, UnsolvedPositionError
+
+from src.ai.strong_solver import (
+    SolveResult,
+    SolvedTable,
+    choose_move,
+    set_default_table,
+    solve_table,
+)
+
+from src.models.board import Board, GameStatus
+
+from src.storage.packed_table import (
+    PackedTableInfo,
+    read_packed_table,
+    write_packed_table,
+)
+
+from src.storage.tablebase import decode_entry
+
+
+def get_entry(entries: bytes, index: int) -> int:
+    return entries[index >> 2] >> ((index & 3) << 1) & 3
+
+
+class TestSolveTable(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory: Path = Path(directory.name)
+
+    def test_standard_board_matches_solver(self) -> None:
+        result: SolveResult = solve_table(self.directory / "3x3.ttp", 3, 3, 3)
+        info, entries = read_packed_table(self.directory / "3x3.ttp")
+        expected: bytes = solver.build_tablebase_entries()
+
+        self.assertEqual(result.value, DRAW)
+        self.assertEqual(result.solved, 5478)
+        self.assertTrue(info.complete)
+
+        for index, entry in enumerate(expected):
+            decoded = decode_entry(entry)
+            self.assertEqual(
+                get_entry(entries, index), 0 if decoded is None else decoded[0] + 2
+            )
+
+    def test_parallel_solve_agrees_with_one_worker(self) -> None:
+        serial: SolveResult = solve_table(self.directory / "serial.ttp", 4, 3, 3)
+        parallel: SolveResult = solve_table(
+            self.directory / "parallel.ttp", 4, 3, 3, workers=2
+        )
+        _, serial_entries = read_packed_table(self.directory / "serial.ttp")
+        _, parallel_entries = read_packed_table(self.directory / "parallel.ttp")
+
+        self.assertEqual((serial.value, serial.solved), (WIN, 111973))
+        self.assertEqual(parallel.value, WIN)
+
+        for serial_byte, parallel_byte in zip(
+            serial_entries, parallel_entries, strict=True
+        ):
+            for shift in range(0, 8, 2):
+                if parallel_byte >> shift & 3:
+                    self.assertEqual(
+                        parallel_byte >> shift & 3, serial_byte >> shift & 3
+                    )
+
+    def test_resumes_from_checkpoint(self) -> None:
+        path: Path = self.directory / "4x3.ttp"
+        solve_table(path, 4, 3, 3)
+        info, entries = read_packed_table(path)
+        checkpoint: bytearray = bytearray(entries)
+        checkpoint[: len(checkpoint) // 2] = bytes(len(checkpoint) // 2)
+        checkpoint[0] = 0
+        write_packed_table(path, info._replace(complete=False), checkpoint)
+
+        result: SolveResult = solve_table(path, 4, 3, 3)
+
+        self.assertTrue(result.resumed)
+        self.assertEqual(result.value, WIN)
+        self.assertEqual(read_packed_table(path), (info, entries))
+
+    def test_complete_table_is_not_solved_again(self) -> None:
+        path: Path = self.directory / "3x3.ttp"
+        solve_table(path, 3, 3, 3)
+
+        result: SolveResult = solve_table(path, 3, 3, 3)
+
+        self.assertTrue(result.resumed)
+        self.assertEqual((result.value, result.solved), (DRAW, 5478))
+
+    def test_interrupted_solve_leaves_checkpoint(self) -> None:
+        path: Path = self.directory / "4x3.ttp"
+
+        with mock.patch("src.ai.strong_solver.wait", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                solve_table(path, 4, 3, 3)
+
+        info, _ = read_packed_table(path)
+        self.assertEqual(info, PackedTableInfo(4, 3, 3, False))
+        self.assertEqual(solve_table(path, 4, 3, 3).value, WIN)
+
+    def test_rejects_table_for_another_board(self) -> None:
+        path: Path = self.directory / "3x3.ttp"
+        solve_table(path, 3, 3, 3)
+
+        with self.assertRaises(ValueError):
+            solve_table(path, 4, 3, 3)
+
+    def test_rejects_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            solve_table(self.directory / "5x4.ttp", 5, 4, 4)
+        with self.assertRaises(ValueError):
+            solve_table(self.directory / "3x3.ttp", 3, 3, 4)
+        with self.assertRaises(ValueError):
+            solve_table(self.directory / "3x3.ttp", 3, 3, 3, workers=0)
+
+
+class TestSolvedTable(unittest.TestCase):
+    table: SolvedTable
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            solve_table(Path(directory) / "3x3.ttp", 3, 3, 3)
+            cls.table = SolvedTable(Path(directory) / "3x3.ttp")
+
+    def test_matches_solver(self) -> None:
+        board: Board = Board()
+
+        for cell in [(0, 0), (1, 1), (0, 1), (0, 2)]:
+            self.assertEqual(
+                self.table.solve_position(board), solver.solve_position(board)
+            )
+            board.push(cell)
+
+    def test_perfect_play_draws(self) -> None:
+        board: Board = Board()
+
+        while board.get_status() is GameStatus.ONGOING:
+            board.push(self.table.choose_move(board))
+
+        self.assertIs(board.get_status(), GameStatus.DRAW)
+
+    def test_prefers_winning_at_once(self) -> None:
+        board: Board = Board()
+        for cell in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            board.push(cell)
+
+        for _ in range(10):
+            self.assertEqual(self.table.choose_move(board), (0, 2))
+
+    def test_finished_position_has_no_best_moves(self) -> None:
+        board: Board = Board()
+        for cell in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            board.push(cell)
+
+        self.assertEqual(self.table.solve_position(board), (LOSS, ()))
+        with self.assertRaises(UnsolvedPositionError):
+            self.table.choose_move(board)
+
+    def test_rejects_other_boards(self) -> None:
+        with self.assertRaises(UnsolvedPositionError):
+            self.table.solve_position(Board(width=4, height=4, win_length=4))
+
+    def test_solves_missing_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path: Path = Path(directory) / "blank.ttp"
+            info: PackedTableInfo = PackedTableInfo(3, 3, 3, False)
+            write_packed_table(path, info, bytes(info.size))
+            table: SolvedTable = SolvedTable(path)
+
+        value, best_moves = table.solve_position(Board())
+
+        self.assertEqual(value, DRAW)
+        self.assertEqual(len(best_moves), 9)
+
+    def test_default_table(self) -> None:
+        set_default_table(None)
+        with self.assertRaises(UnsolvedPositionError):
+            choose_move(Board())
+
+        set_default_table(self.table)
+        self.addCleanup(set_default_table, None)
+        moves: List[int] = list(solver.solve_position(Board())[1])
+
+        row, col = choose_move(Board())
+        self.assertIn(row * 3 + col, moves)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Test suite for the transposition table."""
+
+import unittest
+
+from src.ai.transposition import (
+    Bound,
+    ReplacementPolicy,
+    TableEntry,
+    TableStats,
+    TranspositionTable,
+)
+
+
+class TestTranspositionTableProbe(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table: TranspositionTable = TranspositionTable(size=8)
+
+    def test_probe_finds_stored_entry(self) -> None:
+        self.table.store(0x1234, 3, 7, Bound.EXACT, 4)
+
+        self.assertEqual(
+            self.table.probe(0x1234), TableEntry(0x1234, 3, 7, Bound.EXACT, 4)
+        )
+        self.assertEqual(self.table.get_stats().hits, 1)
+
+    def test_probe_counts_misses_and_collisions(self) -> None:
+        self.table.store(0x01, 3, 7, Bound.EXACT, 4)
+
+        self.assertIsNone(self.table.probe(0x02))
+        self.assertIsNone(self.table.probe(0x09))
+
+        stats: TableStats = self.table.get_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.collisions), (0, 2, 1))
+        self.assertEqual(stats.hit_rate, 0.0)
+
+    def test_clear_removes_entries_and_resets_stats(self) -> None:
+        self.table.store(0x01, 3, 7, Bound.EXACT, 4)
+        self.table.probe(0x01)
+        self.table.clear()
+
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(self.table.get_stats(), TableStats(0, 0, 0, 0, 0, 0))
+
+    def test_size_must_be_a_power_of_two(self) -> None:
+        with self.assertRaises(ValueError):
+            TranspositionTable(size=12)
+        with self.assertRaises(ValueError):
+            TranspositionTable(size=0)
+
+
+class TestTranspositionTableReplacement(unittest.TestCase):
+    def test_depth_preferred_keeps_deeper_entry(self) -> None:
+        table: TranspositionTable = TranspositionTable(size=8)
+        table.store(0x01, 5, 7, Bound.EXACT, 4)
+
+        self.assertFalse(table.store(0x09, 2, 1, Bound.LOWER, 0))
+        self.assertIsNotNone(table.probe(0x01))
+        self.assertTrue(table.store(0x09, 5, 1, Bound.LOWER, 0))
+        self.assertIsNotNone(table.probe(0x09))
+
+        stats: TableStats = table.get_stats()
+        self.assertEqual((stats.stores, stats.overwrites, stats.rejected), (2, 1, 1))
+
+    def test_depth_preferred_always_updates_same_position(self) -> None:
+        table: TranspositionTable = TranspositionTable(size=8)
+        table.store(0x01, 5, 7, Bound.EXACT, 4)
+        table.store(0x01, 1, 2, Bound.UPPER, 3)
+
+        self.assertEqual(table.probe(0x01), TableEntry(0x01, 1, 2, Bound.UPPER, 3))
+
+    def test_always_replace_overwrites_deeper_entry(self) -> None:
+        table: TranspositionTable = TranspositionTable(
+            size=8, policy=ReplacementPolicy.ALWAYS_REPLACE
+        )
+        table.store(0x01, 5, 7, Bound.EXACT, 4)
+
+        self.assertTrue(table.store(0x09, 2, 1, Bound.LOWER, 0))
+        self.assertIsNone(table.probe(0x01))
+        self.assertEqual(len(table), 1)
@@ -0,0 +1,71 @@
+"""Test suite for batched win/draw evaluation."""
+
+import importlib.util
+import unittest
+
+from typing import Any, List
+
+from constants.constants import CellValue
+
+from src.models.board import Board
+
+HAS_NUMPY: bool = importlib.util.find_spec("numpy") is not None
+
+CELL_VALUES: List[CellValue] = [None, "X", "O"]
+
+
+def _board_from_base3_index(index: int) -> Board:
+    values: List[CellValue] = []
+    for _ in range(9):
+        index, digit = divmod(index, 3)
+        values.append(CELL_VALUES[digit])
+
+    return Board(starting_state=[values[0:3], values[3:6], values[6:9]])
+
+
+@unittest.skipUnless(HAS_NUMPY, "requires numpy")
+class TestEvaluateBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        import numpy as np
+
+        from src.analysis.batch import EMPTY, O, X, evaluate_batch, pack_boards
+
+        self.np = np
+        self.evaluate_batch = evaluate_batch
+        self.pack_boards = pack_boards
+
+        self.boards: List[Board] = [_board_from_base3_index(i) for i in range(3**9)]
+        self.expected_winners = np.array(
+            [
+                {None: EMPTY, "X": X, "O": O}[board.check_win()[1]]
+                for board in self.boards
+            ],
+            dtype=np.int8,
+        )
+        self.expected_draws = np.array([board.check_draw() for board in self.boards])
+
+    def _assert_matches_board(self, batch: Any) -> None:
+        winners, draws = self.evaluate_batch(batch)
+
+        self.np.testing.assert_array_equal(winners, self.expected_winners)
+        self.np.testing.assert_array_equal(draws, self.expected_draws)
+
+    def test_base3_encoding_matches_board_for_every_position(self) -> None:
+        self._assert_matches_board(self.np.arange(3**9, dtype=self.np.uint16))
+
+    def test_cell_array_encoding_matches_board(self) -> None:
+        digits = self.np.arange(3**9)[:, None] // 3 ** self.np.arange(9) % 3
+        self._assert_matches_board(digits.astype(self.np.int8).reshape(-1, 3, 3))
+
+    def test_packed_bitboard_encoding_matches_board(self) -> None:
+        self._assert_matches_board(self.pack_boards(self.boards))
+
+    def test_rejects_unsupported_encodings(self) -> None:
+        with self.assertRaises(ValueError):
+            self.evaluate_batch(self.np.zeros((4, 9), dtype=self.np.int8))
+
+        with self.assertRaises(ValueError):
+            self.evaluate_batch(self.np.full((1, 3, 3), 3, dtype=self.np.int8))
+
+        with self.assertRaises(ValueError):
+            self.evaluate_batch(self.np.array([3**9], dtype=self.np.uint16))
@@ -0,0 +1,71 @@
+"""Test suite for the exhaustive game-tree enumeration."""
+
+import unittest
+
+from src.analysis.perft import PerftResult, perft, verify_standard
+
+from src.models.board import Board
+
+
+class TestPerft(unittest.TestCase):
+    def test_standard_board_matches_known_counts(self) -> None:
+        result: PerftResult = perft(Board())
+
+        self.assertEqual(verify_standard(result), [])
+        self.assertEqual(result.nodes, 549946)
+        self.assertEqual(result.games, 255168)
+
+    def test_parallel_split_matches_single_process(self) -> None:
+        board: Board = Board()
+        board.push((1, 1))
+
+        self.assertEqual(perft(board, workers=2)[:5], perft(board)[:5])
+
+    def test_depth_limit(self) -> None:
+        result: PerftResult = perft(Board(), max_depth=3)
+
+        self.assertEqual(result.nodes_by_depth, (1, 9, 72, 504))
+        self.assertEqual(result.games, 0)
+        self.assertEqual(verify_standard(result)[0][:14], "nodes by depth")
+
+    def test_from_position(self) -> None:
+        board: Board = Board()
+        for cell in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            board.push(cell)
+
+        result: PerftResult = perft(board, max_depth=1)
+
+        self.assertEqual(result.nodes_by_depth, (1, 5))
+        self.assertEqual(result.games_by_depth, (0, 1))
+        self.assertEqual((result.x_wins, result.o_wins, result.draws), (1, 0, 0))
+
+    def test_finished_position(self) -> None:
+        board: Board = Board()
+        for cell in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            board.push(cell)
+
+        result: PerftResult = perft(board, workers=2)
+
+        self.assertEqual(result.nodes_by_depth[0], 1)
+        self.assertEqual(result.x_wins, 1)
+        self.assertEqual(result.nodes, 1)
+
+    def test_board_is_not_modified(self) -> None:
+        board: Board = Board()
+        board.push((1, 1))
+        history = board.get_history()
+
+        perft(board, max_depth=4, workers=2)
+
+        self.assertEqual(board.get_history(), history)
+        self.assertEqual(board.get_move_count(), 1)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            perft(Board(), max_depth=-1)
+        with self.assertRaises(ValueError):
+            perft(Board(), workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
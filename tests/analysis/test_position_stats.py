@@ -0,0 +1,76 @@
+"""Test suite for the streaming position statistics pipeline."""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+from typing import List
+
+from src.analysis.position_stats import PositionSummary, analyze_records
+
+from src.models.board import GameStatus
+
+from src.models.position import Position
+
+from src.storage.records import GameRecord, RecordWriter
+
+GAMES: List[GameRecord] = [
+    GameRecord((0, 3, 1, 4, 2), GameStatus.X_WON),
+    GameRecord((0, 3, 1, 4, 8, 5), GameStatus.O_WON),
+    GameRecord((4, 0, 8, 2, 1, 7, 6, 3, 5), GameStatus.DRAW),
+    GameRecord((0, 4), GameStatus.ONGOING),
+]
+
+
+class TestAnalyzeRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.path: Path = Path(self.directory.name) / "games.ttt"
+
+        with RecordWriter(self.path) as writer:
+            for game in GAMES * 25:
+                writer.write(game)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_blank_board_counts_every_game(self) -> None:
+        blank: PositionSummary = next(analyze_records(self.path, workers=1))
+
+        self.assertEqual(blank.position, Position())
+        self.assertEqual((blank.visits, blank.x_wins, blank.o_wins), (100, 25, 25))
+        self.assertEqual(blank.draws, 25)
+        self.assertEqual(blank.continuations, ((0, 75), (4, 25)))
+
+    def test_continuations_and_win_rates(self) -> None:
+        summaries: List[PositionSummary] = list(analyze_records(self.path, workers=1))
+        after_opening: PositionSummary = next(
+            summary for summary in summaries if summary.position == Position(1, 0)
+        )
+
+        self.assertEqual(after_opening.visits, 75)
+        self.assertEqual(after_opening.continuations, ((3, 50), (4, 25)))
+        self.assertAlmostEqual(after_opening.x_win_rate, 1 / 3)
+        self.assertEqual(after_opening.draw_rate, 0.0)
+
+    def test_spilling_and_chunking_do_not_change_results(self) -> None:
+        expected: List[PositionSummary] = list(analyze_records(self.path, workers=1))
+        spilled: List[PositionSummary] = list(
+            analyze_records(self.path, workers=1, chunk_bytes=16, spill_threshold=4)
+        )
+
+        self.assertEqual(spilled, expected)
+
+    def test_process_pool_matches_single_process(self) -> None:
+        self.assertEqual(
+            list(analyze_records(self.path, workers=2, chunk_bytes=64)),
+            list(analyze_records(self.path, workers=1)),
+        )
+
+    def test_describe_shows_position_and_continuations(self) -> None:
+        blank: PositionSummary = next(analyze_records(self.path, workers=1))
+
+        self.assertEqual(
+            blank.describe(),
+            ".........        100 X  25.0% D  25.0% O  25.0%  7:75 5:25",
+        )
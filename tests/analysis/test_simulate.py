@@ -0,0 +1,54 @@
+"""Test suite for vectorized random-playout simulation."""
+
+import importlib.util
+import unittest
+
+from typing import Any
+
+HAS_NUMPY: bool = importlib.util.find_spec("numpy") is not None
+
+
+@unittest.skipUnless(HAS_NUMPY, "requires numpy")
+class TestSimulate(unittest.TestCase):
+    def setUp(self) -> None:
+        import numpy as np
+
+        from src.analysis.simulate import simulate
+
+        self.np = np
+        self.simulate = simulate
+
+    def test_random_playouts_account_for_every_game(self) -> None:
+        result = self.simulate(10_000, seed=0, batch_size=3_000)
+
+        self.assertEqual(result.games, 10_000)
+        self.assertEqual(sum(result.lengths), 10_000)
+        self.assertEqual(sum(result.lengths[:5]), 0)
+        self.assertEqual(result.x_wins, sum(result.lengths[5::2]) - result.draws)
+        self.assertEqual(result.o_wins, sum(result.lengths[6::2]))
+
+    def test_random_playouts_match_known_rates(self) -> None:
+        result = self.simulate(50_000, seed=1)
+
+        self.assertAlmostEqual(result.x_wins / result.games, 0.585, delta=0.01)
+        self.assertAlmostEqual(result.o_wins / result.games, 0.288, delta=0.01)
+        self.assertAlmostEqual(result.draws / result.games, 0.127, delta=0.01)
+
+    def test_policies_drive_each_player(self) -> None:
+        def lowest_legal_cell(player_bits: Any, opponent_bits: Any, rng: Any) -> Any:
+            occupied = (player_bits | opponent_bits)[:, None] >> self.np.arange(9) & 1
+            return (occupied == 0).argmax(axis=1)
+
+        result = self.simulate(
+            100, x_policy=lowest_legal_cell, o_policy=lowest_legal_cell
+        )
+
+        self.assertEqual((result.x_wins, result.o_wins, result.draws), (100, 0, 0))
+        self.assertEqual(result.lengths[7], 100)
+
+    def test_simulate_rejects_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            self.simulate(-1)
+
+        with self.assertRaises(ValueError):
+            self.simulate(10, batch_size=0)
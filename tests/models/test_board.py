@@ -3,11 +3,19 @@
 import unittest
 
 from copy import deepcopy
-from typing import List
+from typing import List, Tuple
 
-from constants.constants import CellValue, BOARD_SIZE
+from constants.constants import CellValue, PlayerMarker, BOARD_SIZE
 
-from src.models.board import Board, InvalidCellError, InvalidMoveError
+from src.models.board import (
+    Board,
+    GameStatus,
+    MoveResult,
+    clear_render_cache,
+    get_render_cache_info,
+)
+
+from src.models.errors import InvalidCellError, InvalidMoveError
 
 from src.utils.colorize import grey, red, green
 
@@ -19,7 +27,6 @@ TEST_BOARD_STATE: List[List[CellValue]] = [
 
 
 class TestBoardGetBoard(unittest.TestCase):
-
     def setUp(self) -> None:
         self.board = Board()
 
@@ -32,7 +39,6 @@ class TestBoardGetBoard(unittest.TestCase):
 
 
 class TestBoardGetCell(unittest.TestCase):
-
     def setUp(self) -> None:
         test_board_state: List[List[CellValue]] = deepcopy(TEST_BOARD_STATE)
         self.board = Board(starting_state=test_board_state)
@@ -41,16 +47,16 @@ class TestBoardGetCell(unittest.TestCase):
         self,
     ) -> None:
         with self.assertRaises(InvalidCellError):
-            self.board.get_cell((-1, 0))  # type: ignore[arg-type]
+            self.board.get_cell((-1, 0))
 
         with self.assertRaises(InvalidCellError):
-            self.board.get_cell((0, -1))  # type: ignore[arg-type]
+            self.board.get_cell((0, -1))
 
         with self.assertRaises(InvalidCellError):
-            self.board.get_cell((BOARD_SIZE + 1, 0))  # type: ignore[arg-type]
+            self.board.get_cell((BOARD_SIZE + 1, 0))
 
         with self.assertRaises(InvalidCellError):
-            self.board.get_cell((0, BOARD_SIZE + 1))  # type: ignore[arg-type]
+            self.board.get_cell((0, BOARD_SIZE + 1))
 
     def test_get_cell_returns_correct_value_if_valid_cell_provided(
         self,
@@ -61,7 +67,6 @@ class TestBoardGetCell(unittest.TestCase):
 
 
 class TestBoardMakeMove(unittest.TestCase):
-
     def setUp(self) -> None:
         test_board_state: List[List[CellValue]] = deepcopy(TEST_BOARD_STATE)
         self.board = Board(starting_state=test_board_state)
@@ -70,10 +75,10 @@ class TestBoardMakeMove(unittest.TestCase):
         self,
     ) -> None:
         with self.assertRaises(InvalidCellError):
-            self.board.make_move((-1, 0), "X")  # type: ignore[arg-type]
+            self.board.make_move((-1, 0), "X")
 
         with self.assertRaises(InvalidCellError):
-            self.board.make_move((0, BOARD_SIZE + 1), "O")  # type: ignore[arg-type]
+            self.board.make_move((0, BOARD_SIZE + 1), "O")
 
     def test_make_move_raises_invalid_move_error_if_nonblank_cell_attempted(
         self,
@@ -99,7 +104,6 @@ class TestBoardMakeMove(unittest.TestCase):
 
 
 class TestBoardStringifyBoard(unittest.TestCase):
-
     def setUp(self) -> None:
         test_board_state: List[List[CellValue]] = deepcopy(TEST_BOARD_STATE)
         self.board = Board(starting_state=test_board_state)
@@ -120,9 +124,32 @@ class TestBoardStringifyBoard(unittest.TestCase):
 
         self.assertEqual(actual_board_string, correct_board_string)
 
+    def test_stringify_board_caches_repeated_renders(self) -> None:
+        clear_render_cache()
 
-class TestBoardCheckWin(unittest.TestCase):
+        first_render: str = self.board.stringify_board()
+        second_render: str = self.board.stringify_board()
+
+        self.assertEqual(first_render, second_render)
+        self.assertEqual(get_render_cache_info().misses, 1)
+        self.assertEqual(get_render_cache_info().hits, 1)
 
+        self.board.make_move((1, 1), "X")
+
+        self.assertNotEqual(self.board.stringify_board(), first_render)
+        self.assertEqual(get_render_cache_info().misses, 2)
+
+    def test_stringify_cell_matches_its_place_in_the_board(self) -> None:
+        self.assertEqual(self.board.stringify_cell((0, 0)), red(" X "))
+        self.assertEqual(self.board.stringify_cell((1, 1)), grey(" 5 "))
+        self.assertEqual(self.board.get_cell_screen_position((1, 1)), (3, 4))
+        self.assertEqual(self.board.get_cell_screen_position((2, 0)), (5, 0))
+
+        with self.assertRaises(InvalidCellError):
+            self.board.stringify_cell((3, 0))
+
+
+class TestBoardCheckWin(unittest.TestCase):
     def test_check_win_detects_horizontal_win(self) -> None:
         horizontal_win_state_1: List[List[CellValue]] = [
             ["X", "X", "X"],
@@ -193,3 +220,333 @@ class TestBoardCheckWin(unittest.TestCase):
 
         non_win_state_board: Board = Board(starting_state=non_win_state)
         self.assertEqual(non_win_state_board.check_win(), (False, None))
+
+
+class TestBoardCheckDraw(unittest.TestCase):
+    def test_check_draw_detects_draw(self) -> None:
+        draw_state: List[List[CellValue]] = [
+            ["X", "O", "X"],
+            ["O", "X", "O"],
+            ["O", "X", "O"],
+        ]
+
+        draw_state_board: Board = Board(starting_state=draw_state)
+        self.assertTrue(draw_state_board.check_draw())
+
+    def test_check_draw_detects_non_draw(self) -> None:
+        full_win_state: List[List[CellValue]] = [
+            ["X", "X", "X"],
+            ["O", "O", "X"],
+            ["X", "O", "O"],
+        ]
+
+        self.assertFalse(Board(starting_state=full_win_state).check_draw())
+        self.assertFalse(Board(starting_state=deepcopy(TEST_BOARD_STATE)).check_draw())
+
+
+class TestBoardGetBitboards(unittest.TestCase):
+    def test_get_bitboards_matches_board_state(self) -> None:
+        board: Board = Board(starting_state=deepcopy(TEST_BOARD_STATE))
+
+        self.assertEqual(board.get_bitboards(), (0b010_100_001, 0b100_001_010))
+        self.assertEqual(board.get_board(), TEST_BOARD_STATE)
+
+    def test_blank_boards_do_not_share_state(self) -> None:
+        first_board: Board = Board()
+        first_board.make_move((0, 0), "X")
+
+        self.assertEqual(Board().get_bitboards(), (0, 0))
+
+
+class TestBoardGetHash(unittest.TestCase):
+    def test_hash_is_incremental_and_matches_loaded_state(self) -> None:
+        board: Board = Board()
+        blank_hash: int = board.get_hash()
+
+        moves: List[Tuple[Tuple[int, int], PlayerMarker]] = [
+            ((0, 0), "X"),
+            ((0, 1), "O"),
+            ((1, 2), "X"),
+            ((1, 0), "O"),
+            ((2, 1), "X"),
+            ((2, 2), "O"),
+        ]
+        for cell, move_value in moves:
+            board.make_move(cell, move_value)
+
+        self.assertNotEqual(board.get_hash(), blank_hash)
+        self.assertEqual(
+            board.get_hash(),
+            Board(starting_state=deepcopy(TEST_BOARD_STATE)).get_hash(),
+        )
+
+    def test_hash_ignores_move_order(self) -> None:
+        first_board: Board = Board()
+        first_board.make_move((0, 0), "X")
+        first_board.make_move((1, 1), "O")
+        first_board.make_move((2, 2), "X")
+
+        second_board: Board = Board()
+        second_board.make_move((2, 2), "X")
+        second_board.make_move((1, 1), "O")
+        second_board.make_move((0, 0), "X")
+
+        self.assertEqual(first_board.get_hash(), second_board.get_hash())
+
+    def test_hash_distinguishes_players(self) -> None:
+        x_board: Board = Board()
+        x_board.make_move((1, 1), "X")
+
+        o_board: Board = Board()
+        o_board.make_move((1, 1), "O")
+
+        self.assertNotEqual(x_board.get_hash(), o_board.get_hash())
+        self.assertLess(x_board.get_hash(), 1 << 64)
+
+    def test_from_position_matches_hash(self) -> None:
+        board: Board = Board(starting_state=deepcopy(TEST_BOARD_STATE))
+
+        self.assertEqual(
+            Board.from_position(board.snapshot()).get_hash(), board.get_hash()
+        )
+
+
+class TestBoardGetStatus(unittest.TestCase):
+    def test_get_status_tracks_moves_to_a_win(self) -> None:
+        board: Board = Board()
+
+        for cell, marker in (((1, 1), "X"), ((0, 0), "O"), ((0, 2), "X")):
+            board.make_move(cell, marker)  # type: ignore[arg-type]
+            self.assertIs(board.get_status(), GameStatus.ONGOING)
+
+        board.make_move((1, 0), "O")
+        board.make_move((2, 0), "X")
+
+        self.assertIs(board.get_status(), GameStatus.X_WON)
+        self.assertEqual(board.check_win(), (True, "X"))
+        self.assertFalse(board.check_draw())
+        self.assertEqual(board.get_move_count(), 5)
+
+    def test_get_status_detects_draw_on_last_move(self) -> None:
+        nearly_drawn_state: List[List[CellValue]] = [
+            ["X", "O", "X"],
+            ["O", "X", "O"],
+            ["O", "X", None],
+        ]
+        board: Board = Board(starting_state=nearly_drawn_state)
+
+        self.assertIs(board.get_status(), GameStatus.ONGOING)
+
+        board.make_move((2, 2), "O")
+
+        self.assertIs(board.get_status(), GameStatus.DRAW)
+        self.assertEqual(board.check_win(), (False, None))
+        self.assertEqual(board.get_move_count(), 9)
+
+    def test_get_status_prefers_win_on_last_move(self) -> None:
+        nearly_drawn_state: List[List[CellValue]] = [
+            ["X", "O", "X"],
+            ["O", "X", "O"],
+            ["O", "X", None],
+        ]
+        board: Board = Board(starting_state=nearly_drawn_state)
+
+        board.make_move((2, 2), "X")
+
+        self.assertIs(board.get_status(), GameStatus.X_WON)
+
+    def test_get_status_scans_starting_state(self) -> None:
+        won_state: List[List[CellValue]] = [
+            ["O", "X", None],
+            ["X", "O", "X"],
+            [None, None, "O"],
+        ]
+
+        self.assertIs(Board(starting_state=won_state).get_status(), GameStatus.O_WON)
+
+
+class TestBoardMoveStack(unittest.TestCase):
+    def test_legal_moves_are_the_blank_cells(self) -> None:
+        board: Board = Board(starting_state=deepcopy(TEST_BOARD_STATE))
+
+        self.assertEqual(board.legal_moves(), 1 << 2 | 1 << 4 | 1 << 6)
+
+    def test_legal_moves_are_empty_once_the_game_is_over(self) -> None:
+        board: Board = Board()
+
+        for cell in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+            board.push(cell)
+
+        self.assertIs(board.get_status(), GameStatus.X_WON)
+        self.assertEqual(board.legal_moves(), 0)
+
+    def test_try_move_reports_rejected_moves_without_changing_the_board(
+        self,
+    ) -> None:
+        board: Board = Board(starting_state=deepcopy(TEST_BOARD_STATE))
+        hash_before: int = board.get_hash()
+
+        self.assertIs(board.try_move((3, 0), "X"), MoveResult.INVALID_CELL)
+        self.assertIs(board.try_move((0, 0), "O"), MoveResult.OCCUPIED)
+        self.assertIs(
+            board.try_move((1, 1), "Z"),  # type: ignore[arg-type]
+            MoveResult.INVALID_MARKER,
+        )
+        self.assertEqual(board.get_board(), TEST_BOARD_STATE)
+        self.assertEqual(board.get_hash(), hash_before)
+        self.assertEqual(board.get_history(), ())
+
+    def test_try_move_plays_legal_move(self) -> None:
+        board: Board = Board()
+
+        self.assertIs(board.try_move((1, 1), "O"), MoveResult.OK)
+        self.assertEqual(board.get_cell((1, 1)), "O")
+        self.assertEqual(board.get_last_move(), (1, 1))
+
+    def test_push_alternates_players_from_x(self) -> None:
+        board: Board = Board()
+
+        self.assertEqual(board.get_player_to_move(), "X")
+        board.push((1, 1))
+        self.assertEqual(board.get_player_to_move(), "O")
+        board.push((0, 0))
+
+        self.assertEqual(board.get_cell((1, 1)), "X")
+        self.assertEqual(board.get_cell((0, 0)), "O")
+        self.assertEqual(board.get_history(), ((1, 1), (0, 0)))
+
+    def test_pop_restores_everything_a_move_changed(self) -> None:
+        board: Board = Board(width=4, height=4, win_length=3)
+        cells: List[Tuple[int, int]] = [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]
+        states = []
+
+        for cell in cells:
+            states.append(
+                (
+                    board.get_bitboards(),
+                    board.get_hash(),
+                    board.get_status(),
+                    board.get_move_count(),
+                    board.get_last_move(),
+                )
+            )
+            self.assertIs(board.push(cell), MoveResult.OK)
+
+        self.assertIs(board.get_status(), GameStatus.X_WON)
+
+        for cell in reversed(cells):
+            self.assertEqual(board.pop(), cell)
+            self.assertEqual(
+                (
+                    board.get_bitboards(),
+                    board.get_hash(),
+                    board.get_status(),
+                    board.get_move_count(),
+                    board.get_last_move(),
+                ),
+                states.pop(),
+            )
+
+    def test_pop_takes_back_make_move(self) -> None:
+        board: Board = Board()
+        board.make_move((2, 2), "X")
+
+        self.assertEqual(board.pop(), (2, 2))
+        self.assertEqual(board.get_bitboards(), (0, 0))
+
+    def test_pop_raises_invalid_move_error_with_no_moves_played(self) -> None:
+        board: Board = Board(starting_state=deepcopy(TEST_BOARD_STATE))
+
+        with self.assertRaises(InvalidMoveError):
+            board.pop()
+
+
+class TestBoardGeneralizedSizes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = Board(width=15, height=15, win_length=5)
+
+    def _play(self, cells: List[Tuple[int, int]], marker: PlayerMarker) -> None:
+        for cell in cells:
+            self.board.make_move(cell, marker)
+
+    def test_rejects_invalid_sizes(self) -> None:
+        with self.assertRaises(ValueError):
+            Board(width=0)
+
+        with self.assertRaises(ValueError):
+            Board(width=3, height=3, win_length=4)
+
+        with self.assertRaises(ValueError):
+            Board(starting_state=deepcopy(TEST_BOARD_STATE), width=4)
+
+    def test_detects_wins_in_every_direction(self) -> None:
+        for cells in (
+            [(7, c) for c in range(3, 8)],
+            [(r, 7) for r in range(3, 8)],
+            [(r, r) for r in range(10, 15)],
+            [(r, 14 - r) for r in range(0, 5)],
+        ):
+            self.board = Board(width=15, height=15, win_length=5)
+            self._play(cells[:4], "X")
+            self.assertIs(self.board.get_status(), GameStatus.ONGOING)
+
+            self._play(cells[4:], "X")
+            self.assertEqual(self.board.check_win(), (True, "X"))
+            self.assertEqual(self.board.get_last_move(), cells[4])
+
+    def test_detects_win_completed_in_the_middle(self) -> None:
+        self._play([(0, 0), (0, 1), (0, 3), (0, 4)], "O")
+        self._play([(0, 2)], "O")
+
+        self.assertEqual(self.board.check_win(), (True, "O"))
+
+    def test_lines_do_not_wrap_across_rows(self) -> None:
+        self._play([(0, 12), (0, 13), (0, 14), (1, 0), (1, 1)], "X")
+
+        self.assertIs(self.board.get_status(), GameStatus.ONGOING)
+
+    def test_rectangular_board_draws_when_full(self) -> None:
+        board: Board = Board(width=4, height=2, win_length=3)
+
+        for cell, marker in zip(
+            [(0, 0), (0, 1), (1, 0), (1, 1), (0, 2), (0, 3), (1, 2), (1, 3)],
+            ["X", "O", "O", "X", "X", "O", "O", "X"],
+            strict=True,
+        ):
+            board.make_move(cell, marker)  # type: ignore[arg-type]
+
+        self.assertIs(board.get_status(), GameStatus.DRAW)
+
+    def test_scans_starting_state_of_any_size(self) -> None:
+        state: List[List[CellValue]] = [
+            [None, None, None, "O"],
+            [None, None, "O", None],
+            ["X", "O", "X", "X"],
+        ]
+
+        board: Board = Board(starting_state=state, width=4, height=3)
+        self.assertEqual(board.check_win(), (True, "O"))
+        self.assertEqual(board.get_board(), state)
+
+    def test_stringify_board_scales_cells_to_key_width(self) -> None:
+        board: Board = Board(width=4, height=3)
+        board.make_move((0, 0), "X")
+
+        lines: List[str] = board.stringify_board().split("\n")
+
+        self.assertEqual(lines[0], "    ╻    ╻    ╻    ")
+        self.assertEqual(
+            lines[1], f"{red(' X  ')}┃{grey(' 10 ')}┃{grey(' 11 ')}┃{grey(' 12 ')}"
+        )
+        self.assertEqual(lines[2], "━━━━╋━━━━╋━━━━╋━━━━")
+        self.assertEqual(
+            lines[5], f"{grey(' 1  ')}┃{grey(' 2  ')}┃{grey(' 3  ')}┃{grey(' 4  ')}"
+        )
+        self.assertEqual(lines[6], "    ╹    ╹    ╹    ")
+
+    def test_standard_only_features_reject_other_sizes(self) -> None:
+        with self.assertRaises(ValueError):
+            self.board.snapshot()
+
+        with self.assertRaises(ValueError):
+            self.board.canonicalize()
@@ -0,0 +1,37 @@
+"""Test suite for cell key mapping."""
+
+import unittest
+
+from constants.constants import CELL_KEY_TO_CELL_MAP
+
+from src.models.cell_keys import cell_key_to_cell, cell_to_cell_key
+
+
+class TestCellKeys(unittest.TestCase):
+    def test_standard_board_uses_keypad_layout(self) -> None:
+        for cell_key, cell in CELL_KEY_TO_CELL_MAP.items():
+            self.assertEqual(cell_to_cell_key(cell), cell_key)
+            self.assertEqual(cell_key_to_cell(cell_key), cell)
+
+    def test_general_formula_matches_keypad_layout(self) -> None:
+        for cell_key, cell in CELL_KEY_TO_CELL_MAP.items():
+            self.assertEqual(cell_key_to_cell(cell_key, 3, 3), cell)
+
+        self.assertEqual(cell_key_to_cell("1", 15, 15), (14, 0))
+        self.assertEqual(cell_key_to_cell("225", 15, 15), (0, 14))
+
+    def test_round_trips_on_any_size(self) -> None:
+        for width, height in ((4, 4), (15, 15), (7, 2)):
+            for row in range(height):
+                for col in range(width):
+                    cell_key: str = cell_to_cell_key((row, col), width, height)
+                    self.assertEqual(
+                        cell_key_to_cell(cell_key, width, height), (row, col)
+                    )
+
+    def test_rejects_invalid_keys(self) -> None:
+        for cell_key in ("0", "10", "", "a", "-1", "1.0"):
+            self.assertIsNone(cell_key_to_cell(cell_key))
+
+        for cell_key in ("0", "17", "01", " 1", "x"):
+            self.assertIsNone(cell_key_to_cell(cell_key, 4, 4))
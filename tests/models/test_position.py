@@ -0,0 +1,87 @@
+"""Test suite for Position."""
+
+import pickle
+import sys
+import unittest
+
+from copy import deepcopy
+from typing import List
+
+from constants.constants import CellValue
+
+from src.models.board import Board
+
+from src.models.errors import InvalidCellError, InvalidMoveError
+
+from src.models.position import Position
+
+TEST_BOARD_STATE: List[List[CellValue]] = [
+    ["X", "O", None],
+    ["O", None, "X"],
+    [None, "X", "O"],
+]
+
+
+class TestPositionSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.board = Board(starting_state=deepcopy(TEST_BOARD_STATE))
+
+    def test_snapshot_matches_board(self) -> None:
+        position: Position = self.board.snapshot()
+
+        self.assertEqual((position.x_bits, position.o_bits), self.board.get_bitboards())
+        self.assertEqual(position.get_cell((0, 1)), "O")
+        self.assertEqual(position.get_cell((1, 1)), None)
+
+    def test_snapshot_is_unaffected_by_later_moves(self) -> None:
+        position: Position = self.board.snapshot()
+        self.board.make_move((1, 1), "X")
+
+        self.assertEqual(position.get_cell((1, 1)), None)
+        self.assertNotEqual(self.board.snapshot(), position)
+
+    def test_from_position_restores_board(self) -> None:
+        board: Board = Board.from_position(self.board.snapshot())
+
+        self.assertEqual(board.get_board(), TEST_BOARD_STATE)
+        self.assertEqual(board.get_move_count(), 6)
+
+
+class TestPositionValueType(unittest.TestCase):
+    def test_equal_positions_hash_equal(self) -> None:
+        first: Position = Position().with_move((1, 1), "X")
+        second: Position = Position(x_bits=0b000_010_000)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertEqual({first: "center"}[second], "center")
+
+    def test_position_is_immutable_and_slotted(self) -> None:
+        position: Position = Position()
+
+        with self.assertRaises(AttributeError):
+            position._key = 1
+
+        self.assertFalse(hasattr(position, "__dict__"))
+        self.assertLess(sys.getsizeof(position), 64)
+
+    def test_position_pickles(self) -> None:
+        position: Position = Position(0b000_000_001, 0b100_000_000)
+
+        self.assertEqual(pickle.loads(pickle.dumps(position)), position)
+
+    def test_with_move_validates_like_make_move(self) -> None:
+        position: Position = Position().with_move((0, 0), "X")
+
+        with self.assertRaises(InvalidCellError):
+            position.with_move((3, 0), "O")
+
+        with self.assertRaises(InvalidMoveError):
+            position.with_move((0, 0), "O")
+
+        with self.assertRaises(InvalidMoveError):
+            position.with_move((0, 1), "Y")  # type: ignore[arg-type]
+
+    def test_rejects_overlapping_bitboards(self) -> None:
+        with self.assertRaises(ValueError):
+            Position(0b1, 0b1)
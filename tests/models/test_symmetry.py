@@ -0,0 +1,73 @@
+"""Test suite for board symmetries."""
+
+import unittest
+
+from typing import List
+
+from constants.constants import CellValue, SYMMETRY_PERMUTATIONS
+
+from src.models.board import Board
+
+from src.models.symmetry import (
+    canonicalize,
+    transform_bits,
+    transform_cell_index,
+    untransform_cell_index,
+)
+
+
+def _transform_board_state(
+    state: List[List[CellValue]], transform: int
+) -> List[List[CellValue]]:
+    transformed: List[List[CellValue]] = [[None] * 3 for _ in range(3)]
+
+    for index in range(9):
+        row, col = divmod(transform_cell_index(index, transform), 3)
+        transformed[row][col] = state[index // 3][index % 3]
+
+    return transformed
+
+
+class TestSymmetryCanonicalize(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state: List[List[CellValue]] = [
+            ["X", "O", None],
+            [None, "X", None],
+            [None, None, None],
+        ]
+
+    def test_all_symmetries_share_one_canonical_key(self) -> None:
+        keys = {
+            Board(starting_state=_transform_board_state(self.state, t)).canonicalize()[
+                0
+            ]
+            for t in range(len(SYMMETRY_PERMUTATIONS))
+        }
+
+        self.assertEqual(len(keys), 1)
+
+    def test_transform_maps_board_onto_canonical_key(self) -> None:
+        board: Board = Board(starting_state=self.state)
+        x_bits, o_bits = board.get_bitboards()
+
+        (canonical_x_bits, canonical_o_bits), transform = board.canonicalize()
+
+        self.assertEqual(transform_bits(x_bits, transform), canonical_x_bits)
+        self.assertEqual(transform_bits(o_bits, transform), canonical_o_bits)
+
+    def test_canonical_key_is_fixed_point(self) -> None:
+        key, _ = canonicalize(*Board(starting_state=self.state).get_bitboards())
+
+        self.assertEqual(canonicalize(*key), (key, 0))
+
+
+class TestSymmetryCellIndices(unittest.TestCase):
+    def test_untransform_inverts_transform(self) -> None:
+        for transform in range(len(SYMMETRY_PERMUTATIONS)):
+            for index in range(9):
+                self.assertEqual(
+                    untransform_cell_index(
+                        transform_cell_index(index, transform), transform
+                    ),
+                    index,
+                )
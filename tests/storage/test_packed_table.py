@@ -0,0 +1,83 @@
+"""Test suite for packed solution table files."""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from src.storage.packed_table import (
+    PACKED_TABLE_HEADER,
+    PackedTableInfo,
+    packed_size,
+    read_packed_table,
+    write_packed_table,
+)
+
+from src.storage.tablebase import TablebaseError
+
+INFO: PackedTableInfo = PackedTableInfo(3, 3, 3, True)
+
+
+class TestPackedTableFile(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path: Path = Path(directory.name) / "3x3.ttp"
+        self.entries: bytes = bytes(range(256)) * (INFO.size // 256) + bytes(
+            INFO.size % 256
+        )
+
+    def test_size_holds_four_entries_per_byte(self) -> None:
+        self.assertEqual(INFO.entry_count, 19683)
+        self.assertEqual(INFO.size, 4921)
+        self.assertEqual(PackedTableInfo(4, 4, 4, False).size, 10761681)
+        self.assertEqual(packed_size(4), 1)
+
+    def test_round_trip(self) -> None:
+        write_packed_table(self.path, INFO, self.entries)
+
+        self.assertEqual(read_packed_table(self.path), (INFO, self.entries))
+
+    def test_incomplete_flag_round_trips(self) -> None:
+        checkpoint: PackedTableInfo = INFO._replace(complete=False)
+        write_packed_table(self.path, checkpoint, self.entries)
+
+        info, _ = read_packed_table(self.path)
+        self.assertFalse(info.complete)
+
+    def test_write_rejects_wrong_size(self) -> None:
+        with self.assertRaises(ValueError):
+            write_packed_table(self.path, INFO, b"\x00")
+
+    def test_write_replaces_the_old_table(self) -> None:
+        write_packed_table(self.path, INFO, self.entries)
+        write_packed_table(self.path, INFO, bytes(INFO.size))
+
+        self.assertEqual(read_packed_table(self.path)[1], bytes(INFO.size))
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_read_rejects_other_files(self) -> None:
+        self.path.write_bytes(b"not a packed table at all")
+
+        with self.assertRaises(TablebaseError):
+            read_packed_table(self.path)
+
+    def test_read_rejects_truncated_file(self) -> None:
+        write_packed_table(self.path, INFO, self.entries)
+        self.path.write_bytes(self.path.read_bytes()[:-1])
+
+        with self.assertRaises(TablebaseError):
+            read_packed_table(self.path)
+
+    def test_read_rejects_corrupt_entries(self) -> None:
+        write_packed_table(self.path, INFO, self.entries)
+        data: bytearray = bytearray(self.path.read_bytes())
+        data[PACKED_TABLE_HEADER.size] ^= 0xFF
+        self.path.write_bytes(data)
+
+        with self.assertRaises(TablebaseError):
+            read_packed_table(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
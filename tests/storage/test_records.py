@@ -0,0 +1,118 @@
+"""Test suite for the binary game record format."""
+
+import io
+import tempfile
+import unittest
+
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from constants.constants import Cell, PlayerMarker
+
+from src.game_loop import loop_game
+
+from src.models.board import Board, GameStatus
+
+from src.storage.records import (
+    FILE_HEADER,
+    GameRecord,
+    RecordFormatError,
+    RecordWriter,
+    decode_game,
+    encode_game,
+    read_games,
+    split_records,
+)
+
+DRAWN_GAME: GameRecord = GameRecord((4, 0, 8, 2, 1, 7, 6, 3, 5), GameStatus.DRAW)
+X_WIN_GAME: GameRecord = GameRecord((0, 3, 1, 4, 2), GameStatus.X_WON)
+
+
+class TestGameRecordEncoding(unittest.TestCase):
+    def test_nine_move_game_takes_six_bytes(self) -> None:
+        self.assertEqual(len(encode_game(DRAWN_GAME)), 6)
+
+    def test_encoding_round_trips(self) -> None:
+        for record in [DRAWN_GAME, X_WIN_GAME, GameRecord((), GameStatus.ONGOING)]:
+            encoded: bytes = encode_game(record)
+
+            self.assertEqual(decode_game(encoded, 0), (record, len(encoded)))
+
+    def test_encode_rejects_invalid_cell_index(self) -> None:
+        with self.assertRaises(ValueError):
+            encode_game(GameRecord((9,), GameStatus.ONGOING))
+
+    def test_decode_rejects_truncated_record(self) -> None:
+        with self.assertRaises(RecordFormatError):
+            decode_game(encode_game(DRAWN_GAME)[:-1], 0)
+
+    def test_replay_reproduces_final_position(self) -> None:
+        board: Board = X_WIN_GAME.replay()
+
+        self.assertEqual(board.get_status(), GameStatus.X_WON)
+        self.assertEqual(board.get_bitboards(), (0b000_000_111, 0b000_011_000))
+
+
+class TestRecordFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory[str] = tempfile.TemporaryDirectory()
+        self.path: Path = Path(self.directory.name) / "games.ttt"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_writers_append_to_the_same_file(self) -> None:
+        with RecordWriter(self.path) as writer:
+            writer.write(DRAWN_GAME)
+        with RecordWriter(self.path) as writer:
+            writer.write(X_WIN_GAME)
+
+        self.assertEqual(list(read_games(self.path)), [DRAWN_GAME, X_WIN_GAME])
+        self.assertEqual(self.path.stat().st_size, len(FILE_HEADER) + 6 + 4)
+
+    def test_games_are_read_lazily(self) -> None:
+        with RecordWriter(self.path) as writer:
+            writer.write(DRAWN_GAME)
+            writer.write(X_WIN_GAME)
+
+        games: Iterator[GameRecord] = read_games(self.path)
+
+        self.assertEqual(next(games), DRAWN_GAME)
+        self.assertEqual(next(games), X_WIN_GAME)
+        with self.assertRaises(StopIteration):
+            next(games)
+
+    def test_split_ranges_cover_whole_records(self) -> None:
+        with RecordWriter(self.path) as writer:
+            for _ in range(10):
+                writer.write(DRAWN_GAME)
+                writer.write(X_WIN_GAME)
+
+        ranges: List[Tuple[int, int]] = list(split_records(self.path, 16))
+        games: List[GameRecord] = [
+            game for start, end in ranges for game in read_games(self.path, start, end)
+        ]
+
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(games, [DRAWN_GAME, X_WIN_GAME] * 10)
+
+    def test_other_files_are_rejected(self) -> None:
+        self.path.write_bytes(b'{"not": "records"}')
+
+        with self.assertRaises(RecordFormatError):
+            RecordWriter(self.path)
+        with self.assertRaises(RecordFormatError):
+            list(read_games(self.path))
+
+    def test_loop_game_records_each_game(self) -> None:
+        moves: List[Cell] = [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]
+
+        def scripted_player(player_marker: PlayerMarker, board: Board) -> None:
+            board.make_move(moves[board.get_move_count()], player_marker)
+
+        with RecordWriter(self.path) as writer, redirect_stdout(io.StringIO()):
+            loop_game(Board(), {"X": scripted_player, "O": scripted_player}, [writer])
+            loop_game(Board(), {"X": scripted_player, "O": scripted_player}, [writer])
+
+        self.assertEqual(list(read_games(self.path)), [X_WIN_GAME, X_WIN_GAME])
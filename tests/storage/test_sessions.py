@@ -0,0 +1,172 @@
+"""Test suite for durable game sessions."""
+
+import io
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List
+
+from constants.constants import Cell, PlayerMarker
+
+from src.game_loop import loop_game
+
+from src.models.board import Board, GameStatus
+
+from src.players import Player
+
+from src.storage.sessions import GameSession, SessionNotFoundError, SessionStore
+
+
+def _scripted_player(cells: List[Cell]) -> Player:
+    def play(player_marker: PlayerMarker, board: Board) -> None:
+        board.make_move(cells.pop(0), player_marker)
+
+    return play
+
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path: Path = Path(directory.name) / "sessions.db"
+
+    def test_database_is_in_wal_mode(self) -> None:
+        with SessionStore(self.path):
+            pass
+
+        connection = sqlite3.connect(self.path)
+        (mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+        connection.close()
+
+        self.assertEqual(mode, "wal")
+
+    def test_game_is_rebuilt_from_its_move_log(self) -> None:
+        board: Board = Board()
+
+        with SessionStore(self.path) as store:
+            session: GameSession = store.open_session(board)
+            for cell in [(1, 1), (0, 0), (2, 2)]:
+                player_marker: PlayerMarker = board.get_player_to_move()
+                board.push(cell)
+                session.on_move(board, cell, player_marker)
+
+        with SessionStore(self.path) as store:
+            resumed: Board = store.load_game(session.get_id())
+
+        self.assertEqual(resumed.get_bitboards(), board.get_bitboards())
+        self.assertEqual(resumed.get_history(), ((1, 1), (0, 0), (2, 2)))
+        self.assertEqual(resumed.get_player_to_move(), "O")
+
+    def test_ids_continue_after_reopening(self) -> None:
+        with SessionStore(self.path) as store:
+            first: int = store.create_game(Board())
+
+        with SessionStore(self.path) as store:
+            self.assertEqual(store.create_game(Board()), first + 1)
+
+    def test_moves_from_many_games_are_committed_in_batches(self) -> None:
+        with SessionStore(self.path, batch_size=64) as store:
+
+            def play(game_id: int) -> None:
+                for ply in range(1, 10):
+                    store.record_move(game_id, ply, ply - 1, "X" if ply % 2 else "O")
+
+            game_ids: List[int] = [store.create_game(Board()) for _ in range(50)]
+            threads = [threading.Thread(target=play, args=(i,)) for i in game_ids]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            store.flush()
+
+            batches, writes = store.get_stats()
+
+        self.assertEqual(writes, 50 + 50 * 9)
+        self.assertLess(batches, writes)
+        self.assertGreaterEqual(batches, writes // 64)
+
+    def test_failed_write_is_reported_to_its_game_only(self) -> None:
+        with SessionStore(self.path) as store:
+            game_ids: List[int] = [store.create_game(Board()) for _ in range(3)]
+            store.flush()
+
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            f"""
+            CREATE TRIGGER reject_move BEFORE INSERT ON moves
+            WHEN NEW.game_id = {game_ids[1]}
+            BEGIN SELECT RAISE(ABORT, 'injected failure'); END
+            """
+        )
+        connection.commit()
+        connection.close()
+
+        with SessionStore(self.path) as store:
+            for game_id in game_ids:
+                store.record_move(game_id, 1, 4, "X")
+            store.flush(game_ids[0])
+
+            with self.assertRaises(sqlite3.Error):
+                store.record_move(game_ids[1], 2, 0, "O")
+
+            for game_id in (game_ids[0], game_ids[2]):
+                store.record_move(game_id, 2, 0, "O")
+                self.assertEqual(
+                    store.load_game(game_id).get_history(), ((1, 1), (0, 0))
+                )
+
+    def test_loop_game_resumes_where_it_stopped(self) -> None:
+        with SessionStore(self.path) as store:
+            board: Board = Board()
+            session: GameSession = store.open_session(board)
+            players: Dict[PlayerMarker, Player] = {
+                "X": _scripted_player([(1, 1), (0, 2)]),
+                "O": _scripted_player([(0, 0)]),
+            }
+
+            with redirect_stdout(io.StringIO()):
+                with self.assertRaises(IndexError):
+                    loop_game(board, players, [session])
+
+            resumed: Board = store.load_game(session.get_id())
+            self.assertEqual(resumed.get_history(), ((1, 1), (0, 0), (0, 2)))
+
+            players = {
+                "X": _scripted_player([(2, 0)]),
+                "O": _scripted_player([(1, 0)]),
+            }
+            with redirect_stdout(io.StringIO()):
+                loop_game(
+                    resumed, players, [store.open_session(resumed, session.get_id())]
+                )
+
+            self.assertIs(resumed.get_status(), GameStatus.X_WON)
+            self.assertEqual(
+                store.load_game(session.get_id()).get_bitboards(),
+                resumed.get_bitboards(),
+            )
+
+    def test_missing_game_is_not_found(self) -> None:
+        with SessionStore(self.path) as store:
+            with self.assertRaises(SessionNotFoundError):
+                store.load_game(42)
+
+    def test_illegal_move_log_is_rejected(self) -> None:
+        with SessionStore(self.path) as store:
+            game_id: int = store.create_game(Board())
+            store.record_move(game_id, 1, 4, "X")
+            store.record_move(game_id, 2, 4, "O")
+
+            with self.assertRaises(SessionNotFoundError):
+                store.load_game(game_id)
+
+    def test_closed_store_rejects_writes(self) -> None:
+        store: SessionStore = SessionStore(self.path)
+        store.close()
+
+        with self.assertRaises(RuntimeError):
+            store.create_game(Board())
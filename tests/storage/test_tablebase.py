@@ -0,0 +1,122 @@
+"""Test suite for memory-mapped tablebase files."""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from src.ai import solver
+
+from src.models.board import Board
+
+from src.storage.tablebase import (
+    ENTRY_COUNT,
+    NO_MOVE,
+    TABLEBASE_HEADER,
+    Tablebase,
+    TablebaseError,
+    base3_index,
+    decode_entry,
+    encode_entry,
+    write_tablebase,
+)
+
+
+class TestTablebaseEntries(unittest.TestCase):
+    def test_base3_index_of_blank_board_is_zero(self) -> None:
+        self.assertEqual(base3_index(0, 0), 0)
+
+    def test_base3_index_weights_o_twice(self) -> None:
+        self.assertEqual(base3_index(0b1, 0b10), 1 + 2 * 3)
+
+    def test_entry_round_trips(self) -> None:
+        for value in [-1, 0, 1]:
+            for move in [0, 8, NO_MOVE]:
+                self.assertEqual(decode_entry(encode_entry(value, move)), (value, move))
+
+    def test_zero_entry_is_unreachable(self) -> None:
+        self.assertIsNone(decode_entry(0))
+
+
+class TestTablebaseFile(unittest.TestCase):
+    entries: bytes
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.entries = solver.build_tablebase_entries()
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path: Path = Path(directory.name) / "solver.ttb"
+        write_tablebase(self.path, self.entries)
+
+    def test_write_rejects_wrong_entry_count(self) -> None:
+        with self.assertRaises(ValueError):
+            write_tablebase(self.path, b"\x00")
+
+    def test_lookup_matches_solver(self) -> None:
+        board = Board()
+        board.make_move((1, 1), "X")
+        value, best_moves = solver.solve_position(board)
+
+        with Tablebase(self.path) as tablebase:
+            entry = tablebase.lookup(*board.get_bitboards())
+
+        assert entry is not None
+        self.assertEqual(entry[0], value)
+        self.assertIn(entry[1], best_moves)
+
+    def test_unreachable_position_is_missing(self) -> None:
+        with Tablebase(self.path) as tablebase:
+            self.assertIsNone(tablebase.lookup(0b111, 0))
+
+    def test_verify_accepts_built_file(self) -> None:
+        with Tablebase(self.path) as tablebase:
+            self.assertEqual(solver.verify_tablebase(tablebase), [])
+
+    def test_verify_reports_wrong_entry(self) -> None:
+        entries = bytearray(self.entries)
+        entries[0] = encode_entry(1, 4)
+        write_tablebase(self.path, bytes(entries))
+
+        with Tablebase(self.path) as tablebase:
+            self.assertEqual(solver.verify_tablebase(tablebase), [0])
+
+    def test_corrupted_file_fails_checksum(self) -> None:
+        data = bytearray(self.path.read_bytes())
+        data[TABLEBASE_HEADER.size] ^= 0xFF
+        self.path.write_bytes(bytes(data))
+
+        with self.assertRaisesRegex(TablebaseError, "checksum"):
+            Tablebase(self.path)
+
+    def test_bad_magic_is_rejected(self) -> None:
+        data = bytearray(self.path.read_bytes())
+        data[:4] = b"NOPE"
+        self.path.write_bytes(bytes(data))
+
+        with self.assertRaisesRegex(TablebaseError, "not a tablebase"):
+            Tablebase(self.path)
+
+    def test_truncated_file_is_rejected(self) -> None:
+        self.path.write_bytes(self.path.read_bytes()[: ENTRY_COUNT // 2])
+
+        with self.assertRaises(TablebaseError):
+            Tablebase(self.path)
+
+    def test_solver_answers_from_tablebase(self) -> None:
+        solver.use_tablebase(self.path)
+        self.addCleanup(solver.use_tablebase, None)
+
+        board = Board()
+        value, best_moves = solver.solve_position(board)
+
+        self.assertEqual(value, solver.DRAW)
+        self.assertEqual(len(best_moves), 1)
+        self.assertIsNotNone(solver.choose_move(board))
+
+        board.make_move((0, 0), "X")
+        board.make_move((0, 1), "X")
+        with self.assertRaises(solver.UnsolvedPositionError):
+            solver.solve_position(board)
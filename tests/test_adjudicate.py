@@ -0,0 +1,57 @@
+"""Test suite for batch adjudication."""
+
+import io
+import unittest
+
+from src.adjudicate import Adjudicator
+
+
+class TestAdjudicator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.adjudicator: Adjudicator = Adjudicator()
+
+    def test_wins_draws_and_unfinished_games(self) -> None:
+        self.assertEqual(self.adjudicator.adjudicate(b"1 4 2 5 3".split()), b"X wins")
+        self.assertEqual(self.adjudicator.adjudicate(b"1 4 2 5 9 6".split()), b"O wins")
+        self.assertEqual(
+            self.adjudicator.adjudicate(b"5 1 9 3 2 8 4 6 7".split()), b"draw"
+        )
+        self.assertEqual(
+            self.adjudicator.adjudicate(b"7 5 3 1 9".split()), b"unfinished"
+        )
+        self.assertEqual(self.adjudicator.adjudicate([]), b"unfinished")
+
+    def test_illegal_moves_report_their_ply(self) -> None:
+        self.assertEqual(
+            self.adjudicator.adjudicate(b"5 5".split()), b"illegal move at ply 2"
+        )
+        self.assertEqual(
+            self.adjudicator.adjudicate(b"1 0".split()), b"illegal move at ply 2"
+        )
+        self.assertEqual(
+            self.adjudicator.adjudicate(b"x".split()), b"illegal move at ply 1"
+        )
+
+    def test_moves_after_a_win_are_illegal(self) -> None:
+        self.assertEqual(
+            self.adjudicator.adjudicate(b"1 4 2 5 3 6".split()),
+            b"illegal move at ply 6",
+        )
+
+    def test_other_board_sizes_use_their_cell_keys(self) -> None:
+        adjudicator: Adjudicator = Adjudicator(width=4, height=4, win_length=4)
+
+        self.assertEqual(adjudicator.adjudicate(b"1 5 2 6 3 7 4".split()), b"X wins")
+        self.assertEqual(
+            adjudicator.adjudicate(b"17".split()), b"illegal move at ply 1"
+        )
+
+    def test_run_writes_one_line_per_game(self) -> None:
+        output: io.BytesIO = io.BytesIO()
+
+        count: int = self.adjudicator.run([b"1 4 2 5 3\n", b"5 5\n", b"\n"], output)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            output.getvalue(), b"X wins\nillegal move at ply 2\nunfinished\n"
+        )
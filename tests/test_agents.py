@@ -0,0 +1,83 @@
+"""Test suite for the computer agents."""
+
+import tempfile
+import unittest
+
+from pathlib import Path
+from typing import List
+
+from constants.constants import Cell
+
+from src.agents import (
+    AGENT_TYPES,
+    RandomAgent,
+    ScriptedAgent,
+    SolverAgent,
+    StrongSolverAgent,
+    play_game,
+)
+
+from src.ai.strong_solver import SolvedTable, solve_table
+
+from src.models.board import Board, GameStatus
+
+
+class TestAgents(unittest.TestCase):
+    def test_random_agent_plays_legal_moves(self) -> None:
+        board: Board = Board()
+        board.push((1, 1))
+        agent: RandomAgent = RandomAgent(seed=0)
+
+        for _ in range(20):
+            row, col = agent.choose_move(board)
+            self.assertIsNone(board.get_cell((row, col)))
+
+    def test_scripted_agent_prefers_center_then_corners(self) -> None:
+        board: Board = Board()
+        agent: ScriptedAgent = ScriptedAgent()
+        moves: List[Cell] = []
+
+        for _ in range(5):
+            cell: Cell = agent.choose_move(board)
+            moves.append(cell)
+            board.push(cell)
+
+        self.assertEqual(moves[0], (1, 1))
+        self.assertEqual(set(moves[1:]), {(0, 0), (0, 2), (2, 0), (2, 2)})
+
+    def test_scripted_agent_follows_its_order(self) -> None:
+        board: Board = Board()
+        board.push((2, 2))
+
+        self.assertEqual(ScriptedAgent([(2, 2), (0, 1)]).choose_move(board), (0, 1))
+
+    def test_solver_never_loses_to_random(self) -> None:
+        for seed in range(10):
+            self.assertIsNot(
+                play_game(Board(), RandomAgent(seed), SolverAgent()),
+                GameStatus.X_WON,
+            )
+
+    def test_strong_solver_never_loses_to_random(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            solve_table(Path(directory) / "4x3.ttp", 4, 3, 3)
+            agent: StrongSolverAgent = StrongSolverAgent(
+                SolvedTable(Path(directory) / "4x3.ttp")
+            )
+
+        for seed in range(10):
+            board: Board = Board(width=4, height=3, win_length=3)
+            self.assertIs(play_game(board, agent, RandomAgent(seed)), GameStatus.X_WON)
+
+    def test_play_game_leaves_a_finished_board(self) -> None:
+        board: Board = Board(width=4, height=4, win_length=3)
+
+        status: GameStatus = play_game(board, RandomAgent(1), ScriptedAgent())
+
+        self.assertIsNot(status, GameStatus.ONGOING)
+        self.assertIs(board.get_status(), status)
+
+    def test_agent_types_create_agents(self) -> None:
+        for create_agent in AGENT_TYPES.values():
+            board: Board = Board()
+            self.assertIsNone(board.get_cell(create_agent(0.01, 0).choose_move(board)))
@@ -0,0 +1,107 @@
+"""Test suite for opt-in instrumentation."""
+
+import io
+import unittest
+
+from contextlib import redirect_stdout
+from typing import Any, Dict
+from unittest import mock
+
+from src import game_loop, instrumentation
+
+from src.models.board import Board
+
+from src.players import PLAYER_TYPES
+
+from src.ui import prompts
+
+from src.ui.renderer import TerminalRenderer
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self) -> None:
+        instrumentation.reset()
+
+    def tearDown(self) -> None:
+        instrumentation.uninstall()
+
+    def test_nothing_is_wrapped_until_installed(self) -> None:
+        make_move = Board.make_move
+
+        instrumentation.install()
+        self.assertIsNot(Board.make_move, make_move)
+
+        instrumentation.uninstall()
+        self.assertIs(Board.make_move, make_move)
+        self.assertFalse(hasattr(prompts, "input"))
+        self.assertIs(vars(game_loop)["prompt"], prompts.prompt)
+
+    def test_board_calls_are_counted(self) -> None:
+        instrumentation.install()
+
+        board: Board = Board()
+        board.make_move((0, 0), "X")
+        board.make_move((1, 1), "O")
+        board.check_win()
+
+        histograms: Dict[str, Dict[str, Any]] = instrumentation.snapshot()
+        self.assertEqual(histograms["board.make_move"]["count"], 2)
+        self.assertEqual(histograms["board.check_win"]["count"], 1)
+        self.assertEqual(histograms["board.make_move"]["buckets"]["+Inf"], 2)
+
+    def test_every_frame_is_timed(self) -> None:
+        instrumentation.install()
+
+        board: Board = Board()
+        renderer: TerminalRenderer = TerminalRenderer(io.StringIO(), interactive=True)
+        renderer.draw(board, "first")
+        board.make_move((0, 0), "X")
+        renderer.draw(board, "redrawn in place")
+
+        self.assertEqual(instrumentation.snapshot()["render.draw"]["count"], 2)
+
+    def test_turns_and_input_wait_are_timed(self) -> None:
+        moves = iter(["5", "1", "9", "3", "2", "8", "4", "6", "7"])
+
+        with (
+            mock.patch("builtins.input", lambda *_: next(moves)),
+            redirect_stdout(io.StringIO()),
+        ):
+            instrumentation.install()
+            game_loop.loop_game(Board())
+
+        histograms: Dict[str, Dict[str, Any]] = instrumentation.snapshot()
+        self.assertEqual(histograms["turn.human"]["count"], 9)
+        self.assertEqual(histograms["prompt.input"]["count"], 9)
+
+    def test_result_checks_are_timed_during_a_game(self) -> None:
+        moves = iter(["5", "1", "9", "3", "2", "8", "4", "6", "7"])
+
+        with (
+            mock.patch("builtins.input", lambda *_: next(moves)),
+            redirect_stdout(io.StringIO()),
+        ):
+            instrumentation.install()
+            game_loop.loop_game(Board())
+
+        histograms: Dict[str, Dict[str, Any]] = instrumentation.snapshot()
+        self.assertEqual(histograms["board.update_status"]["count"], 9)
+        self.assertGreaterEqual(histograms["board.get_status"]["count"], 10)
+
+    def test_player_types_are_wrapped_and_restored(self) -> None:
+        solver = PLAYER_TYPES["solver"]
+
+        instrumentation.install()
+        self.assertIsNot(PLAYER_TYPES["solver"], solver)
+
+        instrumentation.uninstall()
+        self.assertIs(PLAYER_TYPES["solver"], solver)
+
+    def test_prometheus_format(self) -> None:
+        instrumentation.timed("example.call", lambda: None)()
+
+        text: str = instrumentation.format_prometheus()
+
+        self.assertIn("# TYPE tictactoe_example_call_seconds histogram", text)
+        self.assertIn('tictactoe_example_call_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("tictactoe_example_call_seconds_count 1", text)
@@ -0,0 +1,125 @@
+"""Test suite for the asyncio multi-game server."""
+
+import asyncio
+import unittest
+
+from typing import List, Tuple
+
+from src.server import serve
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server: asyncio.Server = await serve("127.0.0.1", 0, move_timeout=5.0)
+        self.port: int = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection("127.0.0.1", self.port)
+
+    async def _read_until(self, reader: asyncio.StreamReader, text: str) -> List[str]:
+        lines: List[str] = []
+        while True:
+            line: str = (await asyncio.wait_for(reader.readline(), 5.0)).decode()
+            lines.append(line)
+            if text in line or not line:
+                return lines
+
+    async def _move(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        cell_key: str,
+    ) -> None:
+        await self._read_until(reader, "→")
+        writer.write(f"{cell_key}\n".encode())
+        await writer.drain()
+
+    async def test_paired_clients_play_a_game_to_a_win(self) -> None:
+        x_reader, x_writer = await self._connect()
+        await self._read_until(x_reader, "Waiting for an opponent")
+        o_reader, o_writer = await self._connect()
+
+        for cell_key, reader, writer in (
+            ("7", x_reader, x_writer),
+            ("4", o_reader, o_writer),
+            ("8", x_reader, x_writer),
+            ("5", o_reader, o_writer),
+            ("9", x_reader, x_writer),
+        ):
+            await self._move(reader, writer, cell_key)
+
+        self.assertIn("X wins!", "".join(await self._read_until(x_reader, "wins!")))
+        self.assertIn("X wins!", "".join(await self._read_until(o_reader, "wins!")))
+
+        for writer in (x_writer, o_writer):
+            writer.close()
+
+    async def test_invalid_moves_are_rejected(self) -> None:
+        x_reader, x_writer = await self._connect()
+        await self._read_until(x_reader, "Waiting for an opponent")
+        o_reader, o_writer = await self._connect()
+
+        await self._move(x_reader, x_writer, "0")
+        self.assertIn("Try again", "".join(await self._read_until(x_reader, "Try")))
+
+        await self._move(x_reader, x_writer, "5")
+        await self._move(o_reader, o_writer, "5")
+        self.assertIn("Try again", "".join(await self._read_until(o_reader, "Try")))
+
+        for writer in (x_writer, o_writer):
+            writer.close()
+
+    async def test_input_out_of_turn_is_not_replayed(self) -> None:
+        x_reader, x_writer = await self._connect()
+        await self._read_until(x_reader, "Waiting for an opponent")
+        x_writer.write(b"5\n")
+        await x_writer.drain()
+        self.assertIn(
+            "Not your turn", "".join(await self._read_until(x_reader, "turn"))
+        )
+
+        o_reader, o_writer = await self._connect()
+        await self._move(x_reader, x_writer, "1")
+        await self._move(o_reader, o_writer, "5")
+
+        line: str = ""
+        while "Waiting for" not in line:
+            line = (await asyncio.wait_for(o_reader.readline(), 5.0)).decode()
+            self.assertNotIn("Try again", line)
+
+        for writer in (x_writer, o_writer):
+            writer.close()
+
+    async def test_waiting_client_that_left_is_not_paired(self) -> None:
+        x_reader, x_writer = await self._connect()
+        await self._read_until(x_reader, "Waiting for an opponent")
+        x_writer.write(b"5")
+        x_writer.write_eof()
+        await asyncio.sleep(0.1)
+
+        o_reader, o_writer = await self._connect()
+        self.assertIn(
+            "Waiting for an opponent",
+            "".join(await self._read_until(o_reader, "Waiting for")),
+        )
+
+        for writer in (x_writer, o_writer):
+            writer.close()
+
+    async def test_opponent_disconnect_ends_game(self) -> None:
+        x_reader, x_writer = await self._connect()
+        await self._read_until(x_reader, "Waiting for an opponent")
+        o_reader, o_writer = await self._connect()
+
+        await self._read_until(x_reader, "→")
+        x_writer.close()
+
+        self.assertIn(
+            "Opponent left", "".join(await self._read_until(o_reader, "left"))
+        )
+
+        o_writer.close()
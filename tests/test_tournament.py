@@ -0,0 +1,124 @@
+"""Test suite for agent tournaments."""
+
+import io
+import tempfile
+import unittest
+
+from collections import Counter
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from src.tournament import (
+    BASE_RATING,
+    EloRating,
+    GameResult,
+    compute_elo,
+    read_results,
+    run_tournament,
+    swiss_pairs,
+)
+
+
+class TestRunTournament(unittest.TestCase):
+    def test_round_robin_swaps_colors_and_streams_results(self) -> None:
+        output: io.StringIO = io.StringIO()
+
+        results: List[GameResult] = run_tournament(
+            ["random", "scripted", "solver"],
+            output,
+            games_per_pairing=4,
+            workers=2,
+            chunk_size=3,
+        )
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(len(output.getvalue().splitlines()), 12)
+        self.assertEqual(sorted(result.game for result in results), list(range(12)))
+
+        as_x: Counter[Tuple[str, str]] = Counter(
+            (result.x, result.o) for result in results
+        )
+        self.assertEqual(set(as_x.values()), {2})
+
+        for result in results:
+            if result.o == "solver":
+                self.assertNotEqual(result.result, "x")
+
+    def test_swiss_plays_every_round(self) -> None:
+        results: List[GameResult] = run_tournament(
+            ["random", "scripted", "solver", "search"],
+            io.StringIO(),
+            tournament_format="swiss",
+            rounds=2,
+            move_time=0.01,
+            workers=2,
+        )
+
+        self.assertEqual(Counter(result.round for result in results), {1: 4, 2: 4})
+
+    def test_results_can_be_read_back(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path: Path = Path(directory) / "results.jsonl"
+
+            with open(path, "w", encoding="utf-8") as output:
+                results: List[GameResult] = run_tournament(
+                    ["random", "scripted"], output, workers=1
+                )
+
+            self.assertEqual(list(read_results(path)), results)
+
+    def test_rejects_invalid_tournaments(self) -> None:
+        for agents, games in [
+            (["random"], 2),
+            (["random", "random"], 2),
+            (["random", "nobody"], 2),
+            (["random", "scripted"], 3),
+        ]:
+            with self.assertRaises(ValueError):
+                run_tournament(agents, io.StringIO(), games_per_pairing=games)
+
+        with self.assertRaises(ValueError):
+            run_tournament(["random", "solver"], io.StringIO(), rules=(4, 4, 3))
+
+
+class TestSwissPairs(unittest.TestCase):
+    def test_pairs_by_score_avoiding_rematches(self) -> None:
+        played: Set[Tuple[str, str]] = {("a", "b"), ("b", "a")}
+
+        pairs = swiss_pairs(["a", "b", "c", "d"], {"a": 2, "b": 2, "c": 1}, played)
+
+        self.assertEqual(pairs, [("a", "c"), ("b", "d")])
+
+    def test_odd_agent_out_sits_out(self) -> None:
+        self.assertEqual(swiss_pairs(["a", "b", "c"], {}, set()), [("a", "b")])
+
+
+class TestComputeElo(unittest.TestCase):
+    def _results(self, x_wins: int, draws: int, o_wins: int) -> List[GameResult]:
+        outcomes: List[str] = ["x"] * x_wins + ["draw"] * draws + ["o"] * o_wins
+        return [
+            GameResult(game, 1, "a", "b", outcome, 5)
+            for game, outcome in enumerate(outcomes)
+        ]
+
+    def test_even_results_rate_equally(self) -> None:
+        ratings: List[EloRating] = compute_elo(self._results(5, 10, 5))
+
+        for rating in ratings:
+            self.assertAlmostEqual(rating.rating, BASE_RATING)
+            self.assertEqual(rating.games, 20)
+            self.assertEqual(rating.score, 10)
+
+    def test_75_percent_score_is_about_191_points(self) -> None:
+        ratings: List[EloRating] = compute_elo(self._results(74, 1, 24) + [])
+
+        self.assertEqual(ratings[0].agent, "a")
+        self.assertAlmostEqual(ratings[0].rating - ratings[1].rating, 191, delta=5)
+        self.assertAlmostEqual(ratings[0].rating + ratings[1].rating, 2 * BASE_RATING)
+
+    def test_clean_sweep_stays_finite_and_uncertain(self) -> None:
+        few: List[EloRating] = compute_elo(self._results(4, 0, 0))
+        many: List[EloRating] = compute_elo(self._results(400, 0, 0))
+
+        self.assertGreater(few[0].rating, few[1].rating)
+        self.assertGreater(few[0].error, many[0].error)
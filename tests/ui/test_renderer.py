@@ -0,0 +1,92 @@
+"""Test suite for the terminal renderer."""
+
+import io
+import unittest
+
+from src.models.board import Board
+
+from src.ui.renderer import RenderStats, TerminalRenderer
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: int = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+class TestTerminalRendererPlain(unittest.TestCase):
+    def test_non_terminal_streams_get_full_frames(self) -> None:
+        stream: _CountingStream = _CountingStream()
+        renderer: TerminalRenderer = TerminalRenderer(stream)
+        board: Board = Board()
+
+        renderer.draw(board, "   X → ")
+        board.make_move((1, 1), "X")
+        renderer.draw(board, "   O → ")
+
+        self.assertFalse(renderer.is_interactive())
+        self.assertEqual(stream.writes, 2)
+        self.assertEqual(
+            stream.getvalue(),
+            f"\n{Board().stringify_board()}\n\n   X → "
+            f"\n{board.stringify_board()}\n\n   O → ",
+        )
+
+
+class TestTerminalRendererInPlace(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stream: _CountingStream = _CountingStream()
+        self.renderer: TerminalRenderer = TerminalRenderer(
+            self.stream, interactive=True
+        )
+        self.board: Board = Board()
+        self.renderer.draw(self.board, "   X → ")
+        self.first_frame: str = self.stream.getvalue()
+
+    def _next_frame(self) -> str:
+        start: int = len(self.stream.getvalue())
+        self.renderer.note_line_feed()
+        self.renderer.draw(self.board, "   O → ")
+        return self.stream.getvalue()[start:]
+
+    def test_redraw_writes_only_changed_cells_and_status(self) -> None:
+        self.board.make_move((1, 1), "X")
+
+        frame: str = self._next_frame()
+
+        # From the line below the prompt, up to the middle row, then across to
+        # the middle cell; then back down to the status line.
+        self.assertEqual(
+            frame,
+            f"\033[6A\033[5G{self.board.stringify_cell((1, 1))}"
+            "\033[5B\033[1G\033[J   O → ",
+        )
+        self.assertEqual(self.stream.writes, 2)
+
+    def test_redraw_is_smaller_than_a_full_frame(self) -> None:
+        self.board.make_move((0, 0), "X")
+        self._next_frame()
+
+        stats: RenderStats = self.renderer.get_stats()
+        self.assertEqual(stats.frames, 2)
+        self.assertLess(stats.last_frame_bytes * 4, len(self.first_frame.encode()))
+        self.assertEqual(
+            stats.bytes_written,
+            len(self.stream.getvalue().encode()),
+        )
+
+    def test_reset_draws_a_full_frame(self) -> None:
+        self.renderer.reset()
+
+        self.assertEqual(
+            self._next_frame(), f"\n{self.board.stringify_board()}\n\n   O → "
+        )
+
+    def test_other_board_sizes_draw_a_full_frame(self) -> None:
+        self.board = Board(width=4, height=4, win_length=4)
+
+        self.assertTrue(self._next_frame().startswith("\n"))